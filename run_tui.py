@@ -17,7 +17,7 @@ from src.markets import fetch_active_markets
 from src.pricing import get_order_books
 from src.strategy.market_scorer import MarketScorer
 from src.tui.runner import run_with_tui
-from src.utils import setup_logging
+from src.utils import install_uvloop, setup_logging
 
 logger = setup_logging()
 
@@ -224,6 +224,9 @@ def main():
     print(f"   Position Limit: {args.position_limit}")
     print()
 
+    if install_uvloop():
+        logger.info("Using uvloop event loop")
+
     # Run
     try:
         asyncio.run(run_with_tui(
@@ -10,11 +10,15 @@ Strategies:
 3. SKEW_QUOTES: Near-arbitrage -> skew MM quotes to capture
 """
 
+import heapq
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Optional, List, Tuple, Callable
 from enum import Enum
 
+_ONE = Decimal("1.00")
+_BPS = 10000
+
 
 class ArbitrageType(Enum):
     NONE = "none"
@@ -23,7 +27,7 @@ class ArbitrageType(Enum):
     SKEW_QUOTES = "skew_quotes"  # Near-arbitrage, adjust quotes
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ArbitrageSignal:
     """Detected arbitrage opportunity."""
     type: ArbitrageType
@@ -76,6 +80,8 @@ class ArbitrageDetector:
     ):
         self.fee_rate = fee_rate
         self.min_profit_bps = min_profit_bps
+        # Round-trip fees (buy + sell = 2x fee), in whole bps
+        self._fee_cost_bps = int(fee_rate * 2 * _BPS)
         self._pairs: dict[str, TokenPair] = {}
         self._last_signals: dict[str, ArbitrageSignal] = {}
 
@@ -102,33 +108,35 @@ class ArbitrageDetector:
         """
         sum_price = yes_price + no_price
 
-        # Calculate deviation from fair value ($1.00)
-        deviation = sum_price - Decimal("1.00")
-        deviation_bps = int(abs(deviation) * 10000)
+        # Calculate deviation from fair value ($1.00); everything past
+        # this point is int arithmetic on whole bps
+        deviation = sum_price - _ONE
+        high = deviation > 0
+        low = deviation < 0
+        deviation_bps = abs(int(deviation * _BPS))
 
-        # Account for round-trip fees (buy + sell = 2x fee)
-        fee_cost_bps = int(self.fee_rate * 2 * 10000)
-        net_profit_bps = deviation_bps - fee_cost_bps
+        # Account for round-trip fees
+        net_profit_bps = deviation_bps - self._fee_cost_bps
 
         # Determine arbitrage type
-        if deviation > 0 and net_profit_bps >= self.min_profit_bps:
+        if high and net_profit_bps >= self.min_profit_bps:
             arb_type = ArbitrageType.SELL_BOTH
             action = f"SELL YES@{yes_price} + SELL NO@{no_price} = ${sum_price} profit"
             confidence = min(1.0, net_profit_bps / 100)
 
-        elif deviation < 0 and net_profit_bps >= self.min_profit_bps:
+        elif low and net_profit_bps >= self.min_profit_bps:
             arb_type = ArbitrageType.BUY_BOTH
             action = f"BUY YES@{yes_price} + BUY NO@{no_price} = ${sum_price} discount"
             confidence = min(1.0, net_profit_bps / 100)
 
-        elif abs(deviation_bps) >= self.SKEW_THRESHOLD_BPS:
+        elif deviation_bps >= self.SKEW_THRESHOLD_BPS:
             arb_type = ArbitrageType.SKEW_QUOTES
-            if deviation > 0:
+            if high:
                 action = "Prices high - skew asks lower to sell"
             else:
                 action = "Prices low - skew bids higher to buy"
             confidence = 0.5
-            net_profit_bps = abs(deviation_bps)  # Potential, not guaranteed
+            net_profit_bps = deviation_bps  # Potential, not guaranteed
 
         else:
             arb_type = ArbitrageType.NONE
@@ -148,31 +156,42 @@ class ArbitrageDetector:
             recommended_action=action,
         )
 
-    def scan_all(self, price_getter: Callable[[str], Optional[Decimal]]) -> List[ArbitrageSignal]:
+    def scan_all(
+        self,
+        price_getter: Callable[[str], Optional[Decimal]],
+        top_k: Optional[int] = None,
+    ) -> List[ArbitrageSignal]:
         """
         Scan all registered pairs for arbitrage.
 
         Args:
             price_getter: Callable(token_id) -> Optional[Decimal]
+            top_k: Return only the k most profitable signals (all if None)
 
         Returns:
             List of actionable signals, sorted by profit
         """
         signals = []
+        check_pair = self.check_pair
+        last_signals = self._last_signals
 
         for condition_id, pair in self._pairs.items():
             yes_price = price_getter(pair.yes_token_id)
+            if yes_price is None:
+                continue
             no_price = price_getter(pair.no_token_id)
-
-            if yes_price is None or no_price is None:
+            if no_price is None:
                 continue
 
-            signal = self.check_pair(yes_price, no_price, pair)
+            signal = check_pair(yes_price, no_price, pair)
             if signal.is_actionable:
                 signals.append(signal)
-                self._last_signals[condition_id] = signal
+                last_signals[condition_id] = signal
 
-        # Sort by profit descending
+        # Sort by profit descending; a partial heap select when only the
+        # best few are wanted
+        if top_k is not None:
+            return heapq.nlargest(top_k, signals, key=lambda s: s.profit_bps)
         signals.sort(key=lambda s: s.profit_bps, reverse=True)
         return signals
 
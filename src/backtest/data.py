@@ -6,10 +6,11 @@ Data structures for backtesting historical order book data.
 
 from dataclasses import dataclass
 from decimal import Decimal
+from operator import attrgetter
 from typing import List, Iterator
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderBookSnapshot:
     """A single order book snapshot."""
     timestamp: int
@@ -37,7 +38,7 @@ class HistoricalData:
 
     def __init__(self):
         self._snapshots: List[OrderBookSnapshot] = []
-        self._sorted = False
+        self._sorted = True  # Stays True while snapshots arrive in time order
 
     @property
     def snapshots(self) -> List[OrderBookSnapshot]:
@@ -46,13 +47,15 @@ class HistoricalData:
 
     def add_snapshot(self, snapshot: OrderBookSnapshot):
         """Add a snapshot to the data."""
-        self._snapshots.append(snapshot)
-        self._sorted = False
+        snapshots = self._snapshots
+        if snapshots and snapshot.timestamp < snapshots[-1].timestamp:
+            self._sorted = False
+        snapshots.append(snapshot)
 
     def iterate(self) -> Iterator[OrderBookSnapshot]:
         """Iterate snapshots in chronological order."""
         if not self._sorted:
-            self._snapshots.sort(key=lambda s: s.timestamp)
+            self._snapshots.sort(key=attrgetter("timestamp"))
             self._sorted = True
 
         return iter(self._snapshots)
@@ -43,6 +43,7 @@ DRY_RUN = os.getenv("DRY_RUN", "true").lower() == "true"
 MAX_POSITION_PER_MARKET = Decimal(os.getenv("MAX_POSITION_PER_MARKET", "100"))
 MAX_ORDER_SIZE = Decimal(os.getenv("MAX_ORDER_SIZE", "50"))
 MIN_ORDER_SIZE = Decimal(os.getenv("MIN_ORDER_SIZE", "5"))
+ORDER_POST_TIMEOUT = float(os.getenv("ORDER_POST_TIMEOUT", "0.75"))  # Seconds before giving up on a post
 
 # === Market Making ===
 MM_SPREAD = Decimal(os.getenv("MM_SPREAD", "0.04"))        # 4 cents each side
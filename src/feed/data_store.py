@@ -3,7 +3,7 @@ Local storage for market data.
 """
 
 import time
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass, field
 from src.models import OrderBook, PriceLevel
 
@@ -41,6 +41,7 @@ class DataStore:
         self._stale_threshold = stale_threshold
         self._sequence: Dict[str, int] = {}  # For gap detection
         self._gap_count: Dict[str, int] = {}
+        # Monotonic receive times; only ever used for elapsed checks
         self._last_any_message: float = 0.0
         self._last_ws_message: float = 0.0
 
@@ -77,6 +78,17 @@ class DataStore:
             return data.order_book.best_ask
         return None
 
+    def get_quote(self, token_id: str) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        """Get (best_bid, best_ask, midpoint) from a single book snapshot."""
+        data = self._data.get(token_id)
+        book = data.order_book if data else None
+        if book is None:
+            return None, None, None
+        bid = book.bids[0].price if book.bids else None
+        ask = book.asks[0].price if book.asks else None
+        mid = (bid + ask) / 2 if bid and ask else None
+        return bid, ask, mid
+
     # === Health Checks ===
 
     def is_fresh(self, token_id: str) -> bool:
@@ -147,19 +159,18 @@ class DataStore:
 
         data = self._data[token_id]
 
-        # Parse price levels
-        parsed_bids = [
-            PriceLevel(price=float(b['price']), size=float(b['size']))
-            for b in bids if isinstance(b, dict)
-        ]
-        parsed_asks = [
-            PriceLevel(price=float(a['price']), size=float(a['size']))
-            for a in asks if isinstance(a, dict)
-        ]
-
-        # Sort: bids descending, asks ascending
-        parsed_bids.sort(key=lambda x: x.price, reverse=True)
-        parsed_asks.sort(key=lambda x: x.price)
+        # Sort (price, size) tuples before building levels: tuple compares
+        # stay in C, a key=lambda sort calls back into Python per compare.
+        # Bids descending, asks ascending.
+        bid_levels = sorted(
+            [(float(b['price']), float(b['size'])) for b in bids if isinstance(b, dict)],
+            reverse=True
+        )
+        ask_levels = sorted(
+            [(float(a['price']), float(a['size'])) for a in asks if isinstance(a, dict)]
+        )
+        parsed_bids = [PriceLevel(price, size) for price, size in bid_levels]
+        parsed_asks = [PriceLevel(price, size) for price, size in ask_levels]
 
         data.order_book = OrderBook(
             token_id=token_id,
@@ -195,23 +206,23 @@ class DataStore:
 
     def record_message_received(self):
         """Record that any message was received (for heartbeat tracking)."""
-        self._last_any_message = time.time()
+        self._last_any_message = time.monotonic()
 
     def seconds_since_any_message(self) -> float:
         """Get seconds since any message was received."""
         if self._last_any_message == 0:
             return float('inf')
-        return time.time() - self._last_any_message
+        return time.monotonic() - self._last_any_message
 
     def record_ws_message(self):
         """Record WebSocket message received."""
-        self._last_ws_message = time.time()
+        self._last_ws_message = time.monotonic()
 
     def seconds_since_ws_message(self) -> float:
         """Seconds since last WebSocket message."""
         if self._last_ws_message == 0:
             return float('inf')
-        return time.time() - self._last_ws_message
+        return time.monotonic() - self._last_ws_message
 
     def clear(self):
         """Clear all data."""
@@ -4,10 +4,11 @@ MarketFeed - Simple interface for real-time market data.
 This is the main public interface. Use this, not the internal components.
 """
 
-import json
 import asyncio
 from enum import Enum, auto
-from typing import List, Optional, Callable, Dict, Any
+from typing import List, Optional, Callable, Dict, Any, Tuple, Union
+
+import orjson
 
 from src.models import OrderBook
 from src.feed.data_store import DataStore
@@ -95,6 +96,9 @@ class MarketFeed:
         # Connection lost callback (for safety - cancel orders on disconnect)
         self._connection_lost_callback: Optional[Callable[[], None]] = None
 
+        # Change hook: fired with no payload whenever market data updates
+        self._change_callback: Optional[Callable[[], None]] = None
+
         # Wire up internal callbacks
         self._ws.on_message = self._handle_ws_message
         self._ws.on_connect = self._handle_ws_connect
@@ -268,6 +272,10 @@ class MarketFeed:
         """Get best ask price."""
         return self._data_store.get_best_ask(token_id)
 
+    def get_quote(self, token_id: str) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        """Get (best_bid, best_ask, midpoint) in one lookup."""
+        return self._data_store.get_quote(token_id)
+
     # === Callbacks ===
 
     def register_flow_callback(self, token_id: str, callback: Callable):
@@ -295,7 +303,7 @@ class MarketFeed:
             if self.on_state_change:
                 self.on_state_change(new_state)
 
-    def _handle_ws_message(self, raw_message: str):
+    def _handle_ws_message(self, raw_message: Union[bytes, str]):
         """Handle raw WebSocket message."""
         try:
             # Queue for async processing (non-blocking)
@@ -345,6 +353,23 @@ class MarketFeed:
         """Register callback to fire when connection is lost (for order safety)."""
         self._connection_lost_callback = callback
 
+    def register_change_callback(self, callback: Callable[[], None]):
+        """
+        Register callback to fire, with no arguments, when market data updates.
+
+        Unlike the on_* attributes it gets no event payload, and setting it
+        leaves any user handlers in place.
+        """
+        self._change_callback = callback
+
+    def _notify_change(self):
+        """Fire the change hook, if one is registered."""
+        if self._change_callback:
+            try:
+                self._change_callback()
+            except Exception as e:
+                logger.error(f"Change callback error: {e}")
+
     async def _process_queue(self):
         """Process messages from queue (async worker)."""
         while True:
@@ -357,13 +382,13 @@ class MarketFeed:
             except Exception as e:
                 logger.error(f"Queue processing error: {e}")
 
-    async def _process_message(self, raw_message: str):
+    async def _process_message(self, raw_message: Union[bytes, str]):
         """Process a single message."""
         self._data_store.record_message_received()
 
         try:
-            data = json.loads(raw_message)
-        except json.JSONDecodeError:
+            data = orjson.loads(raw_message)
+        except orjson.JSONDecodeError:
             return
 
         # Handle list messages (server sometimes sends arrays)
@@ -390,6 +415,7 @@ class MarketFeed:
                         self._data_store.update_price(token_id, float(price))
                         if self._data_source == "websocket":
                             self._data_store.record_ws_message()
+                        self._notify_change()
                         await self._invoke_callback(self.on_price_change, change)
             return
 
@@ -415,6 +441,7 @@ class MarketFeed:
             )
             if self._data_source == "websocket":
                 self._data_store.record_ws_message()
+            self._notify_change()
             await self._invoke_callback(self.on_book_update, data)
 
         elif event_type == 'price_change':
@@ -423,6 +450,7 @@ class MarketFeed:
                 self._data_store.update_price(token_id, float(price))
                 if self._data_source == "websocket":
                     self._data_store.record_ws_message()
+                self._notify_change()
             await self._invoke_callback(self.on_price_change, data)
 
         elif event_type == 'last_trade_price':
@@ -438,6 +466,7 @@ class MarketFeed:
                 )
                 if self._data_source == "websocket":
                     self._data_store.record_ws_message()
+                self._notify_change()
 
                 # Notify flow analyzers
                 if token_id in self._flow_callbacks:
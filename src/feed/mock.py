@@ -4,7 +4,7 @@ Mock MarketFeed for testing without network access.
 
 import asyncio
 import time
-from typing import List, Optional, Callable, Dict, Any
+from typing import List, Optional, Callable, Dict, Any, Tuple
 from src.models import OrderBook, PriceLevel
 from src.feed.feed import FeedState
 
@@ -96,6 +96,12 @@ class MockMarketFeed:
         book = self._books.get(token_id)
         return book.best_ask if book else None
 
+    def get_quote(self, token_id: str) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        book = self._books.get(token_id)
+        if book is None:
+            return None, None, None
+        return book.best_bid, book.best_ask, book.midpoint
+
     # === Test Helpers ===
 
     def set_book(
@@ -4,10 +4,10 @@ WebSocket connection management.
 Internal component - use MarketFeed instead.
 """
 
-import json
 import asyncio
 import ssl
 import certifi
+import orjson
 from typing import Optional, List, Callable, Dict, Any
 import websockets
 from websockets.asyncio.client import ClientConnection
@@ -44,7 +44,7 @@ class WebSocketConnection:
         self._reconnect_count = 0
 
         # Callbacks
-        self.on_message: Optional[Callable[[str], None]] = None
+        self.on_message: Optional[Callable[[bytes], None]] = None
         self.on_connect: Optional[Callable[[], None]] = None
         self.on_disconnect: Optional[Callable[[], None]] = None
         self.on_error: Optional[Callable[[Exception], None]] = None
@@ -127,7 +127,7 @@ class WebSocketConnection:
         }
 
         try:
-            await self._ws.send(json.dumps(message))
+            await self._ws.send(orjson.dumps(message).decode())
             logger.info(f"Subscribed to {len(token_ids)} token(s)")
             return True
         except Exception as e:
@@ -142,11 +142,8 @@ class WebSocketConnection:
                     await asyncio.sleep(0.1)
                     continue
 
-                message = await self._ws.recv()
-
-                # Handle bytes or str
-                if isinstance(message, bytes):
-                    message = message.decode('utf-8')
+                # Raw bytes; MarketFeed parses them without a str decode
+                message = await self._ws.recv(decode=False)
 
                 if self.on_message:
                     self.on_message(message)
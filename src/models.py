@@ -9,14 +9,14 @@ from enum import Enum
 from decimal import Decimal
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceLevel:
     """Single price level in order book"""
     price: float
     size: float
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderBook:
     """Order book for a token"""
     token_id: str
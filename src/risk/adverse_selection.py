@@ -9,9 +9,10 @@ Toxicity = (adverse fills) / (total fills)
 An adverse fill is one where price moves against us shortly after.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Optional, List, Dict
+from typing import Optional, Deque, Dict, Tuple
 import time
 
 from src.config import (
@@ -27,12 +28,13 @@ from src.config import (
 class FillRecord:
     """Record of a fill for analysis."""
     fill_id: int
-    timestamp: float
+    timestamp: float  # time.monotonic()
     price: Decimal
     side: str
     size: Decimal
     price_after: Optional[Decimal] = None
     seconds_to_price_after: float = 0
+    was_adverse: bool = False  # Set with price_after
 
 
 @dataclass
@@ -83,9 +85,21 @@ class AdverseSelectionDetector:
 
     def __init__(self, lookback_window: float = ADVERSE_LOOKBACK_SECONDS):
         self.lookback_window = lookback_window  # 5 minutes default
-        self._fills: List[FillRecord] = []
+        # Oldest first; monotonic timestamps keep expiry a popleft loop
+        self._fills: Deque[FillRecord] = deque()
+        self._fills_by_id: Dict[int, FillRecord] = {}
         self._next_id = 0
 
+        # Running per-side counts over fills with an outcome, kept in step
+        # with record_price_after and expiry so toxicity is O(1)
+        self._judged: Dict[str, int] = {}
+        self._adverse: Dict[str, int] = {}
+
+        # Bumped by every recorder; get_response reuses its last answer
+        # until the fill set changes
+        self._version = 0
+        self._response: Optional[Tuple[int, AdverseSelectionResponse]] = None
+
     def record_fill(
         self,
         price: Decimal,
@@ -95,13 +109,15 @@ class AdverseSelectionDetector:
         """Record a new fill. Returns fill_id."""
         fill = FillRecord(
             fill_id=self._next_id,
-            timestamp=time.time(),
+            timestamp=time.monotonic(),
             price=price,
             side=side.upper(),
             size=size,
         )
         self._fills.append(fill)
+        self._fills_by_id[fill.fill_id] = fill
         self._next_id += 1
+        self._version += 1
 
         # Cleanup old fills
         self._cleanup_old_fills()
@@ -115,11 +131,16 @@ class AdverseSelectionDetector:
         seconds_after: float = 0,
     ):
         """Record price after a fill."""
-        for fill in self._fills:
-            if fill.fill_id == fill_id:
-                fill.price_after = price_after
-                fill.seconds_to_price_after = seconds_after or (time.time() - fill.timestamp)
-                break
+        fill = self._fills_by_id.get(fill_id)
+        if fill is not None:
+            if fill.price_after is not None:
+                self._count_outcome(fill, -1)
+            fill.price_after = price_after
+            fill.seconds_to_price_after = seconds_after or (time.monotonic() - fill.timestamp)
+            # Judge once here so toxicity never redoes Decimal math
+            fill.was_adverse = self._is_adverse(fill)
+            self._count_outcome(fill, 1)
+            self._version += 1
 
     def get_toxicity(self, side: Optional[str] = None) -> float:
         """
@@ -131,15 +152,30 @@ class AdverseSelectionDetector:
         Returns:
             Toxicity score 0.0-1.0
         """
-        fills = self._get_fills_with_outcome(side)
-        if not fills:
-            return 0.0
+        if side:
+            side = side.upper()
+            judged = self._judged.get(side, 0)
+            adverse = self._adverse.get(side, 0)
+        else:
+            judged = sum(self._judged.values())
+            adverse = sum(self._adverse.values())
 
-        adverse_count = sum(1 for f in fills if self._is_adverse(f))
-        return adverse_count / len(fills)
+        if not judged:
+            return 0.0
+        return adverse / judged
 
     def get_response(self) -> AdverseSelectionResponse:
         """Get recommended response based on toxicity."""
+        cached = self._response
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+
+        response = self._build_response()
+        self._response = (self._version, response)
+        return response
+
+    def _build_response(self) -> AdverseSelectionResponse:
+        """Compute the response for the current fill set."""
         toxicity = self.get_toxicity()
         buy_toxicity = self.get_toxicity("BUY")
         sell_toxicity = self.get_toxicity("SELL")
@@ -177,21 +213,16 @@ class AdverseSelectionDetector:
 
     def analyze_fill(self, fill_id: int) -> Optional[FillAnalysis]:
         """Analyze a specific fill."""
-        for fill in self._fills:
-            if fill.fill_id == fill_id:
-                if fill.price_after is None:
-                    return None
-
-                was_adverse = self._is_adverse(fill)
-                adverse_move = self._calculate_adverse_move(fill)
-
-                return FillAnalysis(
-                    fill_id=fill_id,
-                    was_adverse=was_adverse,
-                    adverse_move=adverse_move,
-                    seconds_to_adverse=fill.seconds_to_price_after,
-                )
-        return None
+        fill = self._fills_by_id.get(fill_id)
+        if fill is None or fill.price_after is None:
+            return None
+
+        return FillAnalysis(
+            fill_id=fill_id,
+            was_adverse=fill.was_adverse,
+            adverse_move=self._calculate_adverse_move(fill),
+            seconds_to_adverse=fill.seconds_to_price_after,
+        )
 
     def _is_adverse(self, fill: FillRecord) -> bool:
         """Check if fill was adverse."""
@@ -219,14 +250,17 @@ class AdverseSelectionDetector:
         else:
             return -move  # Positive move = adverse for seller
 
-    def _get_fills_with_outcome(self, side: Optional[str] = None) -> List[FillRecord]:
-        """Get fills that have outcome recorded."""
-        fills = [f for f in self._fills if f.price_after is not None]
-        if side:
-            fills = [f for f in fills if f.side == side.upper()]
-        return fills
+    def _count_outcome(self, fill: FillRecord, delta: int):
+        """Add (delta=1) or remove (delta=-1) a judged fill from the running counts."""
+        self._judged[fill.side] = self._judged.get(fill.side, 0) + delta
+        if fill.was_adverse:
+            self._adverse[fill.side] = self._adverse.get(fill.side, 0) + delta
 
     def _cleanup_old_fills(self):
         """Remove fills outside lookback window."""
-        cutoff = time.time() - self.lookback_window
-        self._fills = [f for f in self._fills if f.timestamp > cutoff]
+        cutoff = time.monotonic() - self.lookback_window
+        while self._fills and self._fills[0].timestamp <= cutoff:
+            fill = self._fills.popleft()
+            del self._fills_by_id[fill.fill_id]
+            if fill.price_after is not None:
+                self._count_outcome(fill, -1)
@@ -22,6 +22,8 @@ class OrderSimulator:
         self.orders: Dict[str, Order] = {}
         self.trades: List[Trade] = []
         self._positions: Dict[str, Decimal] = {}
+        self._entry_prices: Dict[str, Decimal] = {}
+        self._realized_pnl: Dict[str, Decimal] = {}
 
     def create_order(
         self,
@@ -74,15 +76,29 @@ class OrderSimulator:
             logger.debug(f"[SIM] Cancelled {cancelled} orders")
         return cancelled
 
-    def _update_position(self, token_id: str, side: OrderSide, size: Decimal):
-        """Update cached position after a fill."""
-        if token_id not in self._positions:
-            self._positions[token_id] = Decimal("0")
+    def _update_position(self, token_id: str, side: OrderSide, size: Decimal, price: Decimal):
+        """Update cached position, entry price and realized P&L after a fill."""
+        position = self._positions.get(token_id, Decimal("0"))
+        entry = self._entry_prices.get(token_id, Decimal("0"))
+        signed_size = size if side == OrderSide.BUY else -size
+        new_position = position + signed_size
 
-        if side == OrderSide.BUY:
-            self._positions[token_id] += size
+        if position == 0 or (position > 0) == (signed_size > 0):
+            # Opening or adding: average into entry
+            entry = (entry * abs(position) + price * size) / abs(new_position)
         else:
-            self._positions[token_id] -= size
+            # Reducing: realize P&L on the closed part
+            closed = min(size, abs(position))
+            pnl = (price - entry) * closed if position > 0 else (entry - price) * closed
+            self._realized_pnl[token_id] = self._realized_pnl.get(token_id, Decimal("0")) + pnl
+            if new_position == 0:
+                entry = Decimal("0")
+            elif (new_position > 0) != (position > 0):
+                # Flipped through flat
+                entry = price
+
+        self._positions[token_id] = new_position
+        self._entry_prices[token_id] = entry
 
     def check_fills(self, token_id: str, bid: Decimal, ask: Decimal) -> int:
         """
@@ -127,7 +143,7 @@ class OrderSimulator:
                     is_simulated=True
                 )
                 self.trades.append(trade)
-                self._update_position(token_id, order.side, order.size)
+                self._update_position(token_id, order.side, order.size, order.price)
 
                 # Update order
                 order.filled = order.size
@@ -164,11 +180,40 @@ class OrderSimulator:
         """Get net position for a token (cached)."""
         return self._positions.get(token_id, Decimal("0"))
 
+    def get_position_and_pnl(self, token_id: str, mid: Optional[Decimal] = None) -> Dict[str, Optional[Decimal]]:
+        """
+        Get position and P&L for a token from running totals.
+
+        Args:
+            token_id: Token to report
+            mid: Current price for unrealized P&L; unrealized is 0 if None
+
+        Returns:
+            Dict with position, avg_entry_price, current_price,
+            unrealized_pnl, realized_pnl
+        """
+        position = self._positions.get(token_id, Decimal("0"))
+        entry = self._entry_prices.get(token_id) if position else None
+
+        unrealized = Decimal("0")
+        if entry is not None and mid is not None:
+            unrealized = (mid - entry) * position
+
+        return {
+            'position': position,
+            'avg_entry_price': entry,
+            'current_price': mid,
+            'unrealized_pnl': unrealized,
+            'realized_pnl': self._realized_pnl.get(token_id, Decimal("0")),
+        }
+
     def reset(self):
         """Reset all orders and trades."""
         self.orders.clear()
         self.trades.clear()
         self._positions.clear()
+        self._entry_prices.clear()
+        self._realized_pnl.clear()
         logger.debug("[SIM] Reset")
 
 
@@ -919,6 +919,8 @@ class SmartMarketMaker:
             logger.info("Stopping feed...")
             await self.feed.stop()
 
+        self.trade_logger.close()
+
         logger.info("Smart market maker stopped.")
 
 
@@ -103,6 +103,10 @@ class PartialFillHandler:
         filled_size: Decimal,
     ) -> Optional[FillEvent]:
         """Record a fill and return fill event."""
+        # Replayed/duplicate fill notifications carry no size - ignore them
+        if filled_size <= 0:
+            return None
+
         order = self._orders.get(order_id)
         if not order:
             return None
@@ -139,6 +139,9 @@ class QueueOptimizer:
         time_in_queue: float = 0,
     ):
         """Record a fill/no-fill for learning."""
+        if queue_position < 0:
+            return
+
         record = FillRecord(
             queue_position=queue_position,
             filled=filled,
@@ -5,15 +5,17 @@ CLI runner for the market maker.
 import argparse
 import asyncio
 import sys
+import time
 from decimal import Decimal
 from src.config import DRY_RUN, get_mode_string
 from src.markets import fetch_active_markets
 from src.pricing import get_order_books
 from src.strategy.market_maker import SmartMarketMaker
 from src.strategy.market_scorer import MarketScorer
+from src.strategy.timing import TimingMode
 from src.orders import get_open_orders
 from src.trading import cancel_all_orders
-from src.utils import setup_logging
+from src.utils import install_uvloop, setup_logging
 
 logger = setup_logging()
 
@@ -47,17 +49,39 @@ def cleanup_orphaned_orders(token_id: str) -> int:
         return -1
 
 
-async def log_status_periodically(mm: SmartMarketMaker, interval: float = 30.0):
-    """Log status every N seconds."""
+# Status log cadence per timing mode: report often while the market is
+# moving, rarely while it sleeps
+STATUS_LOG_INTERVALS = {
+    TimingMode.FAST: 10.0,
+    TimingMode.NORMAL: 30.0,
+    TimingMode.SLEEP: 120.0,
+}
+
+
+async def log_status_periodically(mm: SmartMarketMaker, poll_interval: float = 1.0):
+    """
+    Log status at an interval driven by the market maker's timing mode.
+
+    The deadline is re-evaluated every poll against the current mode, so
+    a switch from SLEEP to FAST doesn't sit out the long SLEEP interval.
+    """
+    last_log = time.monotonic()
     while mm._running:
-        await asyncio.sleep(interval)
-        if mm._running:
-            status = mm.risk.get_status()
-            logger.info(
-                f"Status: Mode={status['mode']} | "
-                f"PnL={status['daily_pnl']:+.2f} ({status['pnl_percent_of_limit']:.0f}% of limit) | "
-                f"Events={status['risk_events_logged']}"
-            )
+        await asyncio.sleep(poll_interval)
+        if not mm._running:
+            break
+
+        now = time.monotonic()
+        if now - last_log < STATUS_LOG_INTERVALS[mm.timer.get_mode()]:
+            continue
+
+        last_log = now
+        status = mm.risk.get_status()
+        logger.info(
+            f"Status: Mode={status['mode']} | "
+            f"PnL={status['daily_pnl']:+.2f} ({status['pnl_percent_of_limit']:.0f}% of limit) | "
+            f"Events={status['risk_events_logged']}"
+        )
 
 
 def auto_select_market():
@@ -182,6 +206,10 @@ def main():
         "--position-limit", "-p", type=float, default=100.0,
         help="Max position size (default: 100.0)"
     )
+    parser.add_argument(
+        "--no-status", action="store_true",
+        help="Disable periodic status logging"
+    )
     args = parser.parse_args()
 
     print("=" * 60)
@@ -244,6 +272,9 @@ def main():
     if orphaned < 0:
         logger.error("[SAFETY] Could not verify order state - proceed with caution")
 
+    if install_uvloop():
+        logger.info("Using uvloop event loop")
+
     # Run with auto-retry on CLOB failures
     max_retries = 3
     tried_tokens = set()
@@ -273,7 +304,7 @@ def main():
                     pass
 
         try:
-            asyncio.run(run_with_status())
+            asyncio.run(mm.run() if args.no_status else run_with_status())
             break  # Normal exit
         except KeyboardInterrupt:
             print("\nInterrupted.")
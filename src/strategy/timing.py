@@ -70,11 +70,20 @@ class AdaptiveTimer:
             fast_mode_duration=fast_mode_duration,
         )
 
+        # Timestamps are integer monotonic nanoseconds
+        self._touch_resolution_ns = 10_000_000  # 10ms
+        self._fast_mode_duration_ns = int(fast_mode_duration * 1e9)
+
         self._mode = TimingMode.NORMAL
-        self._last_fast_trigger: float = 0.0
-        self._last_activity: float = time.time()
+        self._last_fast_trigger: int = 0
+        self._last_activity: int = time.monotonic_ns()
         self._last_price: Optional[float] = None
 
+    def _touch(self, now: int):
+        """Mark activity at `now`, skipping writes within the touch resolution."""
+        if now - self._last_activity >= self._touch_resolution_ns:
+            self._last_activity = now
+
     def get_mode(self) -> TimingMode:
         """Get current timing mode."""
         return self._mode
@@ -89,24 +98,26 @@ class AdaptiveTimer:
 
     def record_price_change(self, pct_change: float):
         """Record a price change and update mode."""
-        now = time.time()
-        self._last_activity = now
+        now = time.monotonic_ns()
+        self._touch(now)
 
         if abs(pct_change) >= self.config.volatility_threshold:
             self._mode = TimingMode.FAST
             self._last_fast_trigger = now
         elif self._mode == TimingMode.FAST:
             # Check if fast mode should expire
-            if now - self._last_fast_trigger > self.config.fast_mode_duration:
+            if now - self._last_fast_trigger > self._fast_mode_duration_ns:
                 self._mode = TimingMode.NORMAL
 
     def record_volume(self, current: float, avg: float):
         """Record volume and check for spike."""
-        self._last_activity = time.time()
+        now = time.monotonic_ns()
+        self._touch(now)
 
-        if avg > 0 and current / avg >= self.config.volume_spike_ratio:
+        # current / avg >= ratio, in multiply form
+        if avg > 0 and current >= avg * self.config.volume_spike_ratio:
             self._mode = TimingMode.FAST
-            self._last_fast_trigger = time.time()
+            self._last_fast_trigger = now
 
     def record_activity(self, seconds_since_last: float):
         """Record activity level."""
@@ -116,18 +127,23 @@ class AdaptiveTimer:
         else:
             if self._mode == TimingMode.SLEEP:
                 self._mode = TimingMode.NORMAL
-            self._last_activity = time.time()
+            self._touch(time.monotonic_ns())
 
     def on_feed_update(self, has_data: bool):
         """Called on each feed update."""
         if has_data:
-            self._last_activity = time.time()
+            self._touch(time.monotonic_ns())
             if self._mode == TimingMode.SLEEP:
                 self._mode = TimingMode.NORMAL
 
     def update_from_price(self, price: float):
         """Update timer from new price observation."""
         if self._last_price is not None:
-            pct_change = abs(price - self._last_price) / self._last_price
+            # Unchanged price still goes through record_price_change so
+            # FAST mode can expire, but skips the divide
+            if price == self._last_price:
+                pct_change = 0.0
+            else:
+                pct_change = abs(price - self._last_price) / self._last_price
             self.record_price_change(pct_change)
         self._last_price = price
@@ -7,10 +7,11 @@ Outputs a multiplier for spread adjustment.
 
 import time
 import math
-from collections import deque
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Optional, Deque, Tuple
+from typing import List, Optional, Tuple
+
+import numpy as np
 
 from src.config import (
     VOL_SAMPLE_INTERVAL,
@@ -24,6 +25,12 @@ from src.utils import setup_logging
 logger = setup_logging()
 
 
+def _log_return_moments(prices: np.ndarray) -> Tuple[float, float]:
+    """Sum and sum of squares of the log returns of a price series."""
+    returns = np.diff(np.log(prices))
+    return float(returns.sum()), float(np.dot(returns, returns))
+
+
 @dataclass
 class VolatilityState:
     """Current volatility state for display."""
@@ -60,6 +67,10 @@ class VolatilityTracker:
     VOL_HIGH = 0.30      # 15-30% = elevated
     # > 30% = extreme
 
+    # Rebuild the rolling return sums from the buffer every N samples to
+    # shed floating-point drift from repeated add/subtract
+    RESYNC_INTERVAL = 2048
+
     def __init__(
         self,
         token_id: str,
@@ -85,14 +96,51 @@ class VolatilityTracker:
         self.mult_min = mult_min
         self.mult_max = mult_max
 
+        # Annualize std of returns by sqrt(periods per year)
+        # With 5-second samples: 365 * 24 * 60 * 60 / 5 = 6,307,200 periods/year
+        self._annualization = math.sqrt(365 * 24 * 3600 / sample_interval)
+
+        # Interval arithmetic runs on integer monotonic nanoseconds
+        self._sample_interval_ns = int(sample_interval * 1e9)
+        self._window_ns = int(window_seconds * 1e9)
+
         # Calculate max samples in window
         max_samples = int(window_seconds / sample_interval) + 10
-        self._samples: Deque[Tuple[float, float]] = deque(maxlen=max_samples)
 
-        self._last_sample_time: float = 0.0
+        # Ring buffer of (timestamp, price) samples; _head is the next write
+        # slot and the oldest live sample sits _count slots behind it
+        self._max_samples = max_samples
+        self._ts = np.empty(max_samples, dtype=np.int64)
+        self._px = np.empty(max_samples, dtype=np.float64)
+        self._head: int = 0
+        self._count: int = 0
+
+        # Log return into each sample from the one before it. Window returns
+        # are those of every live sample except the oldest, kept as running
+        # sums so each update is O(1)
+        self._ret = np.zeros(max_samples, dtype=np.float64)
+        self._ret_sum: float = 0.0
+        self._ret_sumsq: float = 0.0
+        self._samples_since_resync: int = 0
+
+        self._last_sample_ns: Optional[int] = None
         self._last_price: Optional[float] = None
         self._realized_vol: float = 0.0
 
+        # Piecewise-linear vol -> spread multiplier curve:
+        # Low vol (< 5%) -> mult_min (0.7)
+        # Normal vol (5-15%) -> 1.0
+        # High vol (15-30%) -> 1.5
+        # Extreme (>= 50%) -> mult_max (2.0), flat beyond both ends
+        self._vol_xp = np.array([self.VOL_LOW, self.VOL_NORMAL, self.VOL_HIGH, self.VOL_HIGH + 0.20])
+        self._mult_fp = np.array([mult_min, 1.0, 1.5, mult_max])
+
+        # Last (vol, result) pairs for get_multiplier() / get_level()
+        self._mult_cache_vol: Optional[float] = None
+        self._mult_cache_val: float = 1.0
+        self._level_cache_vol: Optional[float] = None
+        self._level_cache_val: str = "UNKNOWN"
+
     def update(self, price: float) -> bool:
         """
         Update with current price. Samples if enough time has passed.
@@ -106,28 +154,48 @@ class VolatilityTracker:
         if price <= 0:
             return False
 
-        now = time.time()
+        now = time.monotonic_ns()
 
         # Check if it's time to sample
-        if now - self._last_sample_time < self.sample_interval:
+        if self._last_sample_ns is not None and now - self._last_sample_ns < self._sample_interval_ns:
             return False
 
+        self._take_sample(price, now)
+        return True
+
+    def _take_sample(self, price: float, now: int):
+        """Append a sample at monotonic time `now` and refresh volatility."""
+        # Make room by dropping the oldest sample once the buffer is full
+        if self._count == self._max_samples:
+            self._evict_oldest()
+
         # Take sample
-        self._samples.append((now, price))
-        self._last_sample_time = now
+        r = 0.0
+        if self._count:
+            r = math.log(price / self._last_price)
+            self._ret_sum += r
+            self._ret_sumsq += r * r
+        self._ts[self._head] = now
+        self._px[self._head] = price
+        self._ret[self._head] = r
+        self._head = (self._head + 1) % self._max_samples
+        self._count += 1
+        self._last_sample_ns = now
         self._last_price = price
 
         # Prune old samples outside window
-        cutoff = now - self.window_seconds
-        while self._samples and self._samples[0][0] < cutoff:
-            self._samples.popleft()
+        cutoff = now - self._window_ns
+        while self._count and self._ts[(self._head - self._count) % self._max_samples] < cutoff:
+            self._evict_oldest()
+
+        self._samples_since_resync += 1
+        if self._samples_since_resync >= self.RESYNC_INTERVAL:
+            self._resync_returns()
 
         # Recalculate volatility if we have enough samples
-        if len(self._samples) >= self.min_samples:
+        if self._count >= self.min_samples:
             self._realized_vol = self._calculate_volatility()
 
-        return True
-
     def get_multiplier(self) -> float:
         """
         Get spread multiplier based on current volatility.
@@ -135,56 +203,49 @@ class VolatilityTracker:
         Returns:
             Multiplier between mult_min (calm) and mult_max (volatile)
         """
-        if len(self._samples) < self.min_samples:
+        if self._count < self.min_samples:
             # Not enough data - use neutral multiplier
             return 1.0
 
-        # Map volatility to multiplier
-        # Low vol (< 5%) -> mult_min (0.7)
-        # Normal vol (5-15%) -> 1.0
-        # High vol (15-30%) -> 1.5
-        # Extreme (> 30%) -> mult_max (2.0)
-
-        vol = self._realized_vol
-
-        if vol < self.VOL_LOW:
-            # Calm - tighten spread
-            return self.mult_min
-
-        if vol < self.VOL_NORMAL:
-            # Transition from calm to normal
-            ratio = (vol - self.VOL_LOW) / (self.VOL_NORMAL - self.VOL_LOW)
-            return self.mult_min + ratio * (1.0 - self.mult_min)
-
-        if vol < self.VOL_HIGH:
-            # Transition from normal to high
-            ratio = (vol - self.VOL_NORMAL) / (self.VOL_HIGH - self.VOL_NORMAL)
-            return 1.0 + ratio * 0.5  # 1.0 -> 1.5
+        # Vol only moves when a sample is taken, so reuse the last mapping
+        # between samples
+        if self._realized_vol != self._mult_cache_vol:
+            self._mult_cache_val = self._vol_to_multiplier(self._realized_vol)
+            self._mult_cache_vol = self._realized_vol
+        return self._mult_cache_val
 
-        # Extreme volatility
-        ratio = min(1.0, (vol - self.VOL_HIGH) / 0.20)  # Cap at 50% annualized
-        return 1.5 + ratio * (self.mult_max - 1.5)  # 1.5 -> mult_max
+    def _vol_to_multiplier(self, vol: float) -> float:
+        """Map annualized volatility onto the spread multiplier curve."""
+        return float(np.interp(vol, self._vol_xp, self._mult_fp))
 
     def get_level(self) -> str:
         """Get volatility level as string."""
-        if len(self._samples) < self.min_samples:
+        if self._count < self.min_samples:
             return "UNKNOWN"
 
         vol = self._realized_vol
+        if vol == self._level_cache_vol:
+            return self._level_cache_val
+
         if vol < self.VOL_LOW:
-            return "LOW"
-        if vol < self.VOL_NORMAL:
-            return "NORMAL"
-        if vol < self.VOL_HIGH:
-            return "HIGH"
-        return "EXTREME"
+            level = "LOW"
+        elif vol < self.VOL_NORMAL:
+            level = "NORMAL"
+        elif vol < self.VOL_HIGH:
+            level = "HIGH"
+        else:
+            level = "EXTREME"
+
+        self._level_cache_vol = vol
+        self._level_cache_val = level
+        return level
 
     def get_state(self) -> VolatilityState:
         """Get full volatility state for display."""
         return VolatilityState(
             realized_vol=self._realized_vol,
             multiplier=self.get_multiplier(),
-            sample_count=len(self._samples),
+            sample_count=self._count,
             level=self.get_level(),
             last_price=self._last_price,
         )
@@ -197,42 +258,55 @@ class VolatilityTracker:
         """
         Calculate realized volatility from samples.
 
-        Uses standard deviation of log returns, annualized.
+        Uses standard deviation of log returns, annualized. Reads the
+        rolling return sums, so this is O(1) regardless of window size.
         """
-        if len(self._samples) < 2:
-            return 0.0
-
-        # Calculate log returns
-        returns = []
-        samples_list = list(self._samples)
-
-        for i in range(1, len(samples_list)):
-            _, price_prev = samples_list[i - 1]
-            _, price_curr = samples_list[i]
-
-            if price_prev > 0 and price_curr > 0:
-                log_return = math.log(price_curr / price_prev)
-                returns.append(log_return)
-
-        if len(returns) < 2:
+        # Need at least 2 returns (3 prices) for a sample std
+        n = self._count - 1
+        if n < 2:
             return 0.0
 
-        # Calculate standard deviation
-        mean = sum(returns) / len(returns)
-        variance = sum((r - mean) ** 2 for r in returns) / (len(returns) - 1)
-        std_dev = math.sqrt(variance)
-
-        # Annualize: multiply by sqrt(periods per year)
-        # With 5-second samples: 365 * 24 * 60 * 60 / 5 = 6,307,200 periods/year
-        periods_per_year = 365 * 24 * 3600 / self.sample_interval
-        annualized_vol = std_dev * math.sqrt(periods_per_year)
-
-        return annualized_vol
+        variance = (self._ret_sumsq - self._ret_sum * self._ret_sum / n) / (n - 1)
+        std_dev = math.sqrt(max(0.0, variance))
+
+        return std_dev * self._annualization
+
+    def _evict_oldest(self):
+        """Drop the oldest sample; its successor's return leaves the window."""
+        self._count -= 1
+        if self._count:
+            r = self._ret[(self._head - self._count) % self._max_samples]
+            self._ret_sum -= r
+            self._ret_sumsq -= r * r
+        else:
+            self._ret_sum = 0.0
+            self._ret_sumsq = 0.0
+
+    def _resync_returns(self):
+        """Recompute the rolling return sums exactly from the buffer."""
+        self._samples_since_resync = 0
+        if self._count < 2:
+            self._ret_sum = 0.0
+            self._ret_sumsq = 0.0
+            return
+        self._ret_sum, self._ret_sumsq = _log_return_moments(self._ordered_prices())
+
+    def _ordered_prices(self) -> np.ndarray:
+        """Window prices oldest-first; only copies when the buffer wraps."""
+        start = (self._head - self._count) % self._max_samples
+        end = start + self._count
+        if end <= self._max_samples:
+            return self._px[start:end]
+        return np.concatenate((self._px[start:], self._px[:end - self._max_samples]))
 
     def reset(self):
         """Clear all samples and reset state."""
-        self._samples.clear()
-        self._last_sample_time = 0.0
+        self._head = 0
+        self._count = 0
+        self._ret_sum = 0.0
+        self._ret_sumsq = 0.0
+        self._samples_since_resync = 0
+        self._last_sample_ns = None
         self._last_price = None
         self._realized_vol = 0.0
 
@@ -241,6 +315,10 @@ class MultiTokenVolatilityTracker:
     """
     Track volatility for multiple tokens.
 
+    Realized vols are mirrored into one array (indexed in tracker
+    insertion order) so get_all_states() maps every token's multiplier
+    and level in a single vectorised pass.
+
     Usage:
         tracker = MultiTokenVolatilityTracker()
         tracker.update("token1", 0.55)
@@ -249,16 +327,85 @@ class MultiTokenVolatilityTracker:
         mult1 = tracker.get_multiplier("token1")
     """
 
+    LEVELS = ("LOW", "NORMAL", "HIGH", "EXTREME")
+    LEVEL_THRESHOLDS = np.array([
+        VolatilityTracker.VOL_LOW,
+        VolatilityTracker.VOL_NORMAL,
+        VolatilityTracker.VOL_HIGH,
+    ])
+
+    # Sentinel last-sample time that is always past the sample interval
+    _NEVER_SAMPLED = np.iinfo(np.int64).min // 2
+
     def __init__(self, **kwargs):
         """kwargs are passed to each VolatilityTracker."""
         self._trackers: dict[str, VolatilityTracker] = {}
         self._kwargs = kwargs
 
+        self._index: dict[str, int] = {}
+        self._vols = np.zeros(16, dtype=np.float64)
+        # Last sample time per token, mirrored for update_many's due-check
+        self._last_sample_ns = np.full(16, self._NEVER_SAMPLED, dtype=np.int64)
+
+    def _get_tracker(self, token_id: str) -> VolatilityTracker:
+        """Get or create the tracker for a token."""
+        tracker = self._trackers.get(token_id)
+        if tracker is None:
+            tracker = self._trackers[token_id] = VolatilityTracker(token_id, **self._kwargs)
+            self._index[token_id] = len(self._index)
+            if len(self._index) > len(self._vols):
+                grow = len(self._vols)
+                self._vols = np.concatenate((self._vols, np.zeros(grow)))
+                self._last_sample_ns = np.concatenate(
+                    (self._last_sample_ns, np.full(grow, self._NEVER_SAMPLED, dtype=np.int64))
+                )
+        return tracker
+
     def update(self, token_id: str, price: float) -> bool:
         """Update price for a token."""
-        if token_id not in self._trackers:
-            self._trackers[token_id] = VolatilityTracker(token_id, **self._kwargs)
-        return self._trackers[token_id].update(price)
+        tracker = self._get_tracker(token_id)
+        sampled = tracker.update(price)
+        if sampled:
+            idx = self._index[token_id]
+            self._vols[idx] = tracker.get_realized_vol()
+            self._last_sample_ns[idx] = tracker._last_sample_ns
+        return sampled
+
+    def update_many(self, token_ids: List[str], prices) -> np.ndarray:
+        """
+        Update prices for several tokens at once.
+
+        Uses one clock read and a vectorised due-check, so only tokens
+        whose sample interval has elapsed reach their tracker. A token
+        listed more than once is updated once, with its last price.
+
+        Args:
+            token_ids: Tokens to update
+            prices: Current mid price per token (sequence or array)
+
+        Returns:
+            Boolean array, True where a new sample was taken
+        """
+        trackers = [self._get_tracker(tid) for tid in token_ids]
+        idx = np.fromiter((self._index[tid] for tid in token_ids), dtype=np.intp, count=len(token_ids))
+        prices = np.asarray(prices, dtype=np.float64)
+
+        now = time.monotonic_ns()
+        interval_ns = trackers[0]._sample_interval_ns if trackers else 0
+        due = (prices > 0) & (now - self._last_sample_ns[idx] >= interval_ns)
+        if len(set(token_ids)) < len(token_ids):
+            # The due-check above saw every repeat as due; keep the last one
+            _, last_from_end = np.unique(idx[::-1], return_index=True)
+            last = np.zeros(len(idx), dtype=bool)
+            last[len(idx) - 1 - last_from_end] = True
+            due &= last
+
+        for i in np.flatnonzero(due).tolist():
+            tracker = trackers[i]
+            tracker._take_sample(float(prices[i]), now)
+            self._vols[idx[i]] = tracker.get_realized_vol()
+        self._last_sample_ns[idx[due]] = now
+        return due
 
     def get_multiplier(self, token_id: str) -> float:
         """Get spread multiplier for a token."""
@@ -274,4 +421,23 @@ class MultiTokenVolatilityTracker:
 
     def get_all_states(self) -> dict[str, VolatilityState]:
         """Get volatility states for all tracked tokens."""
-        return {tid: t.get_state() for tid, t in self._trackers.items()}
+        if not self._trackers:
+            return {}
+
+        # All trackers share kwargs, hence the same multiplier curve
+        curve = next(iter(self._trackers.values()))
+        vols = self._vols[:len(self._trackers)]
+        mults = np.interp(vols, curve._vol_xp, curve._mult_fp).tolist()
+        levels = np.searchsorted(self.LEVEL_THRESHOLDS, vols, side="right").tolist()
+
+        states = {}
+        for (tid, t), vol, mult, level in zip(self._trackers.items(), vols.tolist(), mults, levels):
+            warm = t._count >= t.min_samples
+            states[tid] = VolatilityState(
+                realized_vol=vol,
+                multiplier=mult if warm else 1.0,
+                sample_count=t._count,
+                level=self.LEVELS[level] if warm else "UNKNOWN",
+                last_price=t._last_price,
+            )
+        return states
@@ -5,11 +5,18 @@ Tracks execution latency and alerts on degradation.
 """
 
 import time
-from collections import defaultdict
+from bisect import bisect_left
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
-@dataclass
+import numpy as np
+
+# Log-spaced histogram bin edges from 0.1ms to 10s. Bin i holds values in
+# (edge[i-1], edge[i]]; the last bin catches everything above 10s.
+_BIN_EDGES = np.logspace(-1, 4, 64)
+_BIN_EDGE_LIST = _BIN_EDGES.tolist()
+
+@dataclass(slots=True)
 class LatencyStats:
     """Statistics for a latency metric."""
     name: str
@@ -21,7 +28,7 @@ class LatencyStats:
     p95: float
     p99: float
 
-@dataclass
+@dataclass(slots=True)
 class LatencyAlert:
     """Latency alert."""
     metric: str
@@ -36,6 +43,31 @@ class LatencyThreshold:
     warn: float
     critical: float
 
+class _LatencyBucket:
+    """Latency histogram plus running aggregates for one window."""
+
+    __slots__ = ("hist", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.hist = np.zeros(len(_BIN_EDGE_LIST) + 1, dtype=np.int64)
+        self.clear()
+
+    def clear(self):
+        self.hist[:] = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def add(self, latency_ms: float):
+        self.hist[bisect_left(_BIN_EDGE_LIST, latency_ms)] += 1
+        self.count += 1
+        self.total += latency_ms
+        if latency_ms < self.min:
+            self.min = latency_ms
+        if latency_ms > self.max:
+            self.max = latency_ms
+
 class LatencyMonitor:
     """
     Monitors execution latency.
@@ -69,61 +101,127 @@ class LatencyMonitor:
             for k, v in (thresholds or {}).items()
         }
         self.window_size = window_size
-        self._data: Dict[str, List[float]] = defaultdict(list)
+
+        # Two-bucket sliding window per metric: [current, previous]. The
+        # current bucket takes new values until it holds a full window,
+        # then the previous one is cleared and they swap, so the pair
+        # always covers the last window_size values
+        self._bucket_size = max(1, window_size)
+        self._buckets: Dict[str, List[_LatencyBucket]] = {}
         self._last_values: Dict[str, float] = {}
 
+        # Last computed stats per metric, dropped when the metric records
+        self._stats_cache: Dict[str, LatencyStats] = {}
+
+        # Alert state per thresholded metric (threshold order), refreshed
+        # in record() so check_alerts() needn't re-evaluate thresholds
+        self._alerts: Dict[str, Optional[LatencyAlert]] = dict.fromkeys(self.thresholds)
+        self._alert_count = 0
+
     def record(self, metric: str, latency_ms: float):
         """Record a latency measurement."""
-        self._data[metric].append(latency_ms)
+        buckets = self._buckets.get(metric)
+        if buckets is None:
+            buckets = self._buckets[metric] = [_LatencyBucket(), _LatencyBucket()]
+
+        current = buckets[0]
+        if current.count >= self._bucket_size:
+            current = buckets[1]
+            current.clear()
+            buckets.reverse()
+
+        current.add(latency_ms)
         self._last_values[metric] = latency_ms
+        self._stats_cache.pop(metric, None)
 
-        # Keep only recent values
-        if len(self._data[metric]) > self.window_size:
-            self._data[metric] = self._data[metric][-self.window_size:]
+        threshold = self.thresholds.get(metric)
+        if threshold is not None:
+            alert = self._evaluate_threshold(metric, latency_ms, threshold)
+            self._alert_count += (alert is not None) - (self._alerts[metric] is not None)
+            self._alerts[metric] = alert
 
     def get_stats(self, metric: str) -> Optional[LatencyStats]:
-        """Get statistics for a metric."""
-        values = self._data.get(metric, [])
-        if not values:
+        """
+        Get statistics for a metric.
+
+        Stats cover at least the last window_size values and at most
+        twice that, depending on where the window last rotated.
+        Percentiles are interpolated from the histogram, so cost is fixed
+        by the bin count rather than the number of samples. Results are
+        cached until the next record() for the metric.
+        """
+        cached = self._stats_cache.get(metric)
+        if cached is not None:
+            return cached
+
+        buckets = self._buckets.get(metric)
+        if not buckets or not buckets[0].count:
             return None
 
-        sorted_values = sorted(values)
-        n = len(sorted_values)
-
-        return LatencyStats(
+        current, previous = buckets
+        n = current.count + previous.count
+        min_value = min(current.min, previous.min)
+        max_value = max(current.max, previous.max)
+
+        hist = current.hist + previous.hist
+        cum = np.cumsum(hist)
+
+        def percentile(q: float) -> float:
+            # Rank of sorted[int(n * q)], matching the old exact selection
+            rank = int(n * q) + 1
+            i = int(np.searchsorted(cum, rank))
+            below = int(cum[i - 1]) if i else 0
+            lower = _BIN_EDGES[i - 1] if i else 0.0
+            upper = _BIN_EDGES[i] if i < len(_BIN_EDGES) else max_value
+            value = lower + (upper - lower) * (rank - below) / hist[i]
+            return float(min(max(value, min_value), max_value))
+
+        stats = self._stats_cache[metric] = LatencyStats(
             name=metric,
             count=n,
-            min=sorted_values[0],
-            max=sorted_values[-1],
-            avg=sum(values) / n,
-            p50=sorted_values[int(n * 0.50)],
-            p95=sorted_values[int(n * 0.95)] if n >= 20 else sorted_values[-1],
-            p99=sorted_values[int(n * 0.99)] if n >= 100 else sorted_values[-1],
+            min=min_value,
+            max=max_value,
+            avg=(current.total + previous.total) / n,
+            p50=percentile(0.50),
+            p95=percentile(0.95) if n >= 20 else max_value,
+            p99=percentile(0.99) if n >= 100 else max_value,
         )
+        return stats
 
     def check_alerts(self) -> Optional[LatencyAlert]:
         """Check if any metrics are over threshold."""
-        for metric, threshold in self.thresholds.items():
-            last_value = self._last_values.get(metric)
-            if last_value is None:
-                continue
-
-            if last_value >= threshold.critical:
-                return LatencyAlert(
-                    metric=metric,
-                    value=last_value,
-                    threshold=threshold.critical,
-                    level="critical",
-                    message=f"CRITICAL: {metric} latency {last_value:.0f}ms > {threshold.critical}ms",
-                )
-            elif last_value >= threshold.warn:
-                return LatencyAlert(
-                    metric=metric,
-                    value=last_value,
-                    threshold=threshold.warn,
-                    level="warn",
-                    message=f"WARN: {metric} latency {last_value:.0f}ms > {threshold.warn}ms",
-                )
+        if not self._alert_count:
+            return None
+
+        for alert in self._alerts.values():
+            if alert is not None:
+                return alert
+
+        return None
+
+    def _evaluate_threshold(
+        self,
+        metric: str,
+        value: float,
+        threshold: LatencyThreshold,
+    ) -> Optional[LatencyAlert]:
+        """Build the alert for a metric's latest value, if any."""
+        if value >= threshold.critical:
+            return LatencyAlert(
+                metric=metric,
+                value=value,
+                threshold=threshold.critical,
+                level="critical",
+                message=f"CRITICAL: {metric} latency {value:.0f}ms > {threshold.critical}ms",
+            )
+        elif value >= threshold.warn:
+            return LatencyAlert(
+                metric=metric,
+                value=value,
+                threshold=threshold.warn,
+                level="warn",
+                message=f"WARN: {metric} latency {value:.0f}ms > {threshold.warn}ms",
+            )
 
         return None
 
@@ -131,6 +229,6 @@ class LatencyMonitor:
         """Get stats for all metrics."""
         return {
             metric: stats
-            for metric in self._data
+            for metric in self._buckets
             if (stats := self.get_stats(metric)) is not None
         }
@@ -5,8 +5,10 @@ Handles both DRY_RUN (simulated) and LIVE (real) modes.
 """
 
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 from decimal import Decimal, ROUND_DOWN
 
 from src.config import (
@@ -14,9 +16,12 @@ from src.config import (
     MAX_POSITION_PER_MARKET,
     MAX_ORDER_SIZE,
     MIN_ORDER_SIZE,
+    ORDER_POST_TIMEOUT,
     has_credentials
 )
 from src.models import Order, OrderSide, OrderStatus
+from src.orders import get_open_orders, get_position
+from src.rate_limiter import get_order_limiter
 from src.simulator import get_simulator
 from src.utils import setup_logging
 
@@ -34,21 +39,60 @@ _cached_balance: Optional[Decimal] = None
 BALANCE_CACHE_SECONDS = 30
 MIN_BALANCE_FOR_ORDER = Decimal("1.0")  # Don't trade below $1
 
+# Shared constants (Decimals are immutable)
+_ZERO = Decimal("0")
+_ONE = Decimal("1")
+_HALF = Decimal("0.5")
 
-def check_balance_for_order(price: Decimal, size: Decimal) -> None:
+# Tick size cache: token_id -> (tick, expires_at)
+TICK_SIZE_TTL = 300.0
+TICK_SIZE_RETRY = 30.0  # Serve the fallback this long after a failed lookup
+TICK_DEFAULT = Decimal("0.01")
+_TICK_INTERN = {"0.1": Decimal("0.1"), "0.01": TICK_DEFAULT, "0.001": Decimal("0.001"), "0.0001": Decimal("0.0001")}
+_tick_cache: Dict[str, Tuple[Decimal, float]] = {}
+_tick_grids: Dict[Decimal, Tuple[int, Tuple[Decimal, ...]]] = {}
+
+# Parallel cancels when the batch endpoint is unavailable
+CANCEL_WORKERS = 8
+
+# Signed-but-unaccepted orders: (token_id, side, price, size) -> (signed, signed_at)
+SIGN_CACHE_TTL = 2.0
+_sign_cache: Dict[Tuple[str, OrderSide, Decimal, Decimal], Tuple[object, float]] = {}
+
+# Ids the exchange confirmed cancelled (time.monotonic() of confirmation),
+# so duplicate cancels skip the round-trip
+RECENTLY_CANCELLED_MAX = 1024
+_recently_cancelled: "OrderedDict[str, float]" = OrderedDict()
+
+# How long cancel_all_orders trusts a confirmed cancel over an open-orders
+# listing that still shows the order
+RECENTLY_CANCELLED_GRACE = 2.0
+
+# Posts run here so the quoting loop can stop waiting after ORDER_POST_TIMEOUT
+_post_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="order-post")
+
+
+def check_balance_for_order(price: Decimal, size: Decimal, committed: Decimal = _ZERO) -> Decimal:
     """
     Ensure sufficient balance for order.
 
     Raises OrderError if:
     - Balance is below minimum threshold
-    - Order cost exceeds 50% of available balance
+    - Order cost plus committed exceeds 50% of available balance
 
     Uses cached balance to reduce API calls.
+
+    Args:
+        committed: Cost of other orders in the same batch to count alongside this one
+
+    Returns:
+        Order cost plus committed, for checking the next order of a batch
     """
     global _last_balance_check, _cached_balance
 
+    order_cost = price * size + committed
     if DRY_RUN:
-        return  # Skip balance checks in simulation
+        return order_cost  # Skip balance checks in simulation
 
     now = time.time()
     if now - _last_balance_check > BALANCE_CACHE_SECONDS or _cached_balance is None:
@@ -60,30 +104,87 @@ def check_balance_for_order(price: Decimal, size: Decimal) -> None:
             logger.debug(f"[BALANCE] Updated cache: ${_cached_balance:.2f}")
         except Exception as e:
             logger.warning(f"Balance check failed: {e}")
-            return  # Don't block if API fails, but log it
+            return order_cost  # Don't block if API fails, but log it
 
-    order_cost = price * size
     if _cached_balance < MIN_BALANCE_FOR_ORDER:
         raise OrderError(f"Balance too low: ${_cached_balance:.2f} < ${MIN_BALANCE_FOR_ORDER}")
 
-    if order_cost > _cached_balance * Decimal("0.5"):
+    if order_cost > _cached_balance * _HALF:
         raise OrderError(
             f"Order cost ${order_cost:.2f} exceeds 50% of balance ${_cached_balance:.2f}"
         )
 
+    return order_cost
+
 
 def get_tick_size(token_id: str) -> Decimal:
     """
     Get tick size for a token.
-    Most Polymarket markets use 0.01.
+
+    Fetched from the CLOB and cached for TICK_SIZE_TTL seconds. Falls back
+    to the last known tick, or 0.01 (most Polymarket markets), in DRY_RUN
+    or if the lookup fails; a failed lookup isn't retried for TICK_SIZE_RETRY.
     """
-    # Default tick size - could fetch from API later
-    return Decimal("0.01")
+    if DRY_RUN:
+        return TICK_DEFAULT
+
+    cached = _tick_cache.get(token_id)
+    now = time.monotonic()
+    if cached is not None and now < cached[1]:
+        return cached[0]
+
+    from src.client import get_client
+
+    try:
+        raw = str(get_client().get_tick_size(token_id))
+    except Exception as e:
+        logger.warning(f"Tick size lookup failed for {token_id[:16]}...: {e}")
+        tick = cached[0] if cached is not None else TICK_DEFAULT
+        _tick_cache[token_id] = (tick, now + TICK_SIZE_RETRY)
+        return tick
+
+    tick = _TICK_INTERN.get(raw) or Decimal(raw)
+    _tick_cache[token_id] = (tick, now + TICK_SIZE_TTL)
+    return tick
+
+
+def invalidate_tick_size(token_id: str) -> None:
+    """Drop the cached tick size for a token (e.g. on a tick_size_change event)."""
+    _tick_cache.pop(token_id, None)
+
+    if DRY_RUN:
+        return
+
+    from src.client import get_client
+
+    try:
+        get_client().clear_tick_size_cache(token_id)
+    except Exception:
+        pass
 
 
 def round_to_tick(price: Decimal, tick_size: Decimal) -> Decimal:
     """Round price down to nearest tick."""
-    return (price / tick_size).quantize(Decimal("1"), rounding=ROUND_DOWN) * tick_size
+    return (price / tick_size).quantize(_ONE, rounding=ROUND_DOWN) * tick_size
+
+
+def _tick_grid(tick: Decimal) -> Optional[Tuple[int, Tuple[Decimal, ...]]]:
+    """
+    Get (ticks per unit, every price on the grid) for a tick size.
+
+    Prices are indexed by tick count so rounding is an int truncation and
+    a tuple lookup. Returns None for ticks that don't divide 1 evenly.
+    """
+    grid = _tick_grids.get(tick)
+    if grid is None:
+        scale = Decimal(1) / tick
+        if scale != scale.to_integral_value():
+            return None
+        scale = int(scale)
+        exponent = tick.as_tuple().exponent
+        grid = (scale, tuple(Decimal(n).scaleb(exponent) for n in range(scale)))
+        _tick_grids[tick] = grid
+    return grid
 
 
 def validate_price(price: Decimal, token_id: str) -> Decimal:
@@ -92,19 +193,25 @@ def validate_price(price: Decimal, token_id: str) -> Decimal:
 
     Returns rounded price or raises OrderError.
     """
-    if price <= Decimal("0") or price >= Decimal("1"):
+    if price <= 0 or price >= 1:
         raise OrderError(f"Price must be between 0 and 1, got {price}")
 
     tick = get_tick_size(token_id)
-    rounded = round_to_tick(price, tick)
+    grid = _tick_grid(tick)
 
-    # Ensure still in valid range after rounding
-    if rounded <= Decimal("0"):
-        rounded = tick
-    if rounded >= Decimal("1"):
-        rounded = Decimal("1") - tick
+    if grid is None:
+        rounded = round_to_tick(price, tick)
+        # Ensure still in valid range after rounding
+        if rounded <= _ZERO:
+            rounded = tick
+        if rounded >= _ONE:
+            rounded = _ONE - tick
+        return rounded
 
-    return rounded
+    # 0 < price < 1, so the truncated tick count is in [0, scale)
+    scale, prices = grid
+    ticks = int(price * scale)
+    return prices[ticks or 1]
 
 
 def validate_size(size: Decimal) -> None:
@@ -116,11 +223,23 @@ def validate_size(size: Decimal) -> None:
         raise OrderError(f"Size {size} exceeds maximum {MAX_ORDER_SIZE}")
 
 
-def check_position_limit(token_id: str, side: OrderSide, size: Decimal) -> None:
-    """Check if order would exceed position limit. Raises OrderError if exceeded."""
-    from src.orders import get_position
+def check_position_limit(
+    token_id: str,
+    side: OrderSide,
+    size: Decimal,
+    current: Optional[Decimal] = None,
+) -> Decimal:
+    """
+    Check if order would exceed position limit. Raises OrderError if exceeded.
+
+    Args:
+        current: Position to check against; looked up if not given
 
-    current = get_position(token_id)
+    Returns:
+        Position after the order fills
+    """
+    if current is None:
+        current = get_position(token_id)
 
     if side == OrderSide.BUY:
         new_position = current + size
@@ -133,6 +252,66 @@ def check_position_limit(token_id: str, side: OrderSide, size: Decimal) -> None:
             f"Current: {current}, After: {new_position}, Limit: ±{MAX_POSITION_PER_MARKET}"
         )
 
+    return new_position
+
+
+def _order_args(token_id: str, side: OrderSide, price: Decimal, size: Decimal) -> dict:
+    """Build py-clob-client order arguments."""
+    return {
+        "token_id": token_id,
+        "price": float(price),
+        "size": float(size),
+        "side": side.value,
+    }
+
+
+def _live_order(order_id: str, token_id: str, side: OrderSide, price: Decimal, size: Decimal) -> Order:
+    """Build the local record for a freshly posted live order."""
+    return Order(
+        id=order_id,
+        token_id=token_id,
+        side=side,
+        price=price,
+        size=size,
+        filled=_ZERO,
+        status=OrderStatus.LIVE,
+        is_simulated=False,
+        created_at=datetime.now(timezone.utc).isoformat(),
+    )
+
+
+def _signed_order(client: Any, key: Tuple[str, OrderSide, Decimal, Decimal]) -> Any:
+    """
+    Sign an order, reusing a recent signature for the same order.
+
+    Only signatures whose post was never accepted stay cached, so a
+    retry after a rejected or failed post skips the EIP-712 signing.
+    """
+    now = time.monotonic()
+    cached = _sign_cache.get(key)
+    if cached is not None and now - cached[1] < SIGN_CACHE_TTL:
+        return cached[0]
+
+    if len(_sign_cache) >= 64:
+        for stale in [k for k, (_, t) in _sign_cache.items() if now - t >= SIGN_CACHE_TTL]:
+            del _sign_cache[stale]
+
+    signed = client.create_order(_order_args(*key))
+    _sign_cache[key] = (signed, now)
+    return signed
+
+
+def _cancel_late_order(client: Any, future: Future) -> None:
+    """Cancel an order whose post completed after place_order timed out."""
+    try:
+        response = future.result()
+        order_id = (response.get("id") or response.get("orderID")) if response else None
+        if order_id:
+            logger.warning(f"[LIVE] Cancelling late order: {order_id}")
+            client.cancel(order_id)
+    except Exception as e:
+        logger.warning(f"Late order cleanup failed: {e}")
+
 
 def place_order(
     token_id: str,
@@ -168,7 +347,6 @@ def place_order(
         return get_simulator().create_order(token_id, side, price, size)
 
     # === LIVE MODE ===
-    from src.rate_limiter import get_order_limiter
     get_order_limiter().wait_sync()
 
     if not has_credentials():
@@ -181,15 +359,18 @@ def place_order(
         logger.info(f"[LIVE] Placing: {side.value} {size} @ {price}")
 
         # Build and post order using py-clob-client
-        order_args = {
-            "token_id": token_id,
-            "price": float(price),
-            "size": float(size),
-            "side": side.value,
-        }
-
-        signed_order = client.create_order(order_args)
-        response = client.post_order(signed_order)
+        sign_key = (token_id, side, price, size)
+        signed_order = _signed_order(client, sign_key)
+        future = _post_executor.submit(client.post_order, signed_order)
+        try:
+            response = future.result(timeout=ORDER_POST_TIMEOUT)
+        except FutureTimeout:
+            _sign_cache.pop(sign_key, None)
+            # A post still queued for a worker was never sent: drop it. One
+            # already in flight may still land; pull it if it does
+            if not future.cancel():
+                future.add_done_callback(lambda f: _cancel_late_order(client, f))
+            raise OrderError(f"Order post timed out after {ORDER_POST_TIMEOUT}s")
 
         if not response:
             raise OrderError("Order rejected: empty response")
@@ -200,17 +381,10 @@ def place_order(
 
         logger.info(f"[LIVE] Order placed: {order_id}")
 
-        return Order(
-            id=order_id,
-            token_id=token_id,
-            side=side,
-            price=price,
-            size=size,
-            filled=Decimal("0"),
-            status=OrderStatus.LIVE,
-            is_simulated=False,
-            created_at=datetime.now(timezone.utc).isoformat(),
-        )
+        # Accepted signatures are single-use
+        _sign_cache.pop(sign_key, None)
+
+        return _live_order(order_id, token_id, side, price, size)
 
     except OrderError:
         raise
@@ -218,6 +392,115 @@ def place_order(
         raise OrderError(f"Order failed: {e}")
 
 
+def place_orders(
+    batch: List[Tuple[str, OrderSide, Decimal, Decimal]]
+) -> List[Optional[Order]]:
+    """
+    Place several orders in one request.
+
+    Every order is validated before anything is sent (position limits are
+    checked cumulatively per token, the balance rule against the summed
+    cost of the BUY legs), then all are signed locally and posted with a
+    single batch call in LIVE mode.
+
+    Args:
+        batch: (token_id, side, price, size) per order
+
+    Returns:
+        Orders in input order; None where the exchange rejected that order
+
+    Raises:
+        OrderError: If any order fails validation or the batch post fails
+    """
+    if not batch:
+        return []
+    if len(batch) == 1:
+        return [place_order(*batch[0])]
+
+    # Validate all legs up front
+    positions: Dict[str, Decimal] = {}
+    committed = _ZERO
+    validated = []
+    for token_id, side, price, size in batch:
+        price = validate_price(price, token_id)
+        validate_size(size)
+        positions[token_id] = check_position_limit(token_id, side, size, positions.get(token_id))
+        cost = check_balance_for_order(price, size, committed)
+        if side == OrderSide.BUY:
+            committed = cost
+        validated.append((token_id, side, price, size))
+
+    if DRY_RUN:
+        sim = get_simulator()
+        return [sim.create_order(*leg) for leg in validated]
+
+    # === LIVE MODE ===
+    get_order_limiter().wait_sync()
+
+    if not has_credentials():
+        raise OrderError("No credentials configured for live trading")
+
+    from py_clob_client.clob_types import PostOrdersArgs
+    from src.client import get_auth_client
+    client = get_auth_client()
+
+    try:
+        logger.info(f"[LIVE] Placing batch of {len(validated)} orders")
+
+        # Signing is local; only the post goes over the network
+        signed = [PostOrdersArgs(order=client.create_order(_order_args(*leg))) for leg in validated]
+        response = client.post_orders(signed)
+
+        if not response:
+            raise OrderError("Batch rejected: empty response")
+        # A status per order, or we cannot tell which orders are live
+        if not isinstance(response, list) or len(response) != len(validated):
+            raise OrderError(f"Batch rejected: unexpected response: {response}")
+
+    except OrderError:
+        raise
+    except Exception as e:
+        raise OrderError(f"Batch order failed: {e}")
+
+    # Statuses come back in submission order
+    orders: List[Optional[Order]] = []
+    for leg, status in zip(validated, response):
+        order_id = status.get("orderID") or status.get("id")
+        if not order_id or status.get("success") is False:
+            logger.warning(f"[LIVE] Order rejected: {leg[1].value} {leg[3]} @ {leg[2]}: {status}")
+            orders.append(None)
+            continue
+        logger.info(f"[LIVE] Order placed: {order_id}")
+        orders.append(_live_order(order_id, *leg))
+
+    return orders
+
+
+def _mark_cancelled(order_id: str) -> None:
+    """Remember a confirmed cancel (bounded, oldest dropped first)."""
+    _recently_cancelled[order_id] = time.monotonic()
+    _recently_cancelled.move_to_end(order_id)
+    if len(_recently_cancelled) > RECENTLY_CANCELLED_MAX:
+        _recently_cancelled.popitem(last=False)
+
+
+def _record_cancel_response(response: Any) -> List[str]:
+    """
+    Mark and return the ids a cancel response confirms.
+
+    The client reports refused cancels in "not_canceled" rather than
+    raising, so only ids listed in "canceled" count as cancelled.
+    """
+    if not isinstance(response, dict):
+        return []
+    cancelled_ids = response.get("canceled") or []
+    for order_id in cancelled_ids:
+        _mark_cancelled(order_id)
+    for order_id, reason in (response.get("not_canceled") or {}).items():
+        logger.warning(f"Failed to cancel {order_id}: {reason}")
+    return cancelled_ids
+
+
 def cancel_order(order_id: str) -> bool:
     """
     Cancel an order by ID.
@@ -227,7 +510,9 @@ def cancel_order(order_id: str) -> bool:
     if DRY_RUN:
         return get_simulator().cancel_order(order_id)
 
-    from src.rate_limiter import get_order_limiter
+    if order_id in _recently_cancelled:
+        return True
+
     get_order_limiter().wait_sync()
 
     if not has_credentials():
@@ -238,8 +523,8 @@ def cancel_order(order_id: str) -> bool:
 
     try:
         logger.info(f"[LIVE] Cancelling: {order_id}")
-        get_auth_client().cancel(order_id)
-        return True
+        response = get_auth_client().cancel(order_id)
+        return order_id in _record_cancel_response(response)
     except Exception as e:
         logger.error(f"Cancel failed for {order_id}: {e}")
         return False
@@ -258,19 +543,36 @@ def cancel_all_orders(token_id: Optional[str] = None) -> int:
         return 0
 
     from src.client import get_auth_client
-    from src.orders import get_open_orders
 
     client = get_auth_client()
 
-    orders = get_open_orders(token_id)
-    cancelled = 0
+    # The open-orders listing can lag our own cancels, so skip ids the
+    # exchange confirmed cancelled moments ago; anything older is retried
+    cutoff = time.monotonic() - RECENTLY_CANCELLED_GRACE
+    orders = [
+        o for o in get_open_orders(token_id)
+        if _recently_cancelled.get(o.id, cutoff) <= cutoff
+    ]
+    if not orders:
+        return 0
 
-    for order in orders:
-        try:
-            client.cancel(order.id)
-            cancelled += 1
-        except Exception as e:
-            logger.warning(f"Failed to cancel {order.id}: {e}")
+    try:
+        # One request for the whole set
+        response = client.cancel_orders([order.id for order in orders])
+        cancelled = len(_record_cancel_response(response))
+    except Exception as e:
+        logger.warning(f"Batch cancel failed, cancelling individually: {e}")
+
+        def _safe_cancel(order) -> bool:
+            try:
+                return order.id in _record_cancel_response(client.cancel(order.id))
+            except Exception as e:
+                logger.warning(f"Failed to cancel {order.id}: {e}")
+                return False
+
+        # Cancels are independent round-trips; overlap them
+        with ThreadPoolExecutor(max_workers=CANCEL_WORKERS) as pool:
+            cancelled = sum(pool.map(_safe_cancel, orders))
 
     if cancelled:
         logger.info(f"[LIVE] Cancelled {cancelled} orders")
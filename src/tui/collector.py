@@ -4,9 +4,12 @@ State collector for TUI.
 Gathers data from all bot components into a BotState snapshot.
 """
 
+import asyncio
+import time
+from collections import deque
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional, List
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
 
 from src.tui.state import (
     BotState, BotMode, BotStatus,
@@ -14,8 +17,62 @@ from src.tui.state import (
     RiskState, FeedState, TradeRecord, SmartMMState
 )
 from src.config import DRY_RUN
+from src.models import Order, Trade
 from src.feed import FeedState as FeedStateEnum
 
+RECENT_TRADES_LIMIT = 5
+
+_ZERO = Decimal("0")
+_HALF = Decimal("0.5")
+
+# What a component read can raise while the bot is starting, stopping or
+# mid-update; anything else is a bug and should surface
+_COLLECT_ERRORS = (AttributeError, KeyError, TypeError, ValueError, ArithmeticError)
+
+# Status labels shown by the renderer
+_FEED_STATUS = {
+    FeedStateEnum.STOPPED: "STOPPED",
+    FeedStateEnum.STARTING: "STARTING",
+    FeedStateEnum.RUNNING: "RUNNING",
+    FeedStateEnum.ERROR: "ERROR",
+}
+_RISK_STATUS = {
+    0: "OK", 1: "WARNING", 2: "STOP",
+    "OK": "OK", "WARN": "WARNING", "STOP": "STOP",  # RiskStatus values
+}
+
+
+def _order_key(order: Optional[Order]) -> Optional[tuple]:
+    """Fields of a live order that show up in the TUI."""
+    if order is None or not order.is_live:
+        return None
+    return (order.id, order.price, order.size, order.filled, order.status)
+
+
+def _trade_record(trade: Trade, seen_at: datetime) -> TradeRecord:
+    """TUI record for a simulator trade."""
+    return TradeRecord(
+        timestamp=seen_at,  # Ideally parse from trade.timestamp
+        side=trade.side.value,
+        price=trade.price,
+        size=trade.size,
+        is_simulated=trade.is_simulated
+    )
+
+
+def _order_state(order: Optional[Order], side: str) -> Optional[OrderState]:
+    """TUI state for a market maker order, None unless live."""
+    if not order or not order.is_live:
+        return None
+    return OrderState(
+        order_id=order.id[:12] + "...",
+        side=side,
+        price=order.price,
+        size=order.size,
+        filled=order.filled,
+        status=order.status.value
+    )
+
 
 class StateCollector:
     """
@@ -33,54 +90,106 @@ class StateCollector:
 
     def __init__(self):
         self._feed = None
+        self._feed_store = None
         self._risk_manager = None
         self._market_maker = None
+        self._mm_has_orders = False
+        self._mm_has_smart = False
         self._simulator = None
         self._start_time: Optional[datetime] = None
+        self._start_monotonic: Optional[float] = None  # Uptime base, immune to clock changes
         self._status = BotStatus.STOPPED
 
+        # Set whenever something shown in the TUI may have changed since
+        # the last collect()
+        self._dirty = asyncio.Event()
+
         # Counters
         self._quotes_placed = 0
         self._quotes_cancelled = 0
 
+        # Running volume and recent trades (newest first) over simulator
+        # trades seen so far
+        self._total_volume = _ZERO
+        self._trades_seen = 0
+        self._recent_trades: Deque[TradeRecord] = deque(maxlen=RECENT_TRADES_LIMIT)
+        self._recent_trades_snapshot: Deque[TradeRecord] = self._recent_trades.copy()
+
+        # Last snapshot per section with the key it was built from
+        self._snapshots: Dict[str, Tuple[Any, Any]] = {}
+
         # Market info
         self._market_question = ""
+        self._market_question_display = ""
         self._token_id = ""
 
     def set_feed(self, feed):
         """Set the market feed instance."""
         self._feed = feed
+        self._snapshots.clear()
+        self._dirty.set()
+        self._feed_store = getattr(feed, '_data_store', None)
 
     def set_risk_manager(self, risk_manager):
         """Set the risk manager instance."""
         self._risk_manager = risk_manager
+        self._snapshots.clear()
+        self._dirty.set()
 
     def set_market_maker(self, market_maker):
         """Set the market maker instance."""
         self._market_maker = market_maker
+        self._mm_has_orders = hasattr(market_maker, 'bid_order') and hasattr(market_maker, 'ask_order')
+        self._mm_has_smart = hasattr(market_maker, '_last_state')
+        self._snapshots.clear()
+        self._dirty.set()
 
     def set_simulator(self, simulator):
         """Set the order simulator instance."""
         self._simulator = simulator
+        self._snapshots.clear()
+        self._dirty.set()
+        self._reset_trades()
 
     def set_market_info(self, token_id: str, question: str = ""):
         """Set market identification info."""
         self._token_id = token_id
         self._market_question = question
+        self._market_question_display = question[:60] + "..." if len(question) > 60 else question
+        self._snapshots.clear()
+        self._dirty.set()
+        self._reload_recent_trades()
 
     def set_status(self, status: BotStatus):
         """Set bot status."""
         self._status = status
         if status == BotStatus.RUNNING and self._start_time is None:
             self._start_time = datetime.now()
+            self._start_monotonic = time.monotonic()
+        self._dirty.set()
 
     def record_quote_placed(self):
         """Record a quote was placed."""
         self._quotes_placed += 1
+        self._dirty.set()
 
     def record_quote_cancelled(self):
         """Record a quote was cancelled."""
         self._quotes_cancelled += 1
+        self._dirty.set()
+
+    def mark_dirty(self, *_):
+        """Flag that state changed; usable directly as the feed change hook."""
+        self._dirty.set()
+
+    @property
+    def is_dirty(self) -> bool:
+        """True if state may have changed since the last collect()."""
+        return self._dirty.is_set()
+
+    async def wait_dirty(self):
+        """Wait until state changes after the last collect()."""
+        await self._dirty.wait()
 
     def collect(self) -> BotState:
         """
@@ -89,20 +198,26 @@ class StateCollector:
         Returns:
             BotState snapshot for rendering.
         """
+        self._dirty.clear()
+
+        # One wall-clock read per frame, shared by every section; uptime
+        # comes from the cheaper monotonic clock
+        now = datetime.now()
+        start = self._start_monotonic
+
         state = BotState(
             mode=BotMode.DRY_RUN if DRY_RUN else BotMode.LIVE,
             status=self._status,
+            uptime_seconds=time.monotonic() - start if start is not None else 0.0,
             start_time=self._start_time,
             quotes_placed=self._quotes_placed,
             quotes_cancelled=self._quotes_cancelled,
-            snapshot_time=datetime.now()
+            snapshot_time=now
         )
 
-        state.update_uptime()
-
         # Collect from feed
         if self._feed:
-            state.market = self._collect_market_state()
+            state.market = self._collect_market_state(now)
             state.feed = self._collect_feed_state()
 
         # Collect from risk manager
@@ -111,74 +226,109 @@ class StateCollector:
 
         # Collect from market maker
         if self._market_maker:
-            state.bid_order, state.ask_order = self._collect_order_state()
-            state.smart_mm = self._collect_smart_mm_state()
+            mm = self._market_maker
+            if self._mm_has_orders:
+                bid, ask = mm.bid_order, mm.ask_order
+                state.bid_order, state.ask_order = self._cached(
+                    "orders", (_order_key(bid), _order_key(ask)),
+                    lambda: self._collect_order_state(bid, ask))
+            if self._mm_has_smart:
+                # SmartMarketMaker replaces _last_state each cycle
+                last = mm._last_state
+                state.smart_mm = self._cached("smart_mm", (last,), lambda: self._collect_smart_mm_state(last))
 
         # Collect from simulator
         if self._simulator:
-            state.position = self._collect_position_state()
-            state.recent_trades = self._collect_recent_trades()
-            state.total_trades = len(self._simulator.trades)
-            state.total_volume = self._calculate_total_volume()
+            trades = self._simulator.trades
+            trades_key = (self._token_id, len(trades), trades[-1] if trades else None)
+            # Reuse this frame's market midpoint rather than asking the feed again
+            if self._feed:
+                mid = state.market.midpoint if state.market else None
+            else:
+                mid = _HALF
+            state.position = self._cached("position", trades_key + (mid,),
+                                          lambda: self._collect_position_state(mid))
+            state.total_volume, state.recent_trades = self._ingest_new_trades(now)
+            state.total_trades = self._trades_seen
 
         return state
 
-    def _collect_market_state(self) -> Optional[MarketState]:
+    def _cached(self, section: str, key: Any, build: Callable[[], Any]) -> Any:
+        """
+        Reuse a section's last snapshot while its source key is unchanged.
+
+        Snapshots are shared between frames, so renderers must not mutate them.
+        """
+        hit = self._snapshots.get(section)
+        if hit is not None and hit[0] == key:
+            return hit[1]
+        value = build()
+        self._snapshots[section] = (key, value)
+        return value
+
+    def _collect_market_state(self, now: Optional[datetime] = None) -> Optional[MarketState]:
         """Collect market data from feed."""
         if not self._feed or not self._token_id:
             return None
 
         try:
-            best_bid = self._feed.get_best_bid(self._token_id)
-            best_ask = self._feed.get_best_ask(self._token_id)
-            midpoint = self._feed.get_midpoint(self._token_id)
-
-            spread = None
-            spread_bps = None
-            if best_bid is not None and best_ask is not None:
-                spread = Decimal(str(best_ask)) - Decimal(str(best_bid))
-                if midpoint and midpoint > 0:
-                    spread_bps = float(spread / Decimal(str(midpoint)) * 10000)
-
-            return MarketState(
-                token_id=self._token_id,
-                market_question=self._market_question[:60] + "..." if len(self._market_question) > 60 else self._market_question,
-                best_bid=Decimal(str(best_bid)) if best_bid else None,
-                best_ask=Decimal(str(best_ask)) if best_ask else None,
-                midpoint=Decimal(str(midpoint)) if midpoint else None,
-                spread=spread,
-                spread_bps=spread_bps,
-                last_update=datetime.now()
-            )
-        except Exception:
+            quote = self._feed.get_quote(self._token_id)
+            market = self._cached("market", quote, lambda: self._build_market_state(*quote))
+        except _COLLECT_ERRORS:
             return None
 
+        # Reused while the quote is unchanged, but the data is current as
+        # of this frame
+        market.last_update = now or datetime.now()
+        return market
+
+    def _build_market_state(
+        self,
+        best_bid: Optional[float],
+        best_ask: Optional[float],
+        midpoint: Optional[float]
+    ) -> MarketState:
+        """Build market state from a feed quote."""
+        # Feed prices are floats: parse each into Decimal once
+        bid = Decimal(str(best_bid)) if best_bid else None
+        ask = Decimal(str(best_ask)) if best_ask else None
+        mid = Decimal(str(midpoint)) if midpoint else None
+
+        spread = None
+        spread_bps = None
+        if bid is not None and ask is not None:
+            spread = ask - bid
+            if midpoint and midpoint > 0:
+                spread_bps = (best_ask - best_bid) / midpoint * 10000.0
+
+        return MarketState(
+            token_id=self._token_id,
+            market_question=self._market_question_display,
+            best_bid=bid,
+            best_ask=ask,
+            midpoint=mid,
+            spread=spread,
+            spread_bps=spread_bps
+        )
+
     def _collect_feed_state(self) -> FeedState:
         """Collect feed health state."""
         if not self._feed:
             return FeedState()
 
         try:
-            feed_state = self._feed.state
-            status_map = {
-                FeedStateEnum.STOPPED: "STOPPED",
-                FeedStateEnum.STARTING: "STARTING",
-                FeedStateEnum.RUNNING: "RUNNING",
-                FeedStateEnum.ERROR: "ERROR",
-            }
-
             last_msg_ago = 0.0
-            if hasattr(self._feed, '_data_store'):
-                last_msg_ago = self._feed._data_store.seconds_since_any_message()
+            if self._feed_store is not None:
+                last_msg_ago = self._feed_store.seconds_since_any_message()
 
             return FeedState(
-                status=status_map.get(feed_state, "UNKNOWN"),
+                status=_FEED_STATUS.get(self._feed.state, "UNKNOWN"),
                 data_source=getattr(self._feed, '_data_source', 'unknown'),
                 is_healthy=self._feed.is_healthy,
                 last_message_ago=last_msg_ago if last_msg_ago != float('inf') else 999,
                 reconnect_count=getattr(self._feed, '_reconnect_count', 0)
             )
-        except Exception:
+        except _COLLECT_ERRORS:
             return FeedState(status="ERROR")
 
     def _collect_risk_state(self) -> RiskState:
@@ -188,145 +338,111 @@ class StateCollector:
 
         try:
             rm = self._risk_manager
-            status_map = {
-                0: "OK",      # RiskStatus.OK
-                1: "WARNING", # RiskStatus.WARNING
-                2: "STOP",    # RiskStatus.STOP
-            }
 
             return RiskState(
                 daily_pnl=rm.daily_pnl,
                 daily_loss_limit=rm.max_daily_loss,
                 position_limit=rm.max_position,
-                current_position=Decimal("0"),  # Updated below
+                current_position=_ZERO,  # Updated below
                 error_count=len(rm._errors),
                 kill_switch_active=rm.is_killed,
-                risk_status=status_map.get(rm._last_status.value if hasattr(rm, '_last_status') else 0, "OK"),
+                risk_status=_RISK_STATUS.get(rm._last_status.value if hasattr(rm, '_last_status') else 0, "OK"),
                 enforce_mode=rm.enforce
             )
-        except Exception:
+        except _COLLECT_ERRORS:
             return RiskState()
 
-    def _collect_order_state(self) -> tuple:
-        """Collect active order state from market maker."""
-        bid_order = None
-        ask_order = None
-
-        if not self._market_maker:
-            return bid_order, ask_order
-
-        try:
-            mm = self._market_maker
+    def _collect_order_state(
+        self, bid: Optional[Order], ask: Optional[Order]
+    ) -> Tuple[Optional[OrderState], Optional[OrderState]]:
+        """Collect active order state from the market maker's orders."""
+        return _order_state(bid, "BUY"), _order_state(ask, "SELL")
 
-            if hasattr(mm, 'bid_order') and mm.bid_order and mm.bid_order.is_live:
-                o = mm.bid_order
-                bid_order = OrderState(
-                    order_id=o.id[:12] + "...",
-                    side="BUY",
-                    price=o.price,
-                    size=o.size,
-                    filled=o.filled,
-                    status=o.status.value
-                )
-
-            if hasattr(mm, 'ask_order') and mm.ask_order and mm.ask_order.is_live:
-                o = mm.ask_order
-                ask_order = OrderState(
-                    order_id=o.id[:12] + "...",
-                    side="SELL",
-                    price=o.price,
-                    size=o.size,
-                    filled=o.filled,
-                    status=o.status.value
-                )
-        except Exception:
-            pass
-
-        return bid_order, ask_order
-
-    def _collect_smart_mm_state(self) -> Optional[SmartMMState]:
+    def _collect_smart_mm_state(self, s) -> Optional[SmartMMState]:
         """Collect SmartMarketMaker state if available."""
-        if not self._market_maker:
+        if s is None:
             return None
 
-        try:
-            mm = self._market_maker
-            # Check if this is a SmartMarketMaker with _last_state
-            if not hasattr(mm, '_last_state') or mm._last_state is None:
-                return None
-
-            s = mm._last_state
-            return SmartMMState(
-                base_spread=s.base_spread,
-                vol_multiplier=s.vol_multiplier,
-                inv_multiplier=s.inv_multiplier,
-                final_spread=s.final_spread,
-                volatility_level=s.volatility_level,
-                realized_vol=s.realized_vol,
-                inventory_pct=s.inventory_pct,
-                inventory_level=s.inventory_level,
-                bid_skew=s.bid_skew,
-                ask_skew=s.ask_skew,
-                imbalance_signal=s.imbalance_signal,
-                imbalance_adjustment=s.imbalance_adjustment,
-                unrealized_pnl=s.unrealized_pnl,
-                vwap_entry=s.vwap_entry,
-            )
-        except Exception:
-            return None
+        return SmartMMState(
+            base_spread=s.base_spread,
+            vol_multiplier=s.vol_multiplier,
+            inv_multiplier=s.inv_multiplier,
+            final_spread=s.final_spread,
+            volatility_level=s.volatility_level,
+            realized_vol=s.realized_vol,
+            inventory_pct=s.inventory_pct,
+            inventory_level=s.inventory_level,
+            bid_skew=s.bid_skew,
+            ask_skew=s.ask_skew,
+            imbalance_signal=s.imbalance_signal,
+            imbalance_adjustment=s.imbalance_adjustment,
+            unrealized_pnl=s.unrealized_pnl,
+            vwap_entry=s.vwap_entry,
+        )
 
-    def _collect_position_state(self) -> Optional[PositionState]:
+    def _collect_position_state(self, mid: Optional[Decimal]) -> Optional[PositionState]:
         """Collect position and P&L from simulator."""
         if not self._simulator or not self._token_id:
             return None
 
-        try:
-            sim = self._simulator
-            position = sim.get_position(self._token_id)
-
-            pnl_data = sim.get_pnl(self._token_id,
-                                   self._feed.get_midpoint(self._token_id) if self._feed else Decimal("0.5"))
-
-            return PositionState(
-                token_id=self._token_id,
-                position=position,
-                entry_price=pnl_data.get('avg_entry_price'),
-                current_price=pnl_data.get('current_price'),
-                unrealized_pnl=pnl_data.get('unrealized_pnl', Decimal("0")),
-                realized_pnl=pnl_data.get('realized_pnl', Decimal("0"))
+        pnl_data = self._simulator.get_position_and_pnl(self._token_id, mid)
+
+        return PositionState(
+            token_id=self._token_id,
+            position=pnl_data['position'],
+            entry_price=pnl_data.get('avg_entry_price'),
+            current_price=pnl_data.get('current_price'),
+            unrealized_pnl=pnl_data.get('unrealized_pnl', _ZERO),
+            realized_pnl=pnl_data.get('realized_pnl', _ZERO)
+        )
+
+    def _reset_trades(self):
+        """Forget all trade-derived totals."""
+        self._total_volume = _ZERO
+        self._trades_seen = 0
+        self._recent_trades.clear()
+        self._recent_trades_snapshot = self._recent_trades.copy()
+
+    def _reload_recent_trades(self):
+        """Rebuild recent trades for the current token from trades already seen."""
+        self._recent_trades.clear()
+        if self._simulator:
+            seen = self._simulator.trades[:self._trades_seen]
+            now = datetime.now()
+            self._recent_trades.extendleft(
+                _trade_record(t, now) for t in seen if t.token_id == self._token_id
             )
-        except Exception:
-            return PositionState(token_id=self._token_id)
+        self._recent_trades_snapshot = self._recent_trades.copy()
 
-    def _collect_recent_trades(self, limit: int = 5) -> List[TradeRecord]:
-        """Collect recent trades from simulator."""
-        if not self._simulator:
-            return []
+    def _ingest_new_trades(
+        self, now: Optional[datetime] = None
+    ) -> Tuple[Decimal, Deque[TradeRecord]]:
+        """
+        Fold trades added since the last call into total volume and recent trades.
 
-        try:
-            trades = self._simulator.get_trades(self._token_id)[-limit:]
-            return [
-                TradeRecord(
-                    timestamp=datetime.now(),  # Ideally parse from trade.timestamp
-                    side=t.side.value,
-                    price=t.price,
-                    size=t.size,
-                    is_simulated=t.is_simulated
-                )
-                for t in trades
-            ]
-        except Exception:
-            return []
-
-    def _calculate_total_volume(self) -> Decimal:
-        """Calculate total traded volume."""
+        Returns:
+            (total traded volume, recent trades snapshot)
+        """
         if not self._simulator:
-            return Decimal("0")
+            return _ZERO, self._recent_trades_snapshot
 
-        try:
-            return sum((t.size * t.price for t in self._simulator.trades), Decimal("0"))
-        except Exception:
-            return Decimal("0")
+        trades = self._simulator.trades
+        if len(trades) < self._trades_seen:
+            # Simulator was reset
+            self._reset_trades()
+
+        new_recent = False
+        for t in trades[self._trades_seen:]:
+            self._total_volume += t.size * t.price
+            if t.token_id == self._token_id:
+                self._recent_trades.appendleft(_trade_record(t, now or datetime.now()))
+                new_recent = True
+        self._trades_seen = len(trades)
+
+        if new_recent:
+            self._recent_trades_snapshot = self._recent_trades.copy()
+
+        return self._total_volume, self._recent_trades_snapshot
 
 
 # Global collector instance
@@ -4,9 +4,13 @@ TUI renderer using rich library.
 Renders BotState to terminal with live updates.
 """
 
+import json
+import time
+from contextlib import nullcontext
 from datetime import datetime
+from functools import lru_cache
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Callable, ContextManager, Dict, Optional, Tuple
 
 from rich.console import Console, Group
 from rich.layout import Layout
@@ -18,6 +22,199 @@ from rich.style import Style
 from rich import box
 
 from src.tui.state import BotState, BotStatus, BotMode
+from src.utils import setup_logging
+
+logger = setup_logging()
+
+# Seconds between state log lines when stdout is not a terminal
+LOG_INTERVAL = 5.0
+
+_SECTIONS = ("header", "market", "orders", "trades", "position", "risk", "feed", "footer")
+
+# Style tables, parsed once at import rather than per frame
+_DIM = Style.parse("dim")
+_DIM_ITALIC = Style.parse("dim italic")
+
+_STATUS_STYLES = {
+    BotStatus.STOPPED: Style.parse("red"),
+    BotStatus.STARTING: Style.parse("yellow"),
+    BotStatus.RUNNING: Style.parse("green"),
+    BotStatus.PAUSED: Style.parse("yellow"),
+    BotStatus.ERROR: Style.parse("red bold"),
+}
+_STATUS_DEFAULT = Style.parse("white")
+
+_MODE_STYLES = {
+    BotMode.DRY_RUN: Style.parse("cyan"),
+    BotMode.LIVE: Style.parse("red bold"),
+}
+
+_VOL_STYLES = {
+    "LOW": Style.parse("green"),
+    "NORMAL": Style.parse("blue"),
+    "HIGH": Style.parse("yellow"),
+    "EXTREME": Style.parse("red bold"),
+}
+_IMBAL_STYLES = {
+    "BID_HEAVY": (Style.parse("green"), "↑"),
+    "ASK_HEAVY": (Style.parse("red"), "↓"),
+    "BALANCED": (_DIM, "="),
+}
+_IMBAL_DEFAULT = (_DIM, "?")
+_INV_STYLES = {
+    "NEUTRAL": Style.parse("blue"),
+    "LONG": Style.parse("green"),
+    "SHORT": Style.parse("red"),
+    "MAX_LONG": Style.parse("green bold"),
+    "MAX_SHORT": Style.parse("red bold"),
+}
+
+_RISK_STYLES = {
+    "OK": (Style.parse("green"), "✓"),
+    "WARNING": (Style.parse("yellow"), "⚠"),
+    "STOP": (Style.parse("red bold"), "✗"),
+}
+_RISK_DEFAULT = (_DIM, "?")
+
+_FEED_STATUS_STYLES = {
+    "STOPPED": Style.parse("red"),
+    "STARTING": Style.parse("yellow"),
+    "RUNNING": Style.parse("green"),
+    "ERROR": Style.parse("red bold"),
+}
+
+_BAR_STYLES = ("green", "yellow", "red")
+
+# Constant cells, shared by every frame (Rich renders Text without mutating it)
+_STARTING = Text("Starting...", style=_DIM)
+_NO_MARKET = Text("No market data", style=_DIM)
+_NO_TRADES = Text("No trades yet", style=_DIM)
+_NO_POSITION = Text("No position", style=_DIM)
+_NO_VALUE = Text("—", style=_DIM)
+
+_BUY_LIVE = Text("BUY", style=Style.parse("green bold"))
+_BUY_NONE = Text("BUY", style=_DIM)
+_SELL_LIVE = Text("SELL", style=Style.parse("red bold"))
+_SELL_NONE = Text("SELL", style=_DIM)
+_ORDER_NONE = Text("NONE", style=_DIM)
+_ORDER_LIVE = Text("LIVE", style=Style.parse("green"))
+
+_TRADE_SIDES = {
+    "BUY": Text("BUY", style=Style.parse("green")),
+    "SELL": Text("SELL", style=Style.parse("red")),
+}
+
+_MODE_ENFORCE = Text("ENFORCE", style=Style.parse("yellow"))
+_MODE_GATHER = Text("DATA_GATHER", style=Style.parse("cyan"))
+_KILL_ACTIVE = Text("🔴 ACTIVE", style=Style.parse("red bold blink"))
+_KILL_OFF = Text("🟢 OFF", style=Style.parse("green"))
+_HEALTHY = Text("✓ Yes", style=Style.parse("green"))
+_UNHEALTHY = Text("✗ No", style=Style.parse("red"))
+
+
+def _state_summary(state: BotState) -> Dict[str, Any]:
+    """Flat summary of a state snapshot for log-mode output."""
+    m, p, r, f = state.market, state.position, state.risk, state.feed
+    return {
+        "status": state.status.value,
+        "mode": state.mode.value,
+        "uptime": int(state.uptime_seconds),
+        "bid": m.best_bid if m else None,
+        "ask": m.best_ask if m else None,
+        "mid": m.midpoint if m else None,
+        "position": p.position if p else None,
+        "pnl": p.total_pnl if p else None,
+        "risk": r.risk_status,
+        "kill_switch": r.kill_switch_active,
+        "feed": f.status,
+        "feed_healthy": f.is_healthy,
+        "trades": state.total_trades,
+        "quotes_placed": state.quotes_placed,
+        "quotes_cancelled": state.quotes_cancelled,
+    }
+
+
+def _order_status(status: str) -> Text:
+    return _ORDER_LIVE if status == "LIVE" else Text(status, style=_DIM)
+
+
+@lru_cache(maxsize=512)
+def _bar_text(filled: int, empty: int, percent: int, style: str) -> Text:
+    """Progress bar text; bars only take a few hundred distinct shapes, so each is built once."""
+    bar = Text()
+    bar.append("█" * filled, style=style)
+    bar.append("░" * empty, style=_DIM)
+    bar.append(f" {percent}%", style=style)
+    return bar
+
+
+# Panel titles as (style, label); the glyph in front depends on the terminal
+_TITLES = {
+    "header": ("bold blue", "Polymarket Market Maker"),
+    "market": ("bold", "Market"),
+    "orders": ("bold", "Active Orders"),
+    "trades": ("bold", "Recent Trades"),
+    "position": ("bold", "Position & P&L"),
+    "risk": ("bold", "Risk"),
+    "feed": ("bold", "Feed"),
+}
+
+_UNICODE_GLYPHS = {
+    "header": "🤖", "market": "📊", "orders": "📝", "trades": "💰",
+    "position": "💼", "risk": "⚠️", "feed": "📡",
+    "status": "◉", "separator": "│", "uptime": "⏱",
+}
+_ASCII_GLYPHS = {
+    "header": "[BOT]", "market": "[MKT]", "orders": "[ORD]", "trades": "[TRD]",
+    "position": "[POS]", "risk": "[RSK]", "feed": "[FEED]",
+    "status": "*", "separator": "|", "uptime": "up",
+}
+
+
+# Panel cache keys: what each _render_* method reads. A panel is rebuilt
+# only when its key changes.
+#
+# Market, smart MM, order and position sections are keyed on the state
+# objects themselves. The collector hands back the same object while a
+# section is unchanged, so the comparison is usually an identity check;
+# fresh but equal objects still compare equal field by field.
+
+def _header_key(state: BotState) -> Any:
+    return (state.status, state.mode, int(state.uptime_seconds))
+
+
+def _market_key(state: BotState) -> Any:
+    return (state.market, state.smart_mm)
+
+
+def _orders_key(state: BotState) -> Any:
+    return (state.bid_order, state.ask_order, state.quotes_placed, state.quotes_cancelled)
+
+
+def _trades_key(state: BotState) -> Any:
+    trades = state.recent_trades
+    return (id(trades[0]) if trades else None, len(trades), state.total_trades)
+
+
+def _position_key(state: BotState) -> Any:
+    return state.position
+
+
+def _risk_key(state: BotState) -> Any:
+    r = state.risk
+    return (
+        r.risk_status, r.enforce_mode, r.daily_pnl, r.daily_loss_limit,
+        r.current_position, r.position_limit, r.kill_switch_active
+    )
+
+
+def _feed_key(state: BotState) -> Any:
+    f = state.feed
+    return (f.status, f.data_source, f.is_healthy, round(f.last_message_ago, 1), f.reconnect_count)
+
+
+def _footer_key(state: BotState) -> Any:
+    return (state.total_volume, state.total_trades, state.snapshot_time.replace(microsecond=0))
 
 
 class TUIRenderer:
@@ -39,14 +236,60 @@ class TUIRenderer:
         self.refresh_rate = refresh_rate
         self._live: Optional[Live] = None
 
-    def live_context(self) -> Live:
-        """Get live display context manager."""
+        # Without a terminal (pipes, CI, containers) skip Rich entirely and
+        # log a state summary every LOG_INTERVAL seconds instead
+        self.interactive = self.console.is_terminal
+        self._last_log = float("-inf")
+
+        # Frames are pushed to the terminal only when a panel changed, at
+        # most refresh_rate times a second
+        self._min_refresh_interval = 1.0 / refresh_rate
+        self._last_refresh = 0.0
+        self._stale = True
+
+        # Emoji titles turn into noise on terminals that can't encode them
+        glyphs = _UNICODE_GLYPHS if self.console.encoding.startswith("utf") else _ASCII_GLYPHS
+        self._glyphs = glyphs
+        self._separator = f"  {glyphs['separator']}  "
+        self._uptime = (glyphs["uptime"] + " {:02d}:{:02d}:{:02d}").format
+        self._titles = {
+            name: Text(f"{glyphs[name]} {label}", style=style)
+            for name, (style, label) in _TITLES.items()
+        }
+        self._smart_market_title = Text.assemble(self._titles["market"], " ", ("(SMART)", "cyan"))
+
+        # Layout tree is static; keep direct handles to the leaf regions
+        # so each frame only swaps their contents.
+        self._layout = self._build_layout()
+        self._sections = {name: self._layout[name] for name in _SECTIONS}
+
+        # section -> (key, panel) for the last panel built
+        self._panel_cache: Dict[str, Tuple[Any, Panel]] = {}
+        self._panels: Tuple[Tuple[str, Callable[[BotState], Any], Callable[[BotState], Panel]], ...] = (
+            ("header", _header_key, self._render_header),
+            ("market", _market_key, self._render_market),
+            ("orders", _orders_key, self._render_orders),
+            ("trades", _trades_key, self._render_trades),
+            ("position", _position_key, self._render_position),
+            ("risk", _risk_key, self._render_risk),
+            ("feed", _feed_key, self._render_feed),
+            ("footer", _footer_key, self._render_footer),
+        )
+
+    def live_context(self) -> ContextManager:
+        """Get live display context manager (a no-op without a terminal)."""
+        if not self.interactive:
+            return nullcontext()
+
+        # No auto refresh: redrawing an unchanged dashboard on a timer is
+        # the bulk of the TUI's idle CPU. update() refreshes on change.
         self._live = Live(
             self._render_empty(),
             console=self.console,
-            refresh_per_second=self.refresh_rate,
+            auto_refresh=False,
             screen=True
         )
+        self._stale = True
         return self._live
 
     def stop(self):
@@ -56,20 +299,41 @@ class TUIRenderer:
             self._live = None
 
     def update(self, state: BotState):
-        """Update display with new state."""
-        if self._live:
-            self._live.update(self._render(state))
+        """Update display with new state, redrawing only if something changed."""
+        if not self.interactive:
+            self._log_state(state)
+            return
+
+        if not self._live:
+            return
+
+        if self._apply(state):
+            self._stale = True
+
+        now = time.monotonic()
+        if self._stale and now - self._last_refresh >= self._min_refresh_interval:
+            self._live.update(self._layout, refresh=True)
+            self._last_refresh = now
+            self._stale = False
+
+    def _log_state(self, state: BotState):
+        """Log a one-line JSON summary, at most every LOG_INTERVAL seconds."""
+        now = time.monotonic()
+        if now - self._last_log < LOG_INTERVAL:
+            return
+        self._last_log = now
+        logger.info(json.dumps(_state_summary(state), default=str))
 
     def _render_empty(self) -> Panel:
         """Render empty/loading state."""
         return Panel(
-            Text("Starting...", style="dim"),
+            _STARTING,
             title="[bold blue]Polymarket MM Bot[/]",
             border_style="blue"
         )
 
-    def _render(self, state: BotState) -> Layout:
-        """Render complete dashboard."""
+    def _build_layout(self) -> Layout:
+        """Build the dashboard layout skeleton once; panels are swapped in per frame."""
         layout = Layout()
 
         # Create main sections
@@ -99,51 +363,56 @@ class TUIRenderer:
             Layout(name="feed")
         )
 
-        # Render each section
-        layout["header"].update(self._render_header(state))
-        layout["market"].update(self._render_market(state))
-        layout["orders"].update(self._render_orders(state))
-        layout["trades"].update(self._render_trades(state))
-        layout["position"].update(self._render_position(state))
-        layout["risk"].update(self._render_risk(state))
-        layout["feed"].update(self._render_feed(state))
-        layout["footer"].update(self._render_footer(state))
-
         return layout
 
+    def _render(self, state: BotState) -> Layout:
+        """Render complete dashboard into the cached layout."""
+        self._apply(state)
+        return self._layout
+
+    def _apply(self, state: BotState) -> bool:
+        """
+        Rebuild the panels whose inputs changed.
+
+        Returns:
+            True if any section of the layout was updated
+        """
+        cache = self._panel_cache
+        sections = self._sections
+        changed = False
+
+        for name, key_fn, render in self._panels:
+            key = key_fn(state)
+            cached = cache.get(name)
+            if cached is not None and cached[0] == key:
+                continue
+            panel = render(state)
+            cache[name] = (key, panel)
+            sections[name].update(panel)
+            changed = True
+
+        return changed
+
     def _render_header(self, state: BotState) -> Panel:
         """Render header with bot status."""
-        # Status color
-        status_colors = {
-            BotStatus.STOPPED: "red",
-            BotStatus.STARTING: "yellow",
-            BotStatus.RUNNING: "green",
-            BotStatus.PAUSED: "yellow",
-            BotStatus.ERROR: "red bold"
-        }
-        status_color = status_colors.get(state.status, "white")
-
-        # Mode badge
-        mode_style = "cyan" if state.mode == BotMode.DRY_RUN else "red bold"
-        mode_text = f"[{mode_style}]{state.mode.value}[/]"
+        status_style = _STATUS_STYLES.get(state.status, _STATUS_DEFAULT)
 
         # Uptime
-        hours = int(state.uptime_seconds // 3600)
-        minutes = int((state.uptime_seconds % 3600) // 60)
-        seconds = int(state.uptime_seconds % 60)
-        uptime = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-
-        header = Text()
-        header.append("◉ ", style=status_color)
-        header.append(state.status.value, style=status_color)
-        header.append("  │  ", style="dim")
-        header.append_text(Text.from_markup(mode_text))
-        header.append("  │  ", style="dim")
-        header.append(f"⏱ {uptime}", style="dim")
+        seconds = int(state.uptime_seconds)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+
+        sep = self._separator
+        header = Text.assemble(
+            (f"{self._glyphs['status']} {state.status.value}", status_style),
+            (sep, _DIM),
+            (state.mode.value, _MODE_STYLES[state.mode]),
+            (sep + self._uptime(hours, minutes, seconds), _DIM)
+        )
 
         return Panel(
             header,
-            title="[bold blue]🤖 Polymarket Market Maker[/]",
+            title=self._titles["header"],
             border_style="blue"
         )
 
@@ -151,8 +420,8 @@ class TUIRenderer:
         """Render market data panel with smart MM metrics if available."""
         if not state.market:
             return Panel(
-                Text("No market data", style="dim"),
-                title="[bold]📊 Market[/]",
+                _NO_MARKET,
+                title=self._titles["market"],
                 border_style="dim"
             )
 
@@ -166,15 +435,16 @@ class TUIRenderer:
         table.add_row("Market", Text(m.market_question, style="bold"))
         table.add_row("", "")
 
-        # Prices
+        # Prices (display only, so values go through float: Decimal.__format__
+        # is far slower and 4dp needs none of its precision)
         bid_style = "green" if m.best_bid else "dim"
         ask_style = "red" if m.best_ask else "dim"
         mid_style = "yellow" if m.midpoint else "dim"
 
-        table.add_row("Best Bid", Text(f"${m.best_bid:.4f}" if m.best_bid else "—", style=bid_style))
-        table.add_row("Best Ask", Text(f"${m.best_ask:.4f}" if m.best_ask else "—", style=ask_style))
-        table.add_row("Midpoint", Text(f"${m.midpoint:.4f}" if m.midpoint else "—", style=mid_style))
-        table.add_row("Spread", Text(f"${m.spread:.4f} ({m.spread_bps:.1f} bps)" if m.spread else "—", style="cyan"))
+        table.add_row("Best Bid", Text(f"${float(m.best_bid):.4f}" if m.best_bid else "—", style=bid_style))
+        table.add_row("Best Ask", Text(f"${float(m.best_ask):.4f}" if m.best_ask else "—", style=ask_style))
+        table.add_row("Midpoint", Text(f"${float(m.midpoint):.4f}" if m.midpoint else "—", style=mid_style))
+        table.add_row("Spread", Text(f"${float(m.spread):.4f} ({m.spread_bps:.1f} bps)" if m.spread else "—", style="cyan"))
 
         # Smart MM metrics (if available)
         if state.smart_mm:
@@ -182,36 +452,33 @@ class TUIRenderer:
             table.add_row("", "")
 
             # Dynamic spread
-            spread_info = f"${s.final_spread:.3f}"
+            spread_info = f"${float(s.final_spread):.3f}"
             if s.vol_multiplier != 1.0 or s.inv_multiplier != 1.0:
                 spread_info += f" ({s.spread_description})"
             table.add_row("Our Spread", Text(spread_info, style="cyan bold"))
 
             # Volatility indicator
-            vol_styles = {"LOW": "green", "NORMAL": "blue", "HIGH": "yellow", "EXTREME": "red bold"}
-            vol_style = vol_styles.get(s.volatility_level, "dim")
+            vol_style = _VOL_STYLES.get(s.volatility_level, _DIM)
             vol_text = f"{s.volatility_level} ({s.realized_vol:.1%})" if s.realized_vol > 0 else s.volatility_level
             table.add_row("Volatility", Text(vol_text, style=vol_style))
 
             # Imbalance arrow
-            imbal_styles = {"BID_HEAVY": ("green", "↑"), "ASK_HEAVY": ("red", "↓"), "BALANCED": ("dim", "=")}
-            imbal_style, imbal_icon = imbal_styles.get(s.imbalance_signal, ("dim", "?"))
+            imbal_style, imbal_icon = _IMBAL_STYLES.get(s.imbalance_signal, _IMBAL_DEFAULT)
             table.add_row("Imbalance", Text(f"{imbal_icon} {s.imbalance_signal}", style=imbal_style))
 
             # Inventory
-            inv_styles = {"NEUTRAL": "blue", "LONG": "green", "SHORT": "red", "MAX_LONG": "green bold", "MAX_SHORT": "red bold"}
-            inv_style = inv_styles.get(s.inventory_level, "dim")
+            inv_style = _INV_STYLES.get(s.inventory_level, _DIM)
             inv_text = f"{s.inventory_level} ({s.inventory_pct:+.0f}%)"
             table.add_row("Inventory", Text(inv_text, style=inv_style))
 
             # Skews
             if s.bid_skew != 0 or s.ask_skew != 0:
-                skew_text = f"bid:{s.bid_skew:+.3f} ask:{s.ask_skew:+.3f}"
+                skew_text = f"bid:{float(s.bid_skew):+.3f} ask:{float(s.ask_skew):+.3f}"
                 table.add_row("Skew", Text(skew_text, style="yellow"))
 
         return Panel(
             table,
-            title="[bold]📊 Market[/]" + (" [cyan](SMART)[/]" if state.smart_mm else ""),
+            title=self._smart_market_title if state.smart_mm else self._titles["market"],
             border_style="blue"
         )
 
@@ -227,40 +494,40 @@ class TUIRenderer:
         if state.bid_order:
             o = state.bid_order
             table.add_row(
-                Text("BUY", style="green bold"),
-                f"${o.price:.4f}",
-                f"{o.size:.2f}",
-                f"{o.filled:.2f} ({o.fill_pct:.0f}%)",
-                Text(o.status, style="green" if o.status == "LIVE" else "dim")
+                _BUY_LIVE,
+                f"${float(o.price):.4f}",
+                f"{float(o.size):.2f}",
+                f"{float(o.filled):.2f} ({o.fill_pct:.0f}%)",
+                _order_status(o.status)
             )
         else:
             table.add_row(
-                Text("BUY", style="dim"),
+                _BUY_NONE,
                 "—", "—", "—",
-                Text("NONE", style="dim")
+                _ORDER_NONE
             )
 
         if state.ask_order:
             o = state.ask_order
             table.add_row(
-                Text("SELL", style="red bold"),
-                f"${o.price:.4f}",
-                f"{o.size:.2f}",
-                f"{o.filled:.2f} ({o.fill_pct:.0f}%)",
-                Text(o.status, style="green" if o.status == "LIVE" else "dim")
+                _SELL_LIVE,
+                f"${float(o.price):.4f}",
+                f"{float(o.size):.2f}",
+                f"{float(o.filled):.2f} ({o.fill_pct:.0f}%)",
+                _order_status(o.status)
             )
         else:
             table.add_row(
-                Text("SELL", style="dim"),
+                _SELL_NONE,
                 "—", "—", "—",
-                Text("NONE", style="dim")
+                _ORDER_NONE
             )
 
         subtitle = f"Placed: {state.quotes_placed} │ Cancelled: {state.quotes_cancelled}"
 
         return Panel(
             table,
-            title="[bold]📝 Active Orders[/]",
+            title=self._titles["orders"],
             subtitle=subtitle,
             border_style="blue"
         )
@@ -269,8 +536,8 @@ class TUIRenderer:
         """Render recent trades panel."""
         if not state.recent_trades:
             return Panel(
-                Text("No trades yet", style="dim"),
-                title="[bold]💰 Recent Trades[/]",
+                _NO_TRADES,
+                title=self._titles["trades"],
                 border_style="dim"
             )
 
@@ -280,18 +547,18 @@ class TUIRenderer:
         table.add_column("Price", justify="right", width=10)
         table.add_column("Size", justify="right", width=8)
 
-        for trade in reversed(state.recent_trades[-5:]):
-            side_style = "green" if trade.side == "BUY" else "red"
+        for trade in state.recent_trades:
+            side = _TRADE_SIDES.get(trade.side) or Text(trade.side, style="red")
             table.add_row(
-                trade.timestamp.strftime("%H:%M:%S"),
-                Text(trade.side, style=side_style),
-                f"${trade.price:.4f}",
-                f"{trade.size:.2f}"
+                trade.timestamp_str,
+                side,
+                f"${float(trade.price):.4f}",
+                f"{float(trade.size):.2f}"
             )
 
         return Panel(
             table,
-            title=f"[bold]💰 Recent Trades[/] ({state.total_trades} total)",
+            title=self._titles["trades"] + f" ({state.total_trades} total)",
             border_style="blue"
         )
 
@@ -299,8 +566,8 @@ class TUIRenderer:
         """Render position and P&L panel."""
         if not state.position:
             return Panel(
-                Text("No position", style="dim"),
-                title="[bold]💼 Position & P&L[/]",
+                _NO_POSITION,
+                title=self._titles["position"],
                 border_style="dim"
             )
 
@@ -312,29 +579,30 @@ class TUIRenderer:
 
         # Position
         pos_style = "green" if p.position > 0 else ("red" if p.position < 0 else "dim")
-        pos_text = f"{p.position:+.2f}" if p.position != 0 else "0.00"
+        pos_text = f"{float(p.position):+.2f}" if p.position != 0 else "0.00"
         table.add_row("Position", Text(pos_text, style=pos_style))
 
         # Entry price
         if p.entry_price:
-            table.add_row("Avg Entry", f"${p.entry_price:.4f}")
+            table.add_row("Avg Entry", f"${float(p.entry_price):.4f}")
 
         # P&L
         table.add_row("", "")
 
         unreal_style = "green" if p.unrealized_pnl > 0 else ("red" if p.unrealized_pnl < 0 else "dim")
-        table.add_row("Unrealized", Text(f"${p.unrealized_pnl:+.2f}", style=unreal_style))
+        table.add_row("Unrealized", Text(f"${float(p.unrealized_pnl):+.2f}", style=unreal_style))
 
         real_style = "green" if p.realized_pnl > 0 else ("red" if p.realized_pnl < 0 else "dim")
-        table.add_row("Realized", Text(f"${p.realized_pnl:+.2f}", style=real_style))
+        table.add_row("Realized", Text(f"${float(p.realized_pnl):+.2f}", style=real_style))
 
-        total_style = "green bold" if p.total_pnl > 0 else ("red bold" if p.total_pnl < 0 else "dim")
-        table.add_row("Total P&L", Text(f"${p.total_pnl:+.2f}", style=total_style))
+        total_pnl = p.total_pnl
+        total_style = "green bold" if total_pnl > 0 else ("red bold" if total_pnl < 0 else "dim")
+        table.add_row("Total P&L", Text(f"${float(total_pnl):+.2f}", style=total_style))
 
         return Panel(
             table,
-            title="[bold]💼 Position & P&L[/]",
-            border_style="green" if p.total_pnl >= 0 else "red"
+            title=self._titles["position"],
+            border_style="green" if total_pnl >= 0 else "red"
         )
 
     def _render_risk(self, state: BotState) -> Panel:
@@ -342,12 +610,7 @@ class TUIRenderer:
         r = state.risk
 
         # Status indicator
-        status_styles = {
-            "OK": ("green", "✓"),
-            "WARNING": ("yellow", "⚠"),
-            "STOP": ("red bold", "✗")
-        }
-        status_style, status_icon = status_styles.get(r.risk_status, ("dim", "?"))
+        status_style, status_icon = _RISK_STYLES.get(r.risk_status, _RISK_DEFAULT)
 
         table = Table(box=box.SIMPLE, show_header=False, padding=(0, 1))
         table.add_column("Label", style="dim")
@@ -355,13 +618,13 @@ class TUIRenderer:
 
         # Status
         table.add_row("Status", Text(f"{status_icon} {r.risk_status}", style=status_style))
-        table.add_row("Mode", Text("ENFORCE" if r.enforce_mode else "DATA_GATHER", style="yellow" if r.enforce_mode else "cyan"))
+        table.add_row("Mode", _MODE_ENFORCE if r.enforce_mode else _MODE_GATHER)
 
         table.add_row("", "")
 
         # Daily P&L with limit
         pnl_style = "green" if r.daily_pnl >= 0 else "red"
-        table.add_row("Daily P&L", Text(f"${r.daily_pnl:+.2f} / ${r.daily_loss_limit:.0f}", style=pnl_style))
+        table.add_row("Daily P&L", Text(f"${float(r.daily_pnl):+.2f} / ${float(r.daily_loss_limit):.0f}", style=pnl_style))
 
         # Progress bar for loss
         loss_bar = self._progress_bar(r.loss_pct, width=15, danger_threshold=80)
@@ -370,21 +633,19 @@ class TUIRenderer:
         table.add_row("", "")
 
         # Position limit
-        table.add_row("Position", f"{abs(r.current_position):.0f} / {r.position_limit:.0f}")
+        table.add_row("Position", f"{float(abs(r.current_position)):.0f} / {float(r.position_limit):.0f}")
         pos_bar = self._progress_bar(r.position_pct, width=15, danger_threshold=90)
         table.add_row("Pos Used", pos_bar)
 
         # Kill switch
         table.add_row("", "")
-        ks_style = "red bold blink" if r.kill_switch_active else "green"
-        ks_text = "🔴 ACTIVE" if r.kill_switch_active else "🟢 OFF"
-        table.add_row("Kill Switch", Text(ks_text, style=ks_style))
+        table.add_row("Kill Switch", _KILL_ACTIVE if r.kill_switch_active else _KILL_OFF)
 
         border = "red" if r.kill_switch_active or r.risk_status == "STOP" else ("yellow" if r.risk_status == "WARNING" else "blue")
 
         return Panel(
             table,
-            title="[bold]⚠️ Risk[/]",
+            title=self._titles["risk"],
             border_style=border
         )
 
@@ -392,14 +653,7 @@ class TUIRenderer:
         """Render feed health panel."""
         f = state.feed
 
-        # Status color
-        status_styles = {
-            "STOPPED": "red",
-            "STARTING": "yellow",
-            "RUNNING": "green",
-            "ERROR": "red bold"
-        }
-        status_style = status_styles.get(f.status, "dim")
+        status_style = _FEED_STATUS_STYLES.get(f.status, _DIM)
 
         table = Table(box=box.SIMPLE, show_header=False, padding=(0, 1))
         table.add_column("Label", style="dim")
@@ -407,14 +661,14 @@ class TUIRenderer:
 
         table.add_row("Status", Text(f.status, style=status_style))
         table.add_row("Source", Text(f.data_source.upper(), style="cyan"))
-        table.add_row("Healthy", Text("✓ Yes" if f.is_healthy else "✗ No", style="green" if f.is_healthy else "red"))
+        table.add_row("Healthy", _HEALTHY if f.is_healthy else _UNHEALTHY)
 
         # Last message
         if f.last_message_ago < 999:
             msg_style = "green" if f.last_message_ago < 5 else ("yellow" if f.last_message_ago < 30 else "red")
             table.add_row("Last Msg", Text(f"{f.last_message_ago:.1f}s ago", style=msg_style))
         else:
-            table.add_row("Last Msg", Text("—", style="dim"))
+            table.add_row("Last Msg", _NO_VALUE)
 
         if f.reconnect_count > 0:
             table.add_row("Reconnects", Text(str(f.reconnect_count), style="yellow"))
@@ -423,20 +677,22 @@ class TUIRenderer:
 
         return Panel(
             table,
-            title="[bold]📡 Feed[/]",
+            title=self._titles["feed"],
             border_style=border
         )
 
     def _render_footer(self, state: BotState) -> Panel:
         """Render footer with stats and controls."""
-        stats = Text()
-        stats.append(f"Volume: ${state.total_volume:.2f}", style="dim")
-        stats.append("  │  ", style="dim")
-        stats.append(f"Trades: {state.total_trades}", style="dim")
-        stats.append("  │  ", style="dim")
-        stats.append(f"Updated: {state.snapshot_time.strftime('%H:%M:%S')}", style="dim")
-        stats.append("  │  ", style="dim")
-        stats.append("Press Ctrl+C to exit", style="dim italic")
+        sep = self._separator
+        stats = Text.assemble(
+            (
+                f"Volume: ${float(state.total_volume):.2f}{sep}"
+                f"Trades: {state.total_trades}{sep}"
+                f"Updated: {state.snapshot_time.strftime('%H:%M:%S')}{sep}",
+                _DIM
+            ),
+            ("Press Ctrl+C to exit", _DIM_ITALIC)
+        )
 
         return Panel(stats, border_style="dim")
 
@@ -446,16 +702,7 @@ class TUIRenderer:
         filled = int(width * percent / 100)
         empty = width - filled
 
-        if percent >= danger_threshold:
-            style = "red"
-        elif percent >= danger_threshold * 0.7:
-            style = "yellow"
-        else:
-            style = "green"
-
-        bar = Text()
-        bar.append("█" * filled, style=style)
-        bar.append("░" * empty, style="dim")
-        bar.append(f" {percent:.0f}%", style=style)
+        # Past 70% of the threshold is a warning, past the threshold is danger
+        style = _BAR_STYLES[(percent >= danger_threshold * 0.7) + (percent >= danger_threshold)]
 
-        return bar
+        return _bar_text(filled, empty, round(percent), style)
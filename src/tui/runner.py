@@ -22,6 +22,9 @@ from src.utils import setup_logging
 
 logger = setup_logging()
 
+# How long to let a burst of updates settle before repainting (~60 Hz cap)
+REPAINT_DELAY = 0.016
+
 
 class TUIBotRunner:
     """
@@ -63,6 +66,10 @@ class TUIBotRunner:
         self._shutdown_event = asyncio.Event()
         self._loop = None
 
+        # Long-lived waiters reused across frames by _wait_for_repaint
+        self._shutdown_waiter: Optional[asyncio.Future] = None
+        self._dirty_waiter: Optional[asyncio.Future] = None
+
     def _handle_signal(self):
         """Handle shutdown signal."""
         logger.info("Received shutdown signal (Ctrl+C)")
@@ -96,7 +103,8 @@ class TUIBotRunner:
                         break
                     state = self.collector.collect()
                     self.renderer.update(state)
-                    await asyncio.sleep(0.5)
+                    if await self._wait_for_shutdown(0.5):
+                        return
 
                 if not self.feed.is_healthy:
                     logger.error("Feed failed to become healthy")
@@ -105,6 +113,9 @@ class TUIBotRunner:
 
                 self.collector.set_status(BotStatus.RUNNING)
 
+                # Repaint as soon as market data moves, not just on the timer
+                self.feed.register_change_callback(self.collector.mark_dirty)
+
                 # Start market maker task
                 mm_task = asyncio.create_task(self._run_market_maker())
 
@@ -118,15 +129,7 @@ class TUIBotRunner:
                         logger.warning("Kill switch activated, stopping...")
                         break
 
-                    # Use interruptible wait instead of sleep
-                    try:
-                        await asyncio.wait_for(
-                            self._shutdown_event.wait(),
-                            timeout=self.update_interval
-                        )
-                        break  # Event was set, exit loop immediately
-                    except asyncio.TimeoutError:
-                        pass  # Normal timeout, continue loop
+                    await self._wait_for_repaint()
 
                 # Cleanup
                 mm_task.cancel()
@@ -143,9 +146,54 @@ class TUIBotRunner:
                 for sig in (signal.SIGINT, signal.SIGTERM):
                     self._loop.remove_signal_handler(sig)
 
+            for waiter in (self._shutdown_waiter, self._dirty_waiter):
+                if waiter:
+                    waiter.cancel()
+            self._shutdown_waiter = self._dirty_waiter = None
+
             self.collector.set_status(BotStatus.STOPPED)
             await self._cleanup()
 
+    def _get_shutdown_waiter(self) -> asyncio.Future:
+        """Long-lived future that completes when shutdown is requested."""
+        if self._shutdown_waiter is None:
+            self._shutdown_waiter = asyncio.ensure_future(self._shutdown_event.wait())
+        return self._shutdown_waiter
+
+    async def _wait_for_shutdown(self, timeout: float) -> bool:
+        """
+        Sleep for up to timeout, waking early on shutdown.
+
+        Returns:
+            True if shutdown was requested
+        """
+        done, _ = await asyncio.wait((self._get_shutdown_waiter(),), timeout=timeout)
+        return bool(done)
+
+    async def _wait_for_repaint(self):
+        """
+        Wait until the next frame is due.
+
+        Returns when state changes (after REPAINT_DELAY, so a burst of
+        updates renders once), after update_interval at the latest so the
+        uptime and staleness readouts keep ticking, or on shutdown.
+        """
+        # Waiters stay pending across quiet frames; a timeout here raises
+        # nothing and allocates nothing
+        shutdown = self._get_shutdown_waiter()
+        if self._dirty_waiter is None or self._dirty_waiter.done():
+            self._dirty_waiter = asyncio.ensure_future(self.collector.wait_dirty())
+
+        dirty = self._dirty_waiter
+        done, _ = await asyncio.wait(
+            (dirty, shutdown),
+            timeout=self.update_interval,
+            return_when=asyncio.FIRST_COMPLETED
+        )
+
+        if dirty in done and shutdown not in done:
+            await asyncio.sleep(REPAINT_DELAY)
+
     def _init_components(self):
         """Initialize all bot components."""
         # Feed
@@ -4,13 +4,19 @@ Centralized bot state for TUI rendering.
 Collects data from all components into a single snapshot.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Optional, List, Dict, Any
+from typing import Optional, Deque, Dict, Any
 from datetime import datetime
 from enum import Enum
 
 
+# Caps on the activity history a snapshot can carry
+RECENT_TRADES_MAXLEN = 100
+RECENT_ERRORS_MAXLEN = 50
+
+
 class BotMode(Enum):
     """Bot operating mode."""
     DRY_RUN = "DRY_RUN"
@@ -26,7 +32,7 @@ class BotStatus(Enum):
     ERROR = "ERROR"
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketState:
     """Current market data snapshot."""
     token_id: str
@@ -39,7 +45,10 @@ class MarketState:
     last_update: Optional[datetime] = None
 
 
-@dataclass
+# Display percentages are computed in float: they only drive progress bars
+# and 0dp labels, and Decimal division is far slower.
+
+@dataclass(slots=True)
 class OrderState:
     """Active order state."""
     order_id: str
@@ -57,10 +66,10 @@ class OrderState:
     def fill_pct(self) -> float:
         if self.size == 0:
             return 0.0
-        return float(self.filled / self.size * 100)
+        return float(self.filled) / float(self.size) * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionState:
     """Position and P&L state."""
     token_id: str
@@ -81,7 +90,7 @@ class PositionState:
         return self.position * self.current_price
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskState:
     """Risk manager state."""
     daily_pnl: Decimal = Decimal("0")
@@ -98,17 +107,17 @@ class RiskState:
         """Percentage of daily loss limit used."""
         if self.daily_loss_limit == 0:
             return 0.0
-        return float(abs(min(self.daily_pnl, Decimal("0"))) / self.daily_loss_limit * 100)
+        return max(-float(self.daily_pnl), 0.0) / float(self.daily_loss_limit) * 100
 
     @property
     def position_pct(self) -> float:
         """Percentage of position limit used."""
         if self.position_limit == 0:
             return 0.0
-        return float(abs(self.current_position) / self.position_limit * 100)
+        return abs(float(self.current_position)) / float(self.position_limit) * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class FeedState:
     """Market feed state."""
     status: str = "STOPPED"  # STOPPED, STARTING, RUNNING, ERROR
@@ -118,7 +127,7 @@ class FeedState:
     reconnect_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class SmartMMState:
     """Smart market maker state (optional, for SmartMarketMaker only)."""
     # Spread dynamics
@@ -158,7 +167,7 @@ class SmartMMState:
         return " ".join(parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeRecord:
     """Recent trade record."""
     timestamp: datetime
@@ -167,9 +176,13 @@ class TradeRecord:
     size: Decimal
     pnl: Optional[Decimal] = None
     is_simulated: bool = False
+    timestamp_str: str = field(init=False)  # HH:MM:SS, formatted once
+
+    def __post_init__(self):
+        self.timestamp_str = self.timestamp.strftime("%H:%M:%S")
 
 
-@dataclass
+@dataclass(slots=True)
 class BotState:
     """
     Complete bot state snapshot for TUI rendering.
@@ -203,8 +216,12 @@ class BotState:
     smart_mm: Optional[SmartMMState] = None
 
     # Recent activity
-    recent_trades: List[TradeRecord] = field(default_factory=list)
-    recent_errors: List[str] = field(default_factory=list)
+    recent_trades: Deque[TradeRecord] = field(
+        default_factory=lambda: deque(maxlen=RECENT_TRADES_MAXLEN)
+    )  # Newest first
+    recent_errors: Deque[str] = field(
+        default_factory=lambda: deque(maxlen=RECENT_ERRORS_MAXLEN)
+    )
 
     # Stats
     total_trades: int = 0
@@ -217,8 +234,8 @@ class BotState:
     last_fill_time: Optional[datetime] = None
     snapshot_time: datetime = field(default_factory=datetime.now)
 
-    def update_uptime(self):
+    def update_uptime(self, now: Optional[datetime] = None):
         """Update uptime based on start time."""
         if self.start_time:
-            delta = datetime.now() - self.start_time
+            delta = (now or datetime.now()) - self.start_time
             self.uptime_seconds = delta.total_seconds()
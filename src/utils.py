@@ -2,12 +2,62 @@
 Utility functions for the Polymarket Trading Bot
 """
 
+import asyncio
+import atexit
 import logging
 import os
+import queue
+import sys
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+_LOG_FORMATTER = logging.Formatter(
+    fmt='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+_LOGGER_NAME = "polymarket-bot"
+
+# Writes log records to the console and file handlers on a background thread
+_log_listener = None
+
+
+class _BatchedRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that flushes once per drained burst.
+
+    Records are written to the file's buffered stream as usual, but the
+    flush after each record is skipped while more records are waiting in
+    the listener's queue. A burst becomes a few large writes, and the file
+    is still current as soon as the queue empties.
+
+    The file size is tracked here rather than read with stream.tell(),
+    which would flush the buffer on every record.
+    """
+
+    def __init__(self, filename, backlog: queue.SimpleQueue, **kwargs):
+        super().__init__(filename, **kwargs)
+        self._backlog = backlog
+        self._size = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+
+    def shouldRollover(self, record):
+        if self.maxBytes <= 0:
+            return False
+        # Size in encoded bytes, as written: non-ASCII text takes more than
+        # one byte per character
+        msg = self.format(record) + self.terminator
+        length = len(msg.encode(self.encoding or "utf-8", self.errors or "strict"))
+        if self._size and self._size + length >= self.maxBytes:
+            self._size = length  # Record goes to the fresh file
+            return True
+        self._size += length
+        return False
+
+    def flush(self):
+        if self._backlog.empty():
+            super().flush()
+
 
 def setup_logging(log_dir: str = None):
     """
@@ -16,26 +66,25 @@ def setup_logging(log_dir: str = None):
     Sets up console handler and rotating file handler.
     Logs are saved to logs/ directory with 10MB rotation, keeping 5 backups.
 
+    Both handlers sit behind a queue drained by a background thread, so a
+    log call from the event loop never waits on terminal or disk I/O.
+
     Args:
         log_dir: Optional custom log directory. Defaults to ./logs/
 
     Returns:
         logging.Logger: Configured logger instance
     """
-    logger = logging.getLogger("polymarket-bot")
+    global _log_listener
+
+    logger = logging.getLogger(_LOGGER_NAME)
     logger.setLevel(logging.INFO)
 
     if not logger.handlers:
-        formatter = logging.Formatter(
-            fmt='%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        console_handler.setFormatter(_LOG_FORMATTER)
 
         # File handler with rotation
         if log_dir is None:
@@ -46,18 +95,72 @@ def setup_logging(log_dir: str = None):
         log_dir.mkdir(exist_ok=True)
         log_file = log_dir / "bot.log"
 
-        file_handler = RotatingFileHandler(
+        log_queue = queue.SimpleQueue()
+
+        file_handler = _BatchedRotatingFileHandler(
             log_file,
+            backlog=log_queue,
             maxBytes=10 * 1024 * 1024,  # 10MB
             backupCount=5
         )
         file_handler.setLevel(logging.INFO)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(_LOG_FORMATTER)
+
+        _log_listener = QueueListener(
+            log_queue, console_handler, file_handler, respect_handler_level=True
+        )
+        _log_listener.start()
+        atexit.register(stop_logging)
+        logger.addHandler(QueueHandler(log_queue))
 
     return logger
 
 
+def stop_logging():
+    """
+    Flush queued log records and stop the background log writer.
+
+    The console and file handlers are moved onto the logger in place of
+    the queue, so records logged afterwards (e.g. by later atexit hooks)
+    are written directly rather than queued for a writer that is gone.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        listener, _log_listener = _log_listener, None
+
+        # Swap before stopping: anything queued meanwhile is still drained
+        logger = logging.getLogger(_LOGGER_NAME)
+        for handler in listener.handlers:
+            logger.addHandler(handler)
+        for handler in list(logger.handlers):
+            if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+                logger.removeHandler(handler)
+
+        listener.stop()
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop as the asyncio event loop implementation if available
+
+    uvloop is optional and not supported on Windows; when it can't be
+    used the default asyncio loop is left in place.
+
+    Returns:
+        bool: True if uvloop was installed
+    """
+    if sys.platform == "win32":
+        return False
+
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 def format_timestamp(ts):
     """
     Format a timestamp for display
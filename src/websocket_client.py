@@ -13,14 +13,15 @@ This module is kept for historical/educational purposes only.
 Production code should use: from src.feed import MarketFeed
 """
 
-import json
 import asyncio
+import re
 import time
 import ssl
 from enum import Enum
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Tuple, Union
 from dataclasses import dataclass
 import certifi
+import orjson
 import websockets
 from websockets.asyncio.client import ClientConnection
 from websockets.exceptions import (
@@ -42,6 +43,28 @@ from src.utils import setup_logging
 
 logger = setup_logging()
 
+# recv() returns buffered frames without suspending, so a burst is already
+# drained back-to-back; yield to the event loop every N frames for fairness
+_RECV_YIELD_EVERY = 64
+
+# Only frames carrying this key are subject to the subscribed-token prefilter
+_ASSET_ID_KEY = b'"asset_id"'
+
+# Callback attribute notified for each routed event type
+_EVENT_CALLBACKS = {
+    "price_change": "on_price_change",
+    "book": "on_book_update",
+    "last_trade_price": "on_trade",
+    "tick_size_change": "on_tick_size_change",
+}
+
+# Fast path for price_change frames when no callback needs the parsed dict.
+# Only a single flat object qualifies, so the keys matched here are the
+# top-level ones the full parse would read; values with escapes or a
+# non-string price fall back to the full parse.
+_PRICE_CHANGE_MARKER = b'"event_type":"price_change"'
+_PRICE_CHANGE_FIELDS = re.compile(rb'"asset_id":"([^"\\]+)".*?"price":"([0-9.]+)"')
+
 
 class ConnectionState(Enum):
     """WebSocket connection states"""
@@ -62,7 +85,7 @@ class MarketData:
     last_trade_price: Optional[float] = None
     last_trade_side: Optional[str] = None
     last_trade_size: Optional[float] = None
-    last_update_time: float = 0.0
+    last_update_time: float = 0.0  # time.monotonic() of the last message
     tick_size: str = "0.01"
 
     @property
@@ -70,7 +93,7 @@ class MarketData:
         """Check if data is stale (no updates for threshold period)"""
         if self.last_update_time == 0:
             return True
-        return (time.time() - self.last_update_time) > WS_STALE_DATA_THRESHOLD
+        return (time.monotonic() - self.last_update_time) > WS_STALE_DATA_THRESHOLD
 
 
 class MarketWebSocket:
@@ -101,7 +124,10 @@ class MarketWebSocket:
         self.url = url
         self._ws: Optional[ClientConnection] = None
         self._state = ConnectionState.DISCONNECTED
-        self._subscribed_tokens: List[str] = []
+        # Insertion-ordered set: dict keys give O(1) membership and removal
+        self._subscribed_tokens: Dict[str, None] = {}
+        # Encoded token IDs for the raw-frame prefilter in _receive_loop
+        self._token_bytes: Tuple[bytes, ...] = ()
         self._market_data: Dict[str, MarketData] = {}
 
         # Reconnection state
@@ -121,6 +147,14 @@ class MarketWebSocket:
         self.on_connect: Optional[Callable[[], None]] = None
         self.on_disconnect: Optional[Callable[[], None]] = None
 
+        # Message routing by event_type
+        self._dispatch: Dict[str, Callable[[Dict[str, Any]], None]] = {
+            "price_change": self._handle_price_change,
+            "book": self._handle_book_update,
+            "last_trade_price": self._handle_trade,
+            "tick_size_change": self._handle_tick_size_change,
+        }
+
     @property
     def state(self) -> ConnectionState:
         """Current connection state"""
@@ -132,9 +166,9 @@ class MarketWebSocket:
         return self._state in (ConnectionState.CONNECTED, ConnectionState.SUBSCRIBED)
 
     @property
-    def subscribed_tokens(self) -> List[str]:
-        """List of currently subscribed token IDs"""
-        return self._subscribed_tokens.copy()
+    def subscribed_tokens(self) -> Tuple[str, ...]:
+        """Currently subscribed token IDs, in subscription order"""
+        return tuple(self._subscribed_tokens)
 
     def get_market_data(self, token_id: str) -> Optional[MarketData]:
         """Get current market data for a token"""
@@ -223,7 +257,8 @@ class MarketWebSocket:
 
         self._ws = None
         self._state = ConnectionState.DISCONNECTED
-        self._subscribed_tokens = []
+        self._subscribed_tokens = {}
+        self._refresh_token_filter()
 
         if self.on_disconnect:
             self.on_disconnect()
@@ -258,14 +293,14 @@ class MarketWebSocket:
             if self._ws is None:
                 logger.error("WebSocket not connected")
                 return False
-            await self._ws.send(json.dumps(message))
+            await self._ws.send(orjson.dumps(message).decode())
 
             # Initialize market data containers
             for token_id in token_ids:
                 if token_id not in self._market_data:
                     self._market_data[token_id] = MarketData(token_id=token_id)
-                if token_id not in self._subscribed_tokens:
-                    self._subscribed_tokens.append(token_id)
+                self._subscribed_tokens[token_id] = None
+            self._refresh_token_filter()
 
             self._state = ConnectionState.SUBSCRIBED
             logger.info(f"Subscribed to {len(token_ids)} token(s)")
@@ -288,29 +323,56 @@ class MarketWebSocket:
         """
         # Remove from tracking
         for token_id in token_ids:
-            if token_id in self._subscribed_tokens:
-                self._subscribed_tokens.remove(token_id)
+            self._subscribed_tokens.pop(token_id, None)
             if token_id in self._market_data:
                 del self._market_data[token_id]
+        self._refresh_token_filter()
 
         # Re-subscribe with remaining tokens
         if self._subscribed_tokens:
-            return await self.subscribe(self._subscribed_tokens)
+            return await self.subscribe(list(self._subscribed_tokens))
 
         return True
 
+    def _refresh_token_filter(self):
+        """Rebuild the encoded token IDs used to prefilter raw frames"""
+        self._token_bytes = tuple(t.encode() for t in self._subscribed_tokens)
+
     async def _receive_loop(self):
         """Background task to receive and process messages"""
+        # Bound once: the loop body runs per frame
+        handle = self._handle_message
+        sleep = asyncio.sleep
+        received = 0
         while self._should_reconnect:
             try:
-                if not self._ws:
-                    await asyncio.sleep(0.1)
+                ws = self._ws
+                if not ws:
+                    await sleep(0.1)
+                    continue
+
+                # Raw bytes straight to the JSON parser; decoding text
+                # frames to str first is a wasted copy per message
+                raw_message = await ws.recv(decode=False)
+
+                received += 1
+                if received % _RECV_YIELD_EVERY == 0:
+                    await sleep(0)
+
+                # Frames for tokens we no longer track (e.g. in flight
+                # during an unsubscribe) are dropped before parsing. Only
+                # frames naming an asset are filtered: errors, status and
+                # other asset-less events always reach the handler
+                token_bytes = self._token_bytes
+                if (
+                    token_bytes
+                    and _ASSET_ID_KEY in raw_message
+                    and not any(t in raw_message for t in token_bytes)
+                ):
+                    logger.debug("Dropped frame for untracked token")
                     continue
 
-                raw_message = await self._ws.recv()
-                # Handle both str and bytes messages
-                message_str: str = raw_message.decode("utf-8") if isinstance(raw_message, bytes) else raw_message
-                await self._handle_message(message_str)
+                await handle(raw_message)
 
             except ConnectionClosedOK:
                 logger.info("WebSocket closed normally")
@@ -339,9 +401,12 @@ class MarketWebSocket:
                 if self._ws and self.is_connected:
                     # WebSockets library handles ping/pong automatically
                     # but we can check for stale connections here
+                    # One clock read per tick rather than one per token
+                    now = time.monotonic()
                     stale_tokens = [
                         t for t, d in self._market_data.items()
-                        if d.is_stale
+                        if d.last_update_time == 0
+                        or (now - d.last_update_time) > WS_STALE_DATA_THRESHOLD
                     ]
                     if stale_tokens:
                         logger.warning(f"Stale data detected for {len(stale_tokens)} token(s)")
@@ -395,7 +460,7 @@ class MarketWebSocket:
 
                 # Re-subscribe to previous tokens
                 if self._subscribed_tokens:
-                    await self.subscribe(self._subscribed_tokens)
+                    await self.subscribe(list(self._subscribed_tokens))
 
                 # Restart receive loop
                 self._receive_task = asyncio.create_task(self._receive_loop())
@@ -415,10 +480,13 @@ class MarketWebSocket:
         if self.on_error:
             self.on_error(Exception("Max reconnection attempts exceeded"))
 
-    async def _handle_message(self, raw_message: str):
+    async def _handle_message(self, raw_message: Union[bytes, str]):
         """Parse and route incoming messages"""
         try:
-            data = json.loads(raw_message)
+            if self._fast_price_change(raw_message):
+                return
+
+            data = orjson.loads(raw_message)
 
             event_type = data.get("event_type")
             asset_id = data.get("asset_id")
@@ -428,34 +496,60 @@ class MarketWebSocket:
                 return
 
             # Update last update time
-            if asset_id and asset_id in self._market_data:
-                self._market_data[asset_id].last_update_time = time.time()
+            market_data = self._market_data.get(asset_id)
+            if market_data:
+                market_data.last_update_time = time.monotonic()
+            elif event_type in _EVENT_CALLBACKS and getattr(self, _EVENT_CALLBACKS[event_type]) is None:
+                # No state to update and nobody listening
+                return
 
             # Route to appropriate handler
-            if event_type == "price_change":
-                self._handle_price_change(data)
-            elif event_type == "book":
-                self._handle_book_update(data)
-            elif event_type == "last_trade_price":
-                self._handle_trade(data)
-            elif event_type == "tick_size_change":
-                self._handle_tick_size_change(data)
+            handler = self._dispatch.get(event_type)
+            if handler:
+                handler(data)
             else:
                 logger.debug(f"Unhandled event type: {event_type}")
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse message: {e}")
         except Exception as e:
             logger.error(f"Error handling message: {e}")
 
+    def _fast_price_change(self, raw_message: Union[bytes, str]) -> bool:
+        """
+        Apply a price_change frame without a full JSON decode.
+
+        Only used when no on_price_change callback wants the parsed dict.
+        Returns False if the frame must go through the normal parse.
+        """
+        if self.on_price_change or not isinstance(raw_message, bytes):
+            return False
+        if _PRICE_CHANGE_MARKER not in raw_message:
+            return False
+        # Nested objects or arrays (e.g. a price_changes list) need the full parse
+        if raw_message.count(b"{") != 1 or b"[" in raw_message:
+            return False
+        if raw_message[:1] != b"{" or raw_message.rstrip()[-1:] != b"}":
+            return False
+
+        match = _PRICE_CHANGE_FIELDS.search(raw_message)
+        if not match:
+            return False
+
+        market_data = self._market_data.get(match.group(1).decode())
+        if market_data:
+            market_data.last_update_time = time.monotonic()
+            market_data.last_price = float(match.group(2))
+        return True
+
     def _handle_price_change(self, data: Dict[str, Any]):
         """Handle price_change events"""
-        asset_id = data.get("asset_id")
+        market_data = self._market_data.get(data.get("asset_id"))
 
-        if asset_id and asset_id in self._market_data:
+        if market_data:
             price = data.get("price")
             if price:
-                self._market_data[asset_id].last_price = float(price)
+                market_data.last_price = float(price)
 
         if self.on_price_change:
             self.on_price_change(data)
@@ -463,31 +557,26 @@ class MarketWebSocket:
     def _handle_book_update(self, data: Dict[str, Any]):
         """Handle book events (order book updates)"""
         asset_id = data.get("asset_id")
+        market_data = self._market_data.get(asset_id)
 
-        if asset_id and asset_id in self._market_data:
-            # Parse order book
-            bids = []
-            asks = []
-
-            for bid in data.get("bids", []):
-                if isinstance(bid, dict):
-                    bids.append(PriceLevel(
-                        price=float(bid.get("price", 0)),
-                        size=float(bid.get("size", 0))
-                    ))
-
-            for ask in data.get("asks", []):
-                if isinstance(ask, dict):
-                    asks.append(PriceLevel(
-                        price=float(ask.get("price", 0)),
-                        size=float(ask.get("size", 0))
-                    ))
-
-            # Sort properly
-            bids.sort(key=lambda x: x.price, reverse=True)
-            asks.sort(key=lambda x: x.price)
-
-            self._market_data[asset_id].order_book = OrderBook(
+        if market_data:
+            # Parse and sort as (price, size) tuples, then build levels
+            try:
+                bid_levels = sorted(
+                    [(float(b["price"]), float(b["size"])) for b in data.get("bids", []) if isinstance(b, dict)],
+                    reverse=True
+                )
+                ask_levels = sorted(
+                    [(float(a["price"]), float(a["size"])) for a in data.get("asks", []) if isinstance(a, dict)]
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Malformed book level for {asset_id}: {e}")
+                return
+
+            bids = [PriceLevel(price, size) for price, size in bid_levels]
+            asks = [PriceLevel(price, size) for price, size in ask_levels]
+
+            market_data.order_book = OrderBook(
                 token_id=asset_id,
                 bids=bids,
                 asks=asks,
@@ -499,10 +588,9 @@ class MarketWebSocket:
 
     def _handle_trade(self, data: Dict[str, Any]):
         """Handle last_trade_price events"""
-        asset_id = data.get("asset_id")
+        md = self._market_data.get(data.get("asset_id"))
 
-        if asset_id and asset_id in self._market_data:
-            md = self._market_data[asset_id]
+        if md:
             md.last_trade_price = float(data.get("price", 0))
             md.last_trade_side = data.get("side")
             md.last_trade_size = float(data.get("size", 0)) if data.get("size") else None
@@ -512,12 +600,12 @@ class MarketWebSocket:
 
     def _handle_tick_size_change(self, data: Dict[str, Any]):
         """Handle tick_size_change events"""
-        asset_id = data.get("asset_id")
+        market_data = self._market_data.get(data.get("asset_id"))
 
-        if asset_id and asset_id in self._market_data:
+        if market_data:
             new_tick = data.get("new_tick_size")
             if new_tick:
-                self._market_data[asset_id].tick_size = new_tick
+                market_data.tick_size = new_tick
 
         if self.on_tick_size_change:
             self.on_tick_size_change(data)
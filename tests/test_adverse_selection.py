@@ -117,6 +117,18 @@ class TestAdverseSelectionResponse:
         response = detector.get_response()
         assert response.spread_multiplier == pytest.approx(1.0, rel=0.1)
 
+    def test_response_reused_until_fills_change(self, detector):
+        """Repeated get_response calls reuse the answer until a fill is recorded."""
+        detector.record_fill(Decimal("0.50"), "BUY", Decimal("10"))
+        detector.record_price_after(0, Decimal("0.52"))
+
+        first = detector.get_response()
+        assert detector.get_response() is first
+        assert first.widen_spread is False
+
+        detector.record_price_after(0, Decimal("0.45"))
+        assert detector.get_response().widen_spread is True
+
 
 class TestFillAnalysis:
     """Test individual fill analysis."""
@@ -141,3 +153,32 @@ class TestFillAnalysis:
 
         analysis = detector.analyze_fill(0)
         assert analysis.seconds_to_adverse == 5
+
+
+class TestLookbackWindow:
+    """Test expiry of fills outside the lookback window."""
+
+    def test_old_fills_expire(self):
+        """Fills older than the lookback window drop out of toxicity."""
+        detector = AdverseSelectionDetector(lookback_window=60)
+        detector.record_fill(Decimal("0.50"), "BUY", Decimal("10"))
+        detector.record_price_after(0, Decimal("0.45"))
+        detector._fills[0].timestamp -= 120  # Age it past the window
+
+        detector.record_fill(Decimal("0.50"), "BUY", Decimal("10"))
+        detector.record_price_after(1, Decimal("0.52"))
+        detector.record_price_after(0, Decimal("0.40"))  # Expired: ignored
+
+        assert detector.analyze_fill(0) is None
+        assert detector.get_toxicity() == 0.0
+
+    def test_rerecorded_outcome_counted_once(self):
+        """Recording a fill's outcome again replaces the earlier verdict."""
+        detector = AdverseSelectionDetector(lookback_window=60)
+        detector.record_fill(Decimal("0.50"), "SELL", Decimal("10"))
+        detector.record_price_after(0, Decimal("0.55"))
+        assert detector.get_toxicity("SELL") == 1.0
+
+        detector.record_price_after(0, Decimal("0.48"))
+        assert detector.get_toxicity("SELL") == 0.0
+        assert detector.get_toxicity() == 0.0
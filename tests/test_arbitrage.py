@@ -240,6 +240,25 @@ class TestArbitrageDetectorRegisterAndScan:
         assert signals[1].sum_price == Decimal("0.97")
         assert signals[1].type == ArbitrageType.BUY_BOTH
 
+    def test_scan_all_top_k(self, detector):
+        """scan_all with top_k returns only the most profitable signals."""
+        prices = {}
+        for i, no_price in enumerate(["0.48", "0.50", "0.47"]):
+            detector.register_pair(TokenPair(
+                condition_id=f"cond-{i}",
+                yes_token_id=f"yes-{i}",
+                no_token_id=f"no-{i}",
+                market_slug=f"market-{i}",
+            ))
+            prices[f"yes-{i}"] = Decimal("0.55")
+            prices[f"no-{i}"] = Decimal(no_price)  # Sums 1.03, 1.05, 1.02
+
+        signals = detector.scan_all(prices.get, top_k=2)
+
+        assert [s.sum_price for s in signals] == [Decimal("1.05"), Decimal("1.03")]
+        # Every actionable pair is still cached
+        assert len(detector._last_signals) == 3
+
     def test_scan_all_handles_missing_prices(self, detector):
         """scan_all gracefully handles missing prices."""
         pair = TokenPair(
@@ -483,3 +502,15 @@ class TestEdgeCases:
         )
         assert signal.type == ArbitrageType.SKEW_QUOTES
         assert signal.confidence == 0.5
+
+    def test_signal_is_immutable(self, detector, test_pair):
+        """Signals are frozen so cached ones cannot be altered by consumers."""
+        import dataclasses
+
+        signal = detector.check_pair(
+            yes_price=Decimal("0.55"),
+            no_price=Decimal("0.48"),
+            pair=test_pair,
+        )
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            signal.profit_bps = 0
@@ -42,6 +42,17 @@ class TestHistoricalData:
         assert snapshots[0].timestamp == 1000
         assert snapshots[1].timestamp == 2000
 
+    def test_iterate_after_late_snapshot(self):
+        """A snapshot older than those already iterated is placed in order."""
+        data = HistoricalData()
+
+        for ts in (1000, 2000, 3000):
+            data.add_snapshot(OrderBookSnapshot(timestamp=ts, token_id="t", best_bid=Decimal("0.50"), best_ask=Decimal("0.52"), bid_depth=Decimal("100"), ask_depth=Decimal("100")))
+        assert [s.timestamp for s in data.iterate()] == [1000, 2000, 3000]
+
+        data.add_snapshot(OrderBookSnapshot(timestamp=1500, token_id="t", best_bid=Decimal("0.50"), best_ask=Decimal("0.52"), bid_depth=Decimal("100"), ask_depth=Decimal("100")))
+        assert [s.timestamp for s in data.iterate()] == [1000, 1500, 2000, 3000]
+
 
 class TestBacktestEngine:
     """Test backtest engine."""
@@ -34,6 +34,46 @@ class TestLatencyTracking:
         assert stats.p50 == pytest.approx(50, rel=0.1)
         assert stats.p99 == pytest.approx(99, rel=0.1)
 
+    def test_window_keeps_recent_values(self):
+        """Stats cover the last window_size values and drop older windows."""
+        monitor = LatencyMonitor(window_size=100)
+        for i in range(250):
+            monitor.record("api_call", i)
+
+        stats = monitor.get_stats("api_call")
+        assert stats.count == 150
+        assert stats.min == 100
+        assert stats.max == 249
+        assert stats.p50 == pytest.approx(175, rel=0.1)
+
+    def test_window_covers_last_values_between_rotations(self):
+        """Just after a rotation the full last window_size values are still covered."""
+        monitor = LatencyMonitor(window_size=100)
+        for i in range(201):
+            monitor.record("api_call", i)
+
+        stats = monitor.get_stats("api_call")
+        assert stats.count == 101
+        assert stats.min == 100
+        assert stats.max == 200
+
+        for count in range(202, 400):
+            monitor.record("api_call", count - 1)
+            stats = monitor.get_stats("api_call")
+            assert 100 <= stats.count <= 200
+            assert stats.min <= count - 100
+
+    def test_stats_refresh_after_record(self, monitor):
+        """Cached stats are replaced once a new value is recorded."""
+        monitor.record("order_place", 50)
+        first = monitor.get_stats("order_place")
+        assert monitor.get_stats("order_place") is first
+
+        monitor.record("order_place", 70)
+        stats = monitor.get_stats("order_place")
+        assert stats.count == 2
+        assert stats.avg == 60
+
 
 class TestLatencyAlerts:
     """Test latency alerting."""
@@ -65,3 +105,11 @@ class TestLatencyAlerts:
         alert = monitor.check_alerts()
         assert alert is not None
         assert alert.level == "critical"
+
+    def test_alert_clears_when_latency_recovers(self, monitor):
+        """Alert reflects the latest value for the metric."""
+        monitor.record("order_place", 600)
+        assert monitor.check_alerts().level == "critical"
+
+        monitor.record("order_place", 50)
+        assert monitor.check_alerts() is None
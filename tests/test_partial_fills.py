@@ -50,6 +50,23 @@ class TestPartialFillDetection:
         assert event.is_partial is False
         assert event.remaining_size == Decimal("0")
 
+    def test_zero_size_fill_ignored(self, handler):
+        """Duplicate zero-size fill events are dropped."""
+        handler.track_order(
+            order_id="order-1",
+            side="BUY",
+            size=Decimal("100"),
+            price=Decimal("0.50"),
+        )
+
+        event = handler.record_fill(
+            order_id="order-1",
+            filled_size=Decimal("0"),
+        )
+
+        assert event is None
+        assert handler.get_statistics().total_orders == 0
+
 
 class TestPartialFillResponse:
     """Test response strategies for partial fills."""
@@ -69,3 +69,100 @@ def test_logging_setup():
     assert logger is not None, "Logger should not be None"
     logger.info("Test log message")
     print("✓ Logging setup verified")
+
+
+def test_logging_is_queued():
+    """Verify log calls hand off to the background writer"""
+    from logging.handlers import QueueHandler
+    from src.utils import setup_logging
+
+    logger = setup_logging()
+    assert [type(h) for h in logger.handlers] == [QueueHandler]
+    print("✓ Logging goes through a queue")
+
+
+def test_stop_logging_restores_direct_handlers():
+    """Verify records logged after stop_logging still reach the handlers"""
+    from logging.handlers import QueueHandler
+    from unittest.mock import patch
+    from src import utils
+
+    logger = utils.setup_logging()
+    queued = list(logger.handlers)
+    listener = utils._log_listener
+    assert listener is not None
+
+    try:
+        utils.stop_logging()
+        assert utils._log_listener is None
+        assert logger.handlers == list(listener.handlers)
+        assert not any(isinstance(h, QueueHandler) for h in logger.handlers)
+
+        file_handler = logger.handlers[-1]
+        with patch.object(file_handler, "emit") as emit:
+            logger.info("logged after stop")
+        assert emit.call_args[0][0].getMessage() == "logged after stop"
+    finally:
+        # Put the queued setup back for the rest of the session
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        for handler in queued:
+            logger.addHandler(handler)
+        listener.start()
+        utils._log_listener = listener
+
+    print("✓ Logging still written after the writer stops")
+
+
+def test_file_log_flushes_per_burst(tmp_path):
+    """Verify the file handler defers flushing until the queue drains"""
+    import logging
+    import queue
+    from src.utils import _BatchedRotatingFileHandler
+
+    backlog = queue.SimpleQueue()
+    backlog.put(None)  # Pretend more records are waiting
+    log_file = tmp_path / "bot.log"
+    handler = _BatchedRotatingFileHandler(log_file, backlog=backlog, maxBytes=100, backupCount=1)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    try:
+        for i in range(3):
+            handler.handle(logging.makeLogRecord({"msg": f"record {i}"}))
+        assert log_file.stat().st_size == 0
+
+        backlog.get()
+        handler.flush()
+        assert log_file.read_text().splitlines() == ["record 0", "record 1", "record 2"]
+
+        for i in range(10):
+            handler.handle(logging.makeLogRecord({"msg": f"record {i}"}))
+        handler.flush()
+        assert (tmp_path / "bot.log.1").exists()
+        assert log_file.stat().st_size < 100
+    finally:
+        handler.close()
+    print("✓ File log flushes once per burst")
+
+
+def test_file_log_rolls_over_on_encoded_size(tmp_path):
+    """Verify rollover counts bytes written, not characters"""
+    import logging
+    import queue
+    from src.utils import _BatchedRotatingFileHandler
+
+    log_file = tmp_path / "bot.log"
+    handler = _BatchedRotatingFileHandler(
+        log_file, backlog=queue.SimpleQueue(), maxBytes=100, backupCount=3, encoding="utf-8"
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    try:
+        # 10 characters but 28 bytes per line
+        for _ in range(10):
+            handler.handle(logging.makeLogRecord({"msg": "✓✓✓✓✓✓✓✓✓"}))
+        for path in tmp_path.iterdir():
+            assert path.stat().st_size <= 100
+    finally:
+        handler.close()
+    print("✓ File log rolls over on bytes written")
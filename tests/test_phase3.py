@@ -236,6 +236,152 @@ class TestWebSocketClient:
         finally:
             await ws.disconnect()
 
+    @pytest.mark.asyncio
+    async def test_subscription_tracking(self):
+        """Verify subscribed tokens stay ordered and unique without a server"""
+        from src.websocket_client import MarketWebSocket, ConnectionState
+        import orjson
+
+        class FakeConnection:
+            def __init__(self):
+                self.sent: List[Dict[str, Any]] = []
+
+            async def send(self, message):
+                self.sent.append(orjson.loads(message))
+
+        ws = MarketWebSocket()
+        ws._ws = FakeConnection()  # type: ignore[assignment]
+        ws._state = ConnectionState.CONNECTED
+
+        assert await ws.subscribe(["a", "b"])
+        assert await ws.subscribe(["b", "c"])
+        assert ws.subscribed_tokens == ("a", "b", "c")
+
+        assert await ws.unsubscribe(["b"])
+        assert ws.subscribed_tokens == ("a", "c")
+        assert ws._ws.sent[-1]["assets_ids"] == ["a", "c"]
+
+        print("✓ Subscription tracking works")
+
+    @pytest.mark.asyncio
+    async def test_receive_loop_drops_untracked_tokens(self):
+        """Verify frames for unsubscribed tokens are dropped before parsing"""
+        from src.websocket_client import MarketWebSocket, MarketData
+        from websockets.exceptions import ConnectionClosedOK
+        import orjson
+
+        frames = [
+            orjson.dumps({"event_type": "price_change", "asset_id": "other", "price": "0.9"}),
+            orjson.dumps({"event_type": "price_change", "asset_id": "mine", "price": "0.4"}),
+        ]
+
+        class FakeConnection:
+            async def recv(self, decode=None):
+                if frames:
+                    return frames.pop(0)
+                raise ConnectionClosedOK(None, None)
+
+        seen: List[Dict[str, Any]] = []
+        ws = MarketWebSocket()
+        ws._ws = FakeConnection()  # type: ignore[assignment]
+        ws._market_data["mine"] = MarketData(token_id="mine")
+        ws._subscribed_tokens["mine"] = None
+        ws._refresh_token_filter()
+        ws.on_price_change = seen.append
+
+        await ws._receive_loop()
+
+        assert [m["asset_id"] for m in seen] == ["mine"]
+        assert ws._market_data["mine"].last_price == 0.4
+
+        print("✓ Untracked token frames dropped")
+
+    @pytest.mark.asyncio
+    async def test_receive_loop_passes_asset_less_frames(self):
+        """Verify error and status frames without an asset_id are not prefiltered"""
+        from src.websocket_client import MarketWebSocket
+        from websockets.exceptions import ConnectionClosedOK
+
+        frames = [b'{"error":"rate limited"}', b'{"type":"status","status":"ok"}']
+        expected = list(frames)
+
+        class FakeConnection:
+            async def recv(self, decode=None):
+                if frames:
+                    return frames.pop(0)
+                raise ConnectionClosedOK(None, None)
+
+        handled: List[bytes] = []
+
+        async def record(raw_message):
+            handled.append(raw_message)
+
+        ws = MarketWebSocket()
+        ws._ws = FakeConnection()  # type: ignore[assignment]
+        ws._subscribed_tokens["mine"] = None
+        ws._refresh_token_filter()
+        ws._handle_message = record  # type: ignore[method-assign]
+
+        await ws._receive_loop()
+
+        assert handled == expected
+
+        print("✓ Asset-less frames reach the handler")
+
+    @pytest.mark.asyncio
+    async def test_price_change_fast_path(self):
+        """Verify price_change frames update market data with or without a callback"""
+        from src.websocket_client import MarketWebSocket, MarketData
+        import orjson
+
+        raw = orjson.dumps({"event_type": "price_change", "asset_id": "tok", "price": "0.42"})
+
+        ws = MarketWebSocket()
+        ws._market_data["tok"] = MarketData(token_id="tok")
+
+        # No callback: handled by the regex fast path
+        assert ws._fast_price_change(raw)
+        await ws._handle_message(raw)
+        assert ws._market_data["tok"].last_price == 0.42
+        assert not ws._market_data["tok"].is_stale
+
+        # Callback set: full parse so the callback gets the dict
+        seen: List[Dict[str, Any]] = []
+        ws.on_price_change = seen.append
+        assert not ws._fast_price_change(raw)
+        await ws._handle_message(raw)
+        assert seen == [{"event_type": "price_change", "asset_id": "tok", "price": "0.42"}]
+
+        print("✓ Price change fast path works")
+
+    @pytest.mark.asyncio
+    async def test_price_change_fast_path_matches_full_parse(self):
+        """Verify the fast path never updates market data differently from the full parse"""
+        from src.websocket_client import MarketWebSocket, MarketData
+        import orjson
+
+        frames = [
+            {"event_type": "price_change", "asset_id": "A", "price": "0.40"},
+            {"price_changes": [{"asset_id": "A", "price": "0.40"}, {"asset_id": "B", "price": "0.60"}],
+             "event_type": "price_change"},
+            {"event_type": "price_change", "asset_id": "B", "meta": {"asset_id": "A", "price": "0.9"}, "price": "0.55"},
+            {"event_type": "price_change", "price": "0.30", "asset_id": "A"},
+            {"event_type": "price_change", "asset_id": "A", "price": 0},
+        ]
+
+        async def apply(message) -> Dict[str, Any]:
+            ws = MarketWebSocket()
+            for token in ("A", "B"):
+                ws._market_data[token] = MarketData(token_id=token)
+            await ws._handle_message(message)
+            return {t: md.last_price for t, md in ws._market_data.items()}
+
+        for frame in frames:
+            raw = orjson.dumps(frame)
+            assert await apply(raw) == await apply(raw.decode()), frame
+
+        print("✓ Fast path agrees with full parse")
+
 
 class TestConnectionState:
     """Test connection state management"""
@@ -283,10 +429,10 @@ class TestMarketData:
         md = MarketData(token_id="test")
         assert md.is_stale == True  # No data yet
 
-        md.last_update_time = time.time()
+        md.last_update_time = time.monotonic()
         assert md.is_stale == False  # Just updated
 
-        md.last_update_time = time.time() - 120  # 2 minutes ago
+        md.last_update_time = time.monotonic() - 120  # 2 minutes ago
         assert md.is_stale == True  # Too old
 
         print("✓ Stale data detection works")
@@ -52,9 +52,28 @@ class TestDataStore:
         assert store.get_best_ask("token1") == pytest.approx(0.55)
         assert store.get_midpoint("token1") == pytest.approx(0.525)
         assert store.get_spread("token1") == pytest.approx(0.05)
+        assert store.get_quote("token1") == pytest.approx((0.50, 0.55, 0.525))
+        assert store.get_quote("unknown") == (None, None, None)
 
         print("✓ Order book updated correctly")
 
+    def test_book_update_sorts_levels(self):
+        """Test unsorted levels come back best-first."""
+        from src.feed.data_store import DataStore
+
+        store = DataStore()
+        store.update_book(
+            "token1",
+            [{'price': '0.48', 'size': '10'}, {'price': '0.50', 'size': '20'}, {'price': '0.49', 'size': '30'}],
+            [{'price': '0.57', 'size': '10'}, {'price': '0.55', 'size': '20'}, {'price': '0.56', 'size': '30'}]
+        )
+
+        book = store.get_order_book("token1")
+        assert [(l.price, l.size) for l in book.bids] == [(0.50, 20.0), (0.49, 30.0), (0.48, 10.0)]
+        assert [(l.price, l.size) for l in book.asks] == [(0.55, 20.0), (0.56, 30.0), (0.57, 10.0)]
+
+        print("✓ Book levels sorted")
+
     def test_freshness(self):
         """Test data freshness detection."""
         from src.feed.data_store import DataStore
@@ -135,6 +154,7 @@ class TestMockFeed:
         assert feed.get_midpoint("token1") == 0.525
         assert feed.get_best_bid("token1") == 0.50
         assert feed.get_best_ask("token1") == 0.55
+        assert feed.get_quote("token1") == (0.50, 0.55, 0.525)
 
         await feed.stop()
         print("✓ Mock data injection works")
@@ -416,3 +436,57 @@ async def test_list_message_handling():
         print("✓ List messages handled without error")
     except AttributeError as e:
         pytest.fail(f"Failed to handle list message: {e}")
+
+
+@pytest.mark.asyncio
+async def test_bytes_message_handling():
+    """Verify feed parses raw websocket bytes without decoding first."""
+    from src.feed import MarketFeed
+    import json
+
+    feed = MarketFeed()
+    feed._data_store.register_token('test_token')
+
+    message = json.dumps({
+        'event_type': 'book',
+        'asset_id': 'test_token',
+        'bids': [{'price': '0.45', 'size': '100'}],
+        'asks': [{'price': '0.55', 'size': '200'}],
+    }).encode()
+
+    await feed._process_message(message)
+
+    assert feed.get_best_bid('test_token') == 0.45
+    print("✓ Bytes messages parsed")
+
+
+@pytest.mark.asyncio
+async def test_change_callback_keeps_user_handlers():
+    """Verify the change hook fires alongside, not instead of, user callbacks."""
+    from src.feed import MarketFeed
+    import json
+
+    feed = MarketFeed()
+    feed._data_store.register_token('test_token')
+
+    books = []
+    changes = []
+    feed.on_book_update = books.append
+    feed.register_change_callback(lambda: changes.append(True))
+
+    await feed._process_message(json.dumps({
+        'event_type': 'book',
+        'asset_id': 'test_token',
+        'bids': [{'price': '0.45', 'size': '100'}],
+        'asks': [{'price': '0.55', 'size': '200'}],
+    }))
+
+    assert feed.on_book_update == books.append
+    assert len(books) == 1
+    assert changes == [True]
+
+    # No data change, no hook
+    await feed._process_message(json.dumps({'event_type': 'price_change', 'asset_id': 'test_token'}))
+    assert changes == [True]
+
+    print("✓ Change hook leaves user handlers in place")
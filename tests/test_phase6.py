@@ -76,6 +76,49 @@ class TestValidation:
 
         print("✓ Position limit works")
 
+    def test_validate_price_matches_round_to_tick(self):
+        from unittest.mock import patch
+        from src.trading import validate_price, round_to_tick
+
+        for tick in (Decimal("0.01"), Decimal("0.001")):
+            with patch("src.trading.get_tick_size", return_value=tick):
+                for i in range(1, 10000):
+                    price = Decimal(i) / 10000
+                    expected = min(max(round_to_tick(price, tick), tick), 1 - tick)
+                    assert validate_price(price, "t") == expected
+
+        print("✓ Tick grid rounding matches Decimal rounding")
+
+    def test_tick_size_cached(self):
+        from unittest.mock import MagicMock, patch
+        from src import trading
+
+        client = MagicMock()
+        client.get_tick_size.return_value = "0.001"
+
+        with patch("src.trading.DRY_RUN", False), \
+             patch("src.client.get_client", return_value=client), \
+             patch.dict(trading._tick_cache, clear=True):
+            assert trading.get_tick_size("tok") == Decimal("0.001")
+            assert trading.get_tick_size("tok") == Decimal("0.001")
+            assert client.get_tick_size.call_count == 1
+
+            assert trading.validate_price(Decimal("0.5555"), "tok") == Decimal("0.555")
+
+            trading.invalidate_tick_size("tok")
+            client.get_tick_size.return_value = "0.01"
+            assert trading.get_tick_size("tok") == Decimal("0.01")
+            assert client.get_tick_size.call_count == 2
+
+            # A failed lookup keeps serving the last tick without retrying
+            trading.invalidate_tick_size("tok")
+            client.get_tick_size.side_effect = Exception("down")
+            assert trading.get_tick_size("tok") == Decimal("0.01")
+            assert trading.get_tick_size("tok") == Decimal("0.01")
+            assert client.get_tick_size.call_count == 3
+
+        print("✓ Tick size cached per token")
+
 
 class TestPlaceOrder:
     """Test order placement."""
@@ -125,6 +168,150 @@ class TestPlaceOrder:
 
         print("✓ Small size rejected")
 
+    def test_place_order_post_timeout(self):
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from unittest.mock import MagicMock, patch
+        from src.trading import place_order, OrderError
+        from src.models import OrderSide
+
+        release = threading.Event()
+        cancelled = threading.Event()
+        client = MagicMock()
+        client.post_order.side_effect = lambda signed: release.wait() and {"orderID": "late"}
+        client.cancel.side_effect = lambda order_id: cancelled.set()
+
+        with patch("src.trading.DRY_RUN", False), \
+             patch("src.trading.ORDER_POST_TIMEOUT", 0.05), \
+             patch("src.trading.has_credentials", return_value=True), \
+             patch("src.trading.check_balance_for_order"), \
+             patch("src.client.get_auth_client", return_value=client):
+            with pytest.raises(OrderError, match="timed out"):
+                place_order("t", OrderSide.BUY, Decimal("0.50"), Decimal("10"))
+
+            # Post lands after we gave up: it gets cancelled
+            release.set()
+            assert cancelled.wait(1.0)
+            client.cancel.assert_called_once_with("late")
+
+        # Post still queued behind a busy worker: never sent at all
+        client.reset_mock()
+        busy = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=1)
+        executor.submit(busy.wait)
+
+        with patch("src.trading.DRY_RUN", False), \
+             patch("src.trading.ORDER_POST_TIMEOUT", 0.05), \
+             patch("src.trading.has_credentials", return_value=True), \
+             patch("src.trading.check_balance_for_order"), \
+             patch("src.trading._post_executor", executor), \
+             patch("src.client.get_auth_client", return_value=client):
+            with pytest.raises(OrderError, match="timed out"):
+                place_order("t", OrderSide.BUY, Decimal("0.50"), Decimal("10"))
+
+            busy.set()
+            executor.shutdown(wait=True)
+            client.post_order.assert_not_called()
+            client.cancel.assert_not_called()
+
+        print("✓ Post timeout cancels late order")
+
+    def test_place_order_reuses_unaccepted_signature(self):
+        from unittest.mock import MagicMock, patch
+        from src import trading
+        from src.models import OrderSide
+
+        client = MagicMock()
+        client.post_order.side_effect = [{"errorMsg": "busy"}, {"orderID": "ok"}, {"orderID": "ok2"}]
+
+        with patch("src.trading.DRY_RUN", False), \
+             patch("src.trading.has_credentials", return_value=True), \
+             patch("src.trading.check_balance_for_order"), \
+             patch("src.client.get_auth_client", return_value=client), \
+             patch.dict(trading._sign_cache, clear=True):
+            args = ("t", OrderSide.BUY, Decimal("0.50"), Decimal("10"))
+
+            with pytest.raises(trading.OrderError):
+                trading.place_order(*args)
+            assert trading.place_order(*args).id == "ok"
+            assert client.create_order.call_count == 1
+
+            # Accepted signature is not reused
+            assert trading.place_order(*args).id == "ok2"
+            assert client.create_order.call_count == 2
+
+        print("✓ Unaccepted signature reused on retry")
+
+    def test_place_orders_batch(self):
+        from src.config import DRY_RUN
+        from src.trading import place_orders, OrderError
+        from src.models import OrderSide
+        from src.simulator import reset_simulator, get_simulator
+
+        if not DRY_RUN:
+            pytest.skip("Requires DRY_RUN=true")
+
+        reset_simulator()
+
+        orders = place_orders([
+            ("token1", OrderSide.BUY, Decimal("0.45"), Decimal("10")),
+            ("token1", OrderSide.SELL, Decimal("0.55"), Decimal("10")),
+        ])
+
+        assert [o.side for o in orders] == [OrderSide.BUY, OrderSide.SELL]
+        assert [o.price for o in orders] == [Decimal("0.45"), Decimal("0.55")]
+
+        # One bad leg rejects the whole batch before anything is placed
+        reset_simulator()
+        with pytest.raises(OrderError):
+            place_orders([
+                ("token1", OrderSide.BUY, Decimal("0.45"), Decimal("10")),
+                ("token1", OrderSide.SELL, Decimal("1.5"), Decimal("10")),
+            ])
+        assert get_simulator().get_open_orders() == []
+
+        print("✓ Batch orders placed")
+
+    def test_place_orders_empty_batch(self):
+        from unittest.mock import patch
+        from src.trading import place_orders
+
+        with patch("src.trading.DRY_RUN", False), \
+             patch("src.trading.get_order_limiter") as limiter, \
+             patch("src.client.get_auth_client") as get_client:
+            assert place_orders([]) == []
+            limiter.assert_not_called()
+            get_client.assert_not_called()
+
+        print("✓ Empty batch sends nothing")
+
+    def test_place_orders_unexpected_response(self):
+        from unittest.mock import MagicMock, patch
+        from src.trading import place_orders, OrderError
+        from src.models import OrderSide
+
+        batch = [
+            ("t", OrderSide.BUY, Decimal("0.45"), Decimal("10")),
+            ("t", OrderSide.SELL, Decimal("0.55"), Decimal("10")),
+        ]
+        client = MagicMock()
+
+        with patch("src.trading.DRY_RUN", False), \
+             patch("src.trading.has_credentials", return_value=True), \
+             patch("src.trading.check_balance_for_order"), \
+             patch("src.client.get_auth_client", return_value=client):
+            # Fewer statuses than orders: the unmatched order may be live
+            client.post_orders.return_value = [{"orderID": "a", "success": True}]
+            with pytest.raises(OrderError, match="unexpected response"):
+                place_orders(batch)
+
+            # Error body instead of a status list
+            client.post_orders.return_value = {"error": "invalid batch"}
+            with pytest.raises(OrderError, match="unexpected response"):
+                place_orders(batch)
+
+        print("✓ Mismatched batch response rejected")
+
 
 class TestCancelOrder:
     """Test order cancellation."""
@@ -177,6 +364,73 @@ class TestCancelOrder:
 
         print("✓ Cancel all works")
 
+    def test_cancel_all_orders_live_batch_fallback(self):
+        from unittest.mock import MagicMock, patch
+        from src import trading
+        from src.trading import cancel_all_orders, cancel_order
+
+        orders = [MagicMock(id=f"o{i}") for i in range(5)]
+        client = MagicMock()
+        client.cancel_orders.return_value = {"canceled": ["o0", "o1", "o2", "o3"], "not_canceled": {"o4": "matched"}}
+
+        with patch("src.trading.DRY_RUN", False), \
+             patch("src.trading.has_credentials", return_value=True), \
+             patch("src.client.get_auth_client", return_value=client), \
+             patch("src.trading.get_open_orders", return_value=orders), \
+             patch.dict(trading._recently_cancelled, clear=True):
+            assert cancel_all_orders() == 4
+            client.cancel_orders.assert_called_once_with(["o0", "o1", "o2", "o3", "o4"])
+
+            # Already-cancelled ids are skipped
+            assert cancel_order("o1")
+            client.cancel.assert_not_called()
+
+            # Fall back to parallel single cancels when the batch call fails
+            trading._recently_cancelled.clear()
+            client.cancel_orders.side_effect = Exception("unsupported")
+            client.cancel.side_effect = lambda order_id: {"canceled": [order_id]} if order_id != "o2" else 1 / 0
+            assert cancel_all_orders() == 4
+            assert client.cancel.call_count == 5
+
+            # Only the one that failed is retried
+            client.cancel.side_effect = lambda order_id: {"canceled": [order_id]}
+            assert cancel_all_orders() == 1
+            assert client.cancel.call_count == 6
+
+        print("✓ Live cancel all batches and falls back")
+
+    def test_refused_cancel_is_retried(self):
+        from unittest.mock import MagicMock, patch
+        from src import trading
+        from src.trading import cancel_all_orders, cancel_order
+
+        order = MagicMock(id="o1")
+        client = MagicMock()
+        client.cancel.return_value = {"canceled": [], "not_canceled": {"o1": "order is being matched"}}
+        client.cancel_orders.return_value = {"canceled": ["o1"], "not_canceled": {}}
+
+        with patch("src.trading.DRY_RUN", False), \
+             patch("src.trading.has_credentials", return_value=True), \
+             patch("src.trading.get_order_limiter"), \
+             patch("src.client.get_auth_client", return_value=client), \
+             patch("src.trading.get_open_orders", return_value=[order]), \
+             patch.dict(trading._recently_cancelled, clear=True):
+            # The client reports the refusal without raising
+            assert cancel_order("o1") is False
+            assert "o1" not in trading._recently_cancelled
+
+            # The kill switch path still sends the order to the exchange
+            assert cancel_all_orders() == 1
+            client.cancel_orders.assert_called_once_with(["o1"])
+
+            # A confirmed cancel is trusted only briefly over the listing
+            assert cancel_all_orders() == 0
+            trading._recently_cancelled["o1"] -= trading.RECENTLY_CANCELLED_GRACE + 1
+            assert cancel_all_orders() == 1
+            assert client.cancel_orders.call_count == 2
+
+        print("✓ Refused cancels are retried")
+
 
 class TestIntegration:
     """Full workflow test."""
@@ -286,6 +540,37 @@ def test_position_caching():
     print("✓ Position caching works")
 
 
+def test_position_and_pnl():
+    """Verify running entry price and realized P&L."""
+    from src.simulator import get_simulator, reset_simulator
+    from src.models import OrderSide
+    from decimal import Decimal
+
+    reset_simulator()
+    sim = get_simulator()
+
+    sim.create_order("t1", OrderSide.BUY, Decimal("0.40"), Decimal("10"))
+    sim.create_order("t1", OrderSide.BUY, Decimal("0.50"), Decimal("10"))
+    sim.check_fills("t1", Decimal("0.30"), Decimal("0.40"))
+
+    pnl = sim.get_position_and_pnl("t1", Decimal("0.50"))
+    assert pnl['position'] == Decimal("20")
+    assert pnl['avg_entry_price'] == Decimal("0.45")
+    assert pnl['unrealized_pnl'] == Decimal("1.00")
+
+    # Sell through flat into a short
+    sim.create_order("t1", OrderSide.SELL, Decimal("0.55"), Decimal("30"))
+    sim.check_fills("t1", Decimal("0.55"), Decimal("0.60"))
+
+    pnl = sim.get_position_and_pnl("t1", Decimal("0.50"))
+    assert pnl['position'] == Decimal("-10")
+    assert pnl['realized_pnl'] == Decimal("2.00")
+    assert pnl['avg_entry_price'] == Decimal("0.55")
+    assert pnl['unrealized_pnl'] == Decimal("0.50")
+
+    print("✓ Position and P&L tracked")
+
+
 def test_rate_limiter():
     """Verify rate limiter throttles calls."""
     import time
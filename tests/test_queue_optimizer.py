@@ -97,6 +97,12 @@ class TestQueueMetrics:
 
         assert rate_front > rate_back
 
+    def test_negative_queue_position_ignored(self, optimizer):
+        """Degenerate queue positions are not recorded."""
+        optimizer.record_fill(queue_position=-1, filled=True)
+
+        assert optimizer.get_fill_rate(queue_position=0) == 0.5
+
     def test_optimal_position_calculation(self, optimizer):
         """Calculate optimal queue position based on history."""
         # Build up history
@@ -67,6 +67,17 @@ class TestBalanceCheck:
                     with pytest.raises(OrderError, match="exceeds 50%"):
                         check_balance_for_order(Decimal("0.60"), Decimal("10"))
 
+    def test_balance_check_counts_committed_cost(self):
+        """Cost already committed in a batch counts against the limit."""
+        with patch('src.trading.DRY_RUN', False):
+            with patch('src.trading._cached_balance', Decimal("10.00")):
+                with patch('src.trading._last_balance_check', float('inf')):
+                    # $3 alone passes; $3 + $3 committed is over 50% of $10
+                    committed = check_balance_for_order(Decimal("0.30"), Decimal("10"))
+                    assert committed == Decimal("3.00")
+                    with pytest.raises(OrderError, match="exceeds 50%"):
+                        check_balance_for_order(Decimal("0.30"), Decimal("10"), committed)
+
 
 class TestStartupCleanup:
     """Test orphaned order cleanup on startup."""
@@ -60,6 +60,121 @@ class TestVolatilityTracker:
         assert mult >= 1.0, "High volatility should not reduce multiplier"
         print(f"High vol multiplier: {mult:.2f}")
 
+    def test_rolling_window_matches_reference(self):
+        import math
+        import statistics
+        from src.strategy.volatility import VolatilityTracker
+
+        vol = VolatilityTracker(
+            token_id="test",
+            sample_interval=1.0,
+            window_seconds=20.0,
+            min_samples=3
+        )
+
+        # Drive a fake clock past the buffer capacity so the ring wraps
+        prices = [0.50 + 0.01 * ((i * 7) % 5) for i in range(50)]
+        clock = [1_000_000_000_000]
+        with patch("src.strategy.volatility.time.monotonic_ns", lambda: clock[0]):
+            for p in prices:
+                vol.update(p)
+                clock[0] += 1_000_000_000
+
+        window = prices[-21:]  # Samples within the last 20s
+        returns = [math.log(b / a) for a, b in zip(window, window[1:])]
+        expected = statistics.stdev(returns) * math.sqrt(365 * 24 * 3600)
+
+        assert vol.get_state().sample_count == 21
+        assert vol.get_realized_vol() == pytest.approx(expected)
+
+    def test_multiplier_curve(self):
+        from src.strategy.volatility import VolatilityTracker
+
+        vol = VolatilityTracker(token_id="test", mult_min=0.7, mult_max=2.0)
+        curve = vol._vol_to_multiplier
+
+        assert curve(0.0) == pytest.approx(0.7)
+        assert curve(0.10) == pytest.approx(0.85)
+        assert curve(0.15) == pytest.approx(1.0)
+        assert curve(0.225) == pytest.approx(1.25)
+        assert curve(0.40) == pytest.approx(1.75)
+        assert curve(5.0) == pytest.approx(2.0)
+
+    def test_resync_keeps_rolling_vol(self):
+        from src.strategy.volatility import VolatilityTracker
+
+        def run(resync_interval):
+            vol = VolatilityTracker(
+                token_id="test",
+                sample_interval=1.0,
+                window_seconds=20.0,
+                min_samples=3
+            )
+            vol.RESYNC_INTERVAL = resync_interval
+            clock = [1_000_000_000_000]
+            with patch("src.strategy.volatility.time.monotonic_ns", lambda: clock[0]):
+                for i in range(60):
+                    vol.update(0.40 + 0.03 * ((i * 3) % 7))
+                    clock[0] += 1_000_000_000
+            return vol.get_realized_vol()
+
+        assert run(5) == pytest.approx(run(10_000))
+
+
+    def test_multi_token_states_match_per_token(self):
+        from src.strategy.volatility import MultiTokenVolatilityTracker
+
+        tracker = MultiTokenVolatilityTracker(
+            sample_interval=1.0,
+            window_seconds=30.0,
+            min_samples=5
+        )
+
+        clock = [1_000_000_000_000]
+        with patch("src.strategy.volatility.time.monotonic_ns", lambda: clock[0]):
+            for i in range(40):
+                # 20 tokens forces the shared vol array to grow
+                for k in range(20 if i > 2 else 1):
+                    tracker.update(f"token{k}", 0.50 + 0.002 * k * ((i * 3) % 5))
+                clock[0] += 1_000_000_000
+
+        states = tracker.get_all_states()
+        assert len(states) == 20
+        for token_id, state in states.items():
+            assert state == tracker.get_state(token_id)
+
+
+    def test_update_many_matches_single_updates(self):
+        from src.strategy.volatility import MultiTokenVolatilityTracker
+
+        kwargs = dict(sample_interval=1.0, window_seconds=30.0, min_samples=5)
+        batched = MultiTokenVolatilityTracker(**kwargs)
+        single = MultiTokenVolatilityTracker(**kwargs)
+        tokens = ["a", "b", "c"]
+
+        clock = [1_000_000_000_000]
+        with patch("src.strategy.volatility.time.monotonic_ns", lambda: clock[0]):
+            for i in range(40):
+                prices = [0.50 + 0.01 * ((i * (k + 2)) % 5) for k in range(3)]
+                due = batched.update_many(tokens, prices)
+                for token_id, price in zip(tokens, prices):
+                    single.update(token_id, price)
+                assert due.all() == (i % 2 == 0)
+                clock[0] += 500_000_000  # Half the sample interval
+
+        assert batched.get_all_states() == single.get_all_states()
+
+    def test_update_many_repeated_token_sampled_once(self):
+        from src.strategy.volatility import MultiTokenVolatilityTracker
+
+        tracker = MultiTokenVolatilityTracker(sample_interval=1.0, window_seconds=30.0, min_samples=5)
+
+        due = tracker.update_many(["a", "b", "a"], [0.50, 0.40, 0.60])
+
+        assert due.tolist() == [False, True, True]
+        assert tracker._trackers["a"].get_state().sample_count == 1
+        assert tracker._trackers["a"]._ordered_prices()[-1] == 0.60
+
 
 class TestBookAnalyzer:
     """Test order book analysis."""
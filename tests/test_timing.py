@@ -67,7 +67,7 @@ class TestAdaptiveTimerModes:
         assert timer.get_mode() == TimingMode.FAST
 
         # Simulate time passing (mock)
-        with patch.object(timer, '_last_fast_trigger', time.time() - 30):
+        with patch.object(timer, '_last_fast_trigger', time.monotonic_ns() - 30 * 10**9):
             timer.record_price_change(pct_change=0.001)
             assert timer.get_mode() == TimingMode.NORMAL
 
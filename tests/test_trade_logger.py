@@ -13,7 +13,7 @@ class TestTradeLogger:
     @pytest.fixture
     def logger(self, tmp_path):
         log_file = tmp_path / "trades.jsonl"
-        return TradeLogger(log_file=str(log_file))
+        return TradeLogger(log_file=str(log_file), flush_interval=0)
 
     @pytest.fixture
     def log_file(self, tmp_path):
@@ -37,6 +37,14 @@ class TestTradeLogger:
         assert trade["price"] == "0.50"
         assert trade["fill_type"] == "maker"
 
+    def test_log_trade_accepts_string_prices(self, logger, log_file):
+        """Pre-stringified prices are written unchanged."""
+        logger.log_trade("m1", "SELL", "0.525", "12.5")
+
+        trade = json.loads(log_file.read_text().strip())
+        assert trade["price"] == "0.525"
+        assert trade["size"] == "12.5"
+
     def test_log_includes_timestamp(self, logger, log_file):
         """Logged trades include timestamp."""
         logger.log_trade("m1", "BUY", Decimal("0.50"), Decimal("10"))
@@ -92,3 +100,46 @@ class TestTradeLogger:
 
         trade = json.loads(log_file.read_text().strip())
         assert trade["custom_field"] == "custom_value"
+
+    def test_decimal_extra_fields_stringified(self, logger, log_file):
+        """Decimal values in extra fields are written as strings."""
+        logger.log_event("fill", price=Decimal("0.505"), size=Decimal("3"))
+
+        record = json.loads(log_file.read_text().strip())
+        assert record["price"] == "0.505"
+        assert record["size"] == "3"
+
+    def test_buffered_records_flushed_on_close(self, log_file):
+        """Buffered records reach disk once the logger is closed."""
+        logger = TradeLogger(log_file=str(log_file), flush_interval=3600)
+        logger.log_quote("m1", Decimal("0.49"), Decimal("0.51"), Decimal("10"), Decimal("10"))
+        logger.log_event("strategy_change", reason="test")
+        assert log_file.read_text() == ""
+        logger.close()
+
+        lines = log_file.read_text().strip().split("\n")
+        assert len(lines) == 2
+
+    def test_trades_flushed_immediately(self, log_file):
+        """A trade reaches disk at once, along with anything buffered before it."""
+        logger = TradeLogger(log_file=str(log_file), flush_interval=3600)
+        logger.log_quote("m1", Decimal("0.49"), Decimal("0.51"), Decimal("10"), Decimal("10"))
+        logger.log_trade("m1", "BUY", Decimal("0.50"), Decimal("10"))
+
+        lines = log_file.read_text().strip().split("\n")
+        assert [json.loads(line)["type"] for line in lines] == ["quote", "trade"]
+        logger.close()
+
+    def test_closed_logger_not_kept_alive(self, log_file):
+        """Closing releases the exit hook, so the logger can be collected."""
+        import gc
+        import weakref
+
+        logger = TradeLogger(log_file=str(log_file))
+        logger.log_event("startup")
+        logger.close()
+
+        ref = weakref.ref(logger)
+        del logger
+        gc.collect()
+        assert ref() is None
@@ -5,6 +5,7 @@ Run with: pytest tests/test_tui.py -v
 """
 
 import pytest
+import time
 from decimal import Decimal
 from datetime import datetime
 
@@ -76,6 +77,20 @@ class TestBotState:
 
         print("✓ Risk percentages calculated")
 
+    def test_activity_history_bounded(self):
+        """Test recent trades and errors drop the oldest entries past their cap."""
+        from src.tui.state import BotState, RECENT_ERRORS_MAXLEN
+
+        state = BotState()
+        for i in range(RECENT_ERRORS_MAXLEN + 10):
+            state.recent_errors.appendleft(f"error {i}")
+
+        assert len(state.recent_errors) == RECENT_ERRORS_MAXLEN
+        assert state.recent_errors[0] == f"error {RECENT_ERRORS_MAXLEN + 9}"
+        assert state.recent_trades.maxlen is not None
+
+        print("✓ Activity history bounded")
+
     def test_uptime_update(self):
         """Test uptime calculation."""
         from src.tui.state import BotState
@@ -90,6 +105,22 @@ class TestBotState:
         print(f"✓ Uptime updated: {state.uptime_seconds:.2f}s")
 
 
+    def test_trade_record_timestamp_str(self):
+        """Test trade records carry their display time."""
+        from src.tui.state import TradeRecord
+
+        trade = TradeRecord(
+            timestamp=datetime(2024, 1, 2, 9, 5, 7),
+            side="BUY",
+            price=Decimal("0.50"),
+            size=Decimal("10")
+        )
+
+        assert trade.timestamp_str == "09:05:07"
+
+        print("✓ Trade timestamp formatted")
+
+
 class TestOrderState:
     """Test OrderState calculations."""
 
@@ -110,6 +141,29 @@ class TestOrderState:
 
         print("✓ Order remaining calculated")
 
+    def test_state_slots(self):
+        """Test TUI snapshots carry no instance dict."""
+        from src.tui.state import (
+            BotState, MarketState, OrderState, PositionState,
+            RiskState, FeedState, SmartMMState, TradeRecord
+        )
+
+        snapshots = [
+            BotState(),
+            MarketState(token_id="t"),
+            OrderState(order_id="o", side="BUY", price=Decimal("0.5"), size=Decimal("1")),
+            PositionState(token_id="t"),
+            RiskState(),
+            FeedState(),
+            SmartMMState(),
+            TradeRecord(timestamp=datetime.now(), side="BUY", price=Decimal("0.5"), size=Decimal("1")),
+        ]
+
+        for snapshot in snapshots:
+            assert not hasattr(snapshot, "__dict__"), type(snapshot).__name__
+
+        print("✓ State snapshots use slots")
+
 
 class TestStateCollector:
     """Test StateCollector."""
@@ -141,6 +195,21 @@ class TestStateCollector:
 
         print("✓ Collector status tracked")
 
+    def test_collector_uptime(self):
+        """Test collector uptime comes from the monotonic clock."""
+        from src.tui.collector import StateCollector
+        from src.tui.state import BotStatus
+
+        collector = StateCollector()
+        assert collector.collect().uptime_seconds == 0.0
+
+        collector.set_status(BotStatus.RUNNING)
+        collector._start_monotonic -= 90
+
+        assert collector.collect().uptime_seconds >= 90
+
+        print("✓ Collector uptime tracked")
+
     def test_collector_counters(self):
         """Test collector quote counters."""
         from src.tui.collector import StateCollector
@@ -157,6 +226,126 @@ class TestStateCollector:
 
         print("✓ Collector counters work")
 
+    def test_collector_total_volume_incremental(self):
+        """Test total volume tracks new trades and simulator resets."""
+        from types import SimpleNamespace
+        from src.tui.collector import StateCollector
+
+        sim = SimpleNamespace(trades=[])
+        collector = StateCollector()
+        collector._simulator = sim
+
+        sim.trades.append(SimpleNamespace(token_id="other", size=Decimal("10"), price=Decimal("0.50")))
+        assert collector._ingest_new_trades()[0] == Decimal("5.00")
+
+        sim.trades.append(SimpleNamespace(token_id="other", size=Decimal("4"), price=Decimal("0.25")))
+        assert collector._ingest_new_trades()[0] == Decimal("6.00")
+        assert collector._trades_seen == 2
+
+        sim.trades.clear()
+        sim.trades.append(SimpleNamespace(token_id="other", size=Decimal("2"), price=Decimal("0.50")))
+        assert collector._ingest_new_trades()[0] == Decimal("1.00")
+
+        print("✓ Total volume is incremental")
+
+    def test_collector_recent_trades(self):
+        """Test recent trades keep the last few fills for the current token."""
+        from src.tui.collector import StateCollector, RECENT_TRADES_LIMIT
+        from src.simulator import OrderSimulator
+        from src.models import OrderSide
+
+        sim = OrderSimulator()
+        collector = StateCollector()
+        collector.set_simulator(sim)
+        collector.set_market_info("t1")
+
+        for i in range(RECENT_TRADES_LIMIT + 2):
+            sim.create_order("t1", OrderSide.BUY, Decimal("0.40") + Decimal(i) / 100, Decimal("10"))
+            sim.check_fills("t1", Decimal("0.30"), Decimal("0.40"))
+        sim.create_order("t2", OrderSide.BUY, Decimal("0.50"), Decimal("10"))
+        sim.check_fills("t2", Decimal("0.30"), Decimal("0.40"))
+
+        state = collector.collect()
+        assert state.total_trades == RECENT_TRADES_LIMIT + 3
+        assert len(state.recent_trades) == RECENT_TRADES_LIMIT
+        assert state.recent_trades[0].price == Decimal("0.46")  # Newest first
+
+        # Unchanged trades reuse the same list
+        assert collector.collect().recent_trades is state.recent_trades
+
+        collector.set_market_info("t2")
+        assert [t.price for t in collector.collect().recent_trades] == [Decimal("0.50")]
+
+        print("✓ Recent trades rolled")
+
+    def test_collector_market_state(self):
+        """Test market state is built from the feed quote."""
+        from src.tui.collector import StateCollector
+        from src.feed.mock import MockMarketFeed
+
+        feed = MockMarketFeed()
+        feed.set_book("token1", [(0.50, 100)], [(0.55, 100)])
+
+        collector = StateCollector()
+        collector.set_feed(feed)
+        collector.set_market_info("token1", "Test?")
+
+        market = collector._collect_market_state()
+
+        assert market.best_bid == Decimal("0.5")
+        assert market.best_ask == Decimal("0.55")
+        assert market.midpoint == Decimal("0.525")
+        assert market.spread == Decimal("0.05")
+        assert market.spread_bps == pytest.approx(952.38, rel=1e-3)
+
+        print("✓ Market state collected")
+
+    def test_collector_reuses_unchanged_sections(self):
+        """Test sections are rebuilt only when their source changes."""
+        from src.tui.collector import StateCollector
+        from src.feed.mock import MockMarketFeed
+
+        feed = MockMarketFeed()
+        feed.set_book("token1", [(0.50, 100)], [(0.55, 100)])
+
+        collector = StateCollector()
+        collector.set_feed(feed)
+        collector.set_market_info("token1", "Test?")
+
+        first = collector.collect()
+        second = collector.collect()
+        assert second is not first
+        assert second.market is first.market
+
+        # The reused market snapshot still carries this frame's time
+        assert second.market.last_update == second.snapshot_time
+
+        feed.set_book("token1", [(0.51, 100)], [(0.55, 100)])
+        third = collector.collect()
+        assert third.market is not first.market
+        assert third.market.best_bid == Decimal("0.51")
+
+        print("✓ Unchanged sections reused")
+
+    def test_collector_dirty_flag(self):
+        """Test mutations flag the collector dirty until the next collect."""
+        from src.tui.collector import StateCollector
+
+        collector = StateCollector()
+        collector.collect()
+        assert not collector.is_dirty
+
+        collector.record_quote_placed()
+        assert collector.is_dirty
+
+        collector.collect()
+        assert not collector.is_dirty
+
+        collector.mark_dirty({"event_type": "book"})  # feed callback signature
+        assert collector.is_dirty
+
+        print("✓ Dirty flag tracks changes")
+
     def test_global_collector(self):
         """Test global collector instance."""
         from src.tui.collector import get_collector, reset_collector
@@ -199,6 +388,125 @@ class TestTUIRenderer:
 
         print("✓ Progress bars generated")
 
+    def test_progress_bar_reused(self):
+        """Test identical bars are built once."""
+        from src.tui.renderer import TUIRenderer
+
+        renderer = TUIRenderer()
+
+        bar = renderer._progress_bar(42.1, width=15)
+
+        assert renderer._progress_bar(42.4, width=15) is bar
+        assert renderer._progress_bar(60, width=15) is not bar
+        assert bar.plain == "██████░░░░░░░░░ 42%"
+
+        print("✓ Progress bars cached")
+
+    def test_progress_bar_styles(self):
+        """Test bar colour for the safe, warning and danger regions."""
+        from src.tui.renderer import TUIRenderer
+
+        renderer = TUIRenderer()
+
+        def bar_style(percent):
+            return str(renderer._progress_bar(percent, width=10, danger_threshold=80).spans[0].style)
+
+        assert bar_style(55) == "green"
+        assert bar_style(56) == "yellow"
+        assert bar_style(79) == "yellow"
+        assert bar_style(80) == "red"
+        assert bar_style(150) == "red"
+
+        print("✓ Progress bar styles")
+
+    def test_render_header(self):
+        """Test header shows status, mode and uptime."""
+        from src.tui.renderer import TUIRenderer
+        from src.tui.state import BotState, BotMode, BotStatus
+
+        renderer = TUIRenderer()
+        state = BotState(mode=BotMode.LIVE, status=BotStatus.RUNNING, uptime_seconds=3725.9)
+
+        header = renderer._render_header(state).renderable
+
+        g = renderer._glyphs
+        sep = f"  {g['separator']}  "
+        assert header.plain == f"{g['status']} RUNNING{sep}LIVE{sep}{g['uptime']} 01:02:05"
+
+        print("✓ Header rendered")
+
+    def test_ascii_glyphs(self):
+        """Test titles fall back to ASCII on non-UTF-8 terminals."""
+        import io
+        from unittest.mock import patch
+        from rich.console import Console
+        from src.tui.renderer import TUIRenderer
+        from src.tui.state import BotState
+
+        ascii_out = io.TextIOWrapper(io.BytesIO(), encoding="ascii")
+        with patch("src.tui.renderer.Console", lambda: Console(file=ascii_out)):
+            renderer = TUIRenderer()
+
+        panel = renderer._render_header(BotState())
+
+        assert panel.title.plain == "[BOT] Polymarket Market Maker"
+        assert panel.renderable.plain.isascii()
+
+        print("✓ ASCII glyphs used")
+
+    def test_update_refreshes_on_change(self):
+        """Test the live display is redrawn only when a panel changed."""
+        from unittest.mock import MagicMock
+        from src.tui.renderer import TUIRenderer
+        from src.tui.state import BotState, BotStatus
+
+        renderer = TUIRenderer()
+        renderer.interactive = True
+        renderer._live = MagicMock()
+        state = BotState()
+
+        renderer.update(state)
+        assert renderer._live.update.call_count == 1
+
+        # Nothing changed
+        renderer._last_refresh = 0.0
+        renderer.update(state)
+        assert renderer._live.update.call_count == 1
+
+        # Changed, but within the refresh interval: held until allowed
+        state.status = BotStatus.RUNNING
+        renderer._last_refresh = time.monotonic()
+        renderer.update(state)
+        assert renderer._live.update.call_count == 1
+
+        renderer._last_refresh = 0.0
+        renderer.update(state)
+        assert renderer._live.update.call_count == 2
+
+        print("✓ Live display refreshed on change")
+
+    def test_non_terminal_logs_state(self):
+        """Test non-interactive output logs summaries instead of drawing."""
+        import json
+        from unittest.mock import patch
+        from src.tui.renderer import TUIRenderer
+        from src.tui.state import BotState, BotStatus
+
+        renderer = TUIRenderer()
+        renderer.interactive = False
+
+        with renderer.live_context():
+            with patch("src.tui.renderer.logger") as mock_logger:
+                renderer.update(BotState(status=BotStatus.RUNNING))
+                renderer.update(BotState(status=BotStatus.RUNNING))
+
+        assert renderer._live is None
+        assert mock_logger.info.call_count == 1  # Throttled to LOG_INTERVAL
+        summary = json.loads(mock_logger.info.call_args[0][0])
+        assert summary["status"] == "RUNNING"
+
+        print("✓ Non-terminal output logged")
+
     def test_render_empty_state(self):
         """Test rendering empty state doesn't crash."""
         from src.tui.renderer import TUIRenderer
@@ -276,6 +584,44 @@ class TestTUIRenderer:
 
         print("✓ Full state renders")
 
+    def test_render_reuses_layout(self):
+        """Test frames update the same layout skeleton."""
+        from src.tui.renderer import TUIRenderer
+        from src.tui.state import BotState, BotStatus
+
+        renderer = TUIRenderer()
+        first = renderer._render(BotState())
+        header = first["header"].renderable
+
+        second = renderer._render(BotState(status=BotStatus.RUNNING))
+
+        assert second is first
+        assert second["header"].renderable is not header
+
+        print("✓ Layout reused across frames")
+
+    def test_render_reuses_unchanged_panels(self):
+        """Test panels are rebuilt only when the fields they show change."""
+        from src.tui.renderer import TUIRenderer
+        from src.tui.state import BotState, FeedState
+
+        renderer = TUIRenderer()
+        state = BotState(feed=FeedState(status="RUNNING", last_message_ago=1.01))
+        layout = renderer._render(state)
+        feed_panel = layout["feed"].renderable
+        risk_panel = layout["risk"].renderable
+
+        state.feed = FeedState(status="RUNNING", last_message_ago=1.04)
+        renderer._render(state)
+        assert layout["feed"].renderable is feed_panel
+
+        state.feed = FeedState(status="ERROR", last_message_ago=1.04)
+        renderer._render(state)
+        assert layout["feed"].renderable is not feed_panel
+        assert layout["risk"].renderable is risk_panel
+
+        print("✓ Unchanged panels reused")
+
 
 class TestIntegration:
     """Integration tests."""
@@ -301,3 +647,112 @@ class TestIntegration:
         assert layout is not None
 
         print("✓ Full workflow works")
+
+    def test_unchanged_sections_skip_render(self):
+        """Test sections the collector reuses are not re-rendered."""
+        from src.tui.collector import StateCollector
+        from src.tui.renderer import TUIRenderer
+        from src.feed.mock import MockMarketFeed
+
+        feed = MockMarketFeed()
+        feed.set_book("token1", [(0.50, 100)], [(0.55, 100)])
+
+        collector = StateCollector()
+        collector.set_feed(feed)
+        collector.set_market_info("token1", "Test?")
+        renderer = TUIRenderer()
+
+        layout = renderer._render(collector.collect())
+        market_panel = layout["market"].renderable
+
+        renderer._render(collector.collect())
+        assert layout["market"].renderable is market_panel
+
+        feed.set_book("token1", [(0.51, 100)], [(0.55, 100)])
+        renderer._render(collector.collect())
+        assert layout["market"].renderable is not market_panel
+
+        print("✓ Unchanged sections skip render")
+
+    @pytest.mark.asyncio
+    async def test_runner_waits_for_changes(self):
+        """Test the render loop wakes on state changes and reuses its waiters."""
+        import asyncio
+        from src.tui.collector import StateCollector
+        from src.tui.runner import TUIBotRunner
+
+        runner = TUIBotRunner(token_id="test", update_interval=5.0)
+        runner.collector = StateCollector()
+        runner.collector.collect()
+
+        asyncio.get_running_loop().call_later(0.01, runner.collector.mark_dirty)
+        await asyncio.wait_for(runner._wait_for_repaint(), timeout=1.0)
+        shutdown_waiter = runner._shutdown_waiter
+
+        runner.collector.collect()
+        asyncio.get_running_loop().call_later(0.01, runner._shutdown_event.set)
+        await asyncio.wait_for(runner._wait_for_repaint(), timeout=1.0)
+
+        assert runner._shutdown_waiter is shutdown_waiter
+        assert shutdown_waiter.done()
+
+        runner._dirty_waiter.cancel()
+
+        print("✓ Runner wakes on changes")
+
+    @pytest.mark.asyncio
+    async def test_runner_shutdown_wakes_sleep(self):
+        """Test startup waits end as soon as shutdown is requested."""
+        import asyncio
+        from src.tui.runner import TUIBotRunner
+
+        runner = TUIBotRunner(token_id="test")
+
+        assert not await runner._wait_for_shutdown(0.01)
+
+        asyncio.get_running_loop().call_later(0.01, runner._shutdown_event.set)
+        assert await asyncio.wait_for(runner._wait_for_shutdown(5.0), timeout=1.0)
+
+        print("✓ Shutdown interrupts waits")
+
+    @pytest.mark.asyncio
+    async def test_runner_coalesces_bursts(self):
+        """Test a burst of updates inside the repaint delay yields one frame."""
+        import asyncio
+        from unittest.mock import patch
+        from src.tui.collector import StateCollector
+        from src.tui.runner import TUIBotRunner, REPAINT_DELAY
+
+        runner = TUIBotRunner(token_id="test", update_interval=5.0)
+        collector = runner.collector = StateCollector()
+        collector.collect()
+
+        # Fake clock: updates arrive every 1ms from t=0, and only the
+        # repaint delay's sleep moves time forward
+        clock = [0.0]
+        burst = [0.001 * i for i in range(10)]
+
+        def deliver():
+            while burst and burst[0] <= clock[0]:
+                burst.pop(0)
+                collector.mark_dirty({"event_type": "book"})
+
+        async def fake_sleep(delay):
+            clock[0] += delay
+            deliver()
+
+        deliver()
+        with patch("src.tui.runner.asyncio.sleep", fake_sleep):
+            await asyncio.wait_for(runner._wait_for_repaint(), timeout=1.0)
+
+        # Held back at least REPAINT_DELAY after the first update, by which
+        # time the whole burst is in and one collect covers it
+        assert clock[0] >= REPAINT_DELAY
+        collector.collect()
+        assert not burst
+        assert not collector.is_dirty
+
+        runner._dirty_waiter.cancel()
+        runner._shutdown_waiter.cancel()
+
+        print("✓ Bursts coalesced")